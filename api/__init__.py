@@ -0,0 +1 @@
+"""HTTP serving layer for the Lexic pipeline (``uvicorn api.main:app``)."""
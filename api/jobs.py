@@ -0,0 +1,382 @@
+"""Background pipeline jobs persisted in SQLite, with per-phase progress events."""
+
+import asyncio
+import json
+import math
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from api.workqueue import QueueFullError
+from lexic.agents.pipeline import LexicPipeline
+from lexic.agents.run import PipelineRun
+
+
+# Pipeline phases in order, with the steps each one runs
+PHASES = {
+    "intake": ["qualification", "initial_analysis"],
+    "investigation": ["investigation_order", "investigation_report", "factual_record"],
+    "legal_analysis": ["legal_basis", "legal_arguments"],
+    "final": ["considerations", "judgment", "recommendations"],
+}
+
+# Job statuses after which no more events are emitted
+TERMINAL_STATUSES = ("succeeded", "failed")
+
+
+class JobStore:
+    """
+    Thread-safe SQLite store of pipeline jobs and their progress events.
+
+    A job holds its inputs, status (``queued``, ``running``, ``succeeded`` or
+    ``failed``), outputs, trace and error; events are numbered per job so a
+    client can resume an event stream from the last one it received.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " case_id TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " inputs TEXT NOT NULL,"
+            " outputs TEXT,"
+            " trace TEXT,"
+            " error TEXT,"
+            " created_at REAL NOT NULL,"
+            " started_at REAL,"
+            " finished_at REAL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            " job_id TEXT NOT NULL,"
+            " seq INTEGER NOT NULL,"
+            " event TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " PRIMARY KEY (job_id, seq))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON jobs (status, created_at)")
+        self._conn.commit()
+
+    def create(self, case_id: str, inputs: Dict[str, str]) -> str:
+        """
+        Add a queued job.
+
+        Args:
+            case_id: Case ID recorded in outputs and trace
+            inputs: client_request, client_persona and initial_facts
+
+        Returns:
+            Job ID
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, case_id, status, inputs, created_at) VALUES (?, ?, 'queued', ?, ?)",
+                (job_id, case_id, json.dumps(inputs, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a job.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job dict with JSON columns decoded, or None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        for key in ("inputs", "outputs", "trace"):
+            job[key] = json.loads(job[key]) if job[key] is not None else None
+        return job
+
+    def update(self, job_id: str, **fields: Any):
+        """
+        Update job columns; dict values are stored as JSON.
+
+        Args:
+            job_id: Job ID
+            **fields: Column values
+        """
+        values = [
+            json.dumps(value, ensure_ascii=False) if isinstance(value, dict) else value
+            for value in fields.values()
+        ]
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._lock:
+            self._conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*values, job_id))
+            self._conn.commit()
+
+    def add_event(self, job_id: str, event: Dict[str, Any]) -> int:
+        """
+        Append a progress event to a job.
+
+        Args:
+            job_id: Job ID
+            event: JSON-serializable event with a ``type`` key
+
+        Returns:
+            Sequence number of the event (starting at 1)
+        """
+        with self._lock:
+            seq = self._conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) + 1 FROM events WHERE job_id = ?", (job_id,)
+            ).fetchone()[0]
+            self._conn.execute(
+                "INSERT INTO events (job_id, seq, event, created_at) VALUES (?, ?, ?, ?)",
+                (job_id, seq, json.dumps(event, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+        return seq
+
+    def events(self, job_id: str, after: int = 0) -> List[Dict[str, Any]]:
+        """
+        Get a job's events after a sequence number.
+
+        Args:
+            job_id: Job ID
+            after: Last sequence number already seen
+
+        Returns:
+            Events in order, each with its ``seq``
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, event FROM events WHERE job_id = ? AND seq > ? ORDER BY seq",
+                (job_id, after)
+            ).fetchall()
+        return [{"seq": row["seq"], **json.loads(row["event"])} for row in rows]
+
+    def pending(self) -> List[str]:
+        """
+        Mark interrupted (running) jobs as queued again.
+
+        Returns:
+            IDs of all queued jobs, oldest first
+        """
+        with self._lock:
+            self._conn.execute("UPDATE jobs SET status = 'queued' WHERE status = 'running'")
+            self._conn.commit()
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at"
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Get the number of jobs per status."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def mean_duration(self) -> Optional[float]:
+        """Mean wall time of succeeded jobs in seconds (None before the first one)."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT AVG(finished_at - started_at) FROM jobs WHERE status = 'succeeded'"
+            ).fetchone()[0]
+
+    def close(self):
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class JobRunner:
+    """
+    Runs queued pipeline jobs in the background.
+
+    Each job runs the four phases in order and records a ``phase`` event
+    (with the phase's step traces) as each completes, then a ``completed`` or
+    ``failed`` event. Step outputs are saved under ``output_dir/<job_id>``
+    by :class:`PipelineRun` with ``resume=True``, so a job interrupted by a
+    restart is picked up again by :meth:`start` and only recomputes the steps
+    it had not finished.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        pipeline: LexicPipeline,
+        output_dir: Path,
+        workers: int,
+        max_pending: int
+    ):
+        """
+        Initialize runner.
+
+        Args:
+            store: Job store
+            pipeline: Shared pipeline instance
+            output_dir: Base directory for per-job step outputs
+            workers: Number of jobs run concurrently
+            max_pending: Number of queued jobs beyond which submissions are refused
+        """
+        self.store = store
+        self.pipeline = pipeline
+        self.output_dir = Path(output_dir)
+        self.workers = workers
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._updated: Optional[asyncio.Condition] = None
+
+    async def start(self):
+        """Requeue interrupted and waiting jobs, then start the workers."""
+        self._queue = asyncio.Queue()
+        self._updated = asyncio.Condition()
+        pending = self.store.pending()
+        for job_id in pending:
+            self._queue.put_nowait(job_id)
+        if pending:
+            print(f"Resuming {len(pending)} pending job(s)")
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Cancel the workers; running jobs stay ``running`` and resume on next start."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, case_id: str, inputs: Dict[str, str]) -> str:
+        """
+        Persist and queue a job.
+
+        Args:
+            case_id: Case ID recorded in outputs and trace
+            inputs: client_request, client_persona and initial_facts
+
+        Returns:
+            Job ID
+
+        Raises:
+            QueueFullError: If ``max_pending`` jobs are already queued
+        """
+        queued = self._queue.qsize()
+        if queued >= self.max_pending:
+            job_time = self.store.mean_duration() or 60.0
+            raise QueueFullError(max(1, math.ceil(job_time * queued / self.workers)))
+        job_id = self.store.create(case_id, inputs)
+        self._queue.put_nowait(job_id)
+        return job_id
+
+    async def wait_for_update(self, timeout: float):
+        """Wait until any job records an event, or the timeout elapses."""
+        async with self._updated:
+            try:
+                await asyncio.wait_for(self._updated.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _emit(self, job_id: str, event: Dict[str, Any]):
+        """Record an event and wake event streams."""
+        self.store.add_event(job_id, event)
+        async with self._updated:
+            self._updated.notify_all()
+
+    async def _worker(self):
+        """Run queued jobs one at a time."""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str):
+        """Run one job through the four phases."""
+        job = self.store.get(job_id)
+        if job is None or job["status"] in TERMINAL_STATUSES:
+            return
+
+        inputs = job["inputs"]
+        run = PipelineRun(
+            case_id=job["case_id"] or job_id,
+            output_dir=self.output_dir / job_id,
+            resume=True,
+            verbose=False
+        )
+        self.store.update(job_id, status="running", started_at=time.time())
+        await self._emit(job_id, {"type": "started", "phases": list(PHASES)})
+
+        outputs: Dict[str, str] = {}
+        try:
+            for index, phase in enumerate(PHASES, 1):
+                outputs.update(await self._run_phase(phase, inputs, outputs, run))
+                await self._emit(job_id, {
+                    "type": "phase",
+                    "phase": phase,
+                    "index": index,
+                    "total": len(PHASES),
+                    "steps": {step: run.steps[step] for step in PHASES[phase] if step in run.steps},
+                })
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            self.store.update(job_id, status="failed", error=error, trace=run.trace(), finished_at=time.time())
+            await self._emit(job_id, {"type": "failed", "error": error})
+            return
+
+        self.store.update(
+            job_id, status="succeeded", outputs=outputs, trace=run.trace(), finished_at=time.time()
+        )
+        await self._emit(job_id, {"type": "completed", "totals": run.trace()["totals"]})
+
+    async def _run_phase(
+        self,
+        phase: str,
+        inputs: Dict[str, str],
+        outputs: Dict[str, str],
+        run: PipelineRun
+    ) -> Dict[str, str]:
+        """Run one phase from the job inputs and the earlier phases' outputs."""
+        if phase == "intake":
+            return await self.pipeline.arun_intake_to_analysis(inputs["client_request"], run=run)
+        if phase == "investigation":
+            return await self.pipeline.arun_investigation_phase(
+                outputs["initial_analysis"], inputs["client_persona"], inputs["initial_facts"], run=run
+            )
+        if phase == "legal_analysis":
+            return await self.pipeline.arun_legal_analysis(outputs["factual_record"], run=run)
+        return await self.pipeline.arun_final_phase(
+            outputs["legal_arguments"],
+            outputs["factual_record"],
+            outputs["qualification"],
+            use_predicted_judgment=True,
+            run=run
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get runner counters.
+
+        Returns:
+            Dict with workers, queued and the stored job count per status
+        """
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "jobs": self.store.counts(),
+        }
@@ -0,0 +1,225 @@
+"""FastAPI application serving the Lexic pipeline.
+
+Run with ``uvicorn api.main:app``. Set ``LEXIC_FAKE_LM=1`` to serve canned
+answers without an API key, e.g. for local load tests.
+"""
+
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+import dspy
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from api.jobs import TERMINAL_STATUSES, JobRunner, JobStore
+from api.schemas import (
+    FinalRequest,
+    IntakeRequest,
+    InvestigationRequest,
+    JobResponse,
+    LegalAnalysisRequest,
+    PipelineRequest,
+    RunResponse,
+)
+from api.workqueue import QueueFullError, WorkQueue
+from lexic.agents.pipeline import LexicPipeline
+from lexic.agents.resilience import get_stage_resilience
+from lexic.agents.run import PipelineRun
+from lexic.shared.concurrency import get_model_limiter
+from lexic.shared.config import Config
+from lexic.shared.lm import build_lm
+from lexic.shared.rate_limit import get_rate_limiter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure the LM and run the work queue and job runner for the app's lifetime."""
+    Config.validate()
+    dspy.configure(lm=build_lm(Config.DEFAULT_MODEL, temperature=Config.TEMPERATURE, max_tokens=32000))
+    app.state.pipeline = LexicPipeline()
+    app.state.queue = WorkQueue(workers=Config.API_WORKERS, maxsize=Config.API_QUEUE_SIZE)
+    app.state.jobs = JobRunner(
+        store=JobStore(Config.API_JOBS_DB),
+        pipeline=app.state.pipeline,
+        output_dir=Config.API_JOBS_DIR,
+        workers=Config.API_JOB_WORKERS,
+        max_pending=Config.API_MAX_PENDING_JOBS
+    )
+    await app.state.queue.start()
+    await app.state.jobs.start()
+    try:
+        yield
+    finally:
+        await app.state.jobs.stop()
+        await app.state.queue.stop()
+        app.state.jobs.store.close()
+
+
+async def run_job(
+    request: Request,
+    case_id: str,
+    job: Callable[[LexicPipeline, PipelineRun], Awaitable[Dict[str, Any]]],
+    case_complexity: Optional[int] = None
+) -> RunResponse:
+    """
+    Run a pipeline job through the work queue.
+
+    Args:
+        request: Incoming request (for app state)
+        case_id: Case ID recorded in the trace
+        job: Coroutine function taking the shared pipeline and the run state
+        case_complexity: Complexity score for model routing, for phases after intake
+
+    Returns:
+        Job outputs with the run's per-step trace
+
+    Raises:
+        HTTPException: 429 with ``Retry-After`` when the queue is full,
+            500 when the pipeline fails
+    """
+    pipeline = request.app.state.pipeline
+    run = PipelineRun(case_id=case_id, verbose=False)
+    run.case_complexity = case_complexity
+    try:
+        outputs = await request.app.state.queue.submit(lambda: job(pipeline, run))
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Pipeline failed: {type(e).__name__}: {e}")
+    return RunResponse(outputs=outputs, trace=run.trace(), case_complexity=run.case_complexity)
+
+
+def format_sse(seq: int, event: Dict[str, Any]) -> str:
+    """Format a job event as a Server-Sent Events message."""
+    return f"id: {seq}\nevent: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+async def stream_job_events(
+    runner: JobRunner,
+    job_id: str,
+    after: int = 0,
+    keepalive_s: float = 15.0
+) -> AsyncIterator[str]:
+    """
+    Stream a job's events as SSE until it succeeds or fails.
+
+    Args:
+        runner: Job runner
+        job_id: Job ID
+        after: Last event sequence number the client already received
+        keepalive_s: Seconds between keep-alive comments while idle
+
+    Yields:
+        SSE messages
+    """
+    while True:
+        events = runner.store.events(job_id, after=after)
+        for event in events:
+            after = event.pop("seq")
+            yield format_sse(after, event)
+        if not events:
+            if runner.store.get(job_id)["status"] in TERMINAL_STATUSES:
+                return
+            yield ": keep-alive\n\n"
+        await runner.wait_for_update(keepalive_s)
+
+
+def create_app() -> FastAPI:
+    """Create the Lexic API application."""
+    app = FastAPI(title="Lexic", lifespan=lifespan)
+
+    @app.get("/health")
+    async def health(request: Request) -> Dict[str, Any]:
+        """Report queue load, LM calls and rate limit delays per model, and hedging per stage."""
+        return {
+            "status": "ok",
+            "model": Config.DEFAULT_MODEL,
+            "fake_lm": Config.FAKE_LM,
+            "queue": request.app.state.queue.stats(),
+            "jobs": request.app.state.jobs.stats(),
+            "models": get_model_limiter().stats(),
+            "rate_limits": get_rate_limiter().stats(),
+            "stages": get_stage_resilience().stats(),
+        }
+
+    @app.post("/pipeline", response_model=RunResponse)
+    async def run_pipeline(body: PipelineRequest, request: Request) -> RunResponse:
+        """Run the complete pipeline, from intake to recommendations."""
+        return await run_job(request, body.case_id, lambda pipeline, run: pipeline.arun_full_pipeline(
+            body.client_request, body.client_persona, body.initial_facts, run=run
+        ))
+
+    @app.post("/phases/intake", response_model=RunResponse)
+    async def run_intake(body: IntakeRequest, request: Request) -> RunResponse:
+        """Run phase 1: qualification and initial analysis."""
+        return await run_job(request, body.case_id, lambda pipeline, run: pipeline.arun_intake_to_analysis(
+            body.client_request, run=run
+        ))
+
+    @app.post("/phases/investigation", response_model=RunResponse)
+    async def run_investigation(body: InvestigationRequest, request: Request) -> RunResponse:
+        """Run phase 2: investigation order, report and factual record."""
+        return await run_job(request, body.case_id, lambda pipeline, run: pipeline.arun_investigation_phase(
+            body.initial_analysis, body.client_persona, body.initial_facts, run=run
+        ), case_complexity=body.case_complexity)
+
+    @app.post("/phases/legal-analysis", response_model=RunResponse)
+    async def run_legal_analysis(body: LegalAnalysisRequest, request: Request) -> RunResponse:
+        """Run phase 3: legal basis and arguments."""
+        return await run_job(request, body.case_id, lambda pipeline, run: pipeline.arun_legal_analysis(
+            body.factual_record, run=run
+        ), case_complexity=body.case_complexity)
+
+    @app.post("/phases/final", response_model=RunResponse)
+    async def run_final(body: FinalRequest, request: Request) -> RunResponse:
+        """Run phase 4: considerations, judgment and recommendations."""
+        return await run_job(request, body.case_id, lambda pipeline, run: pipeline.arun_final_phase(
+            body.legal_arguments,
+            body.factual_record,
+            body.client_objectives,
+            use_predicted_judgment=body.use_predicted_judgment,
+            run=run
+        ), case_complexity=body.case_complexity)
+
+    @app.post("/jobs", response_model=JobResponse, status_code=202)
+    async def submit_job(body: PipelineRequest, request: Request) -> JobResponse:
+        """Queue a full pipeline run in the background."""
+        try:
+            job_id = request.app.state.jobs.submit(body.case_id, {
+                "client_request": body.client_request,
+                "client_persona": body.client_persona,
+                "initial_facts": body.initial_facts,
+            })
+        except QueueFullError as e:
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+        return JobResponse(**request.app.state.jobs.store.get(job_id))
+
+    @app.get("/jobs/{job_id}", response_model=JobResponse)
+    async def get_job(job_id: str, request: Request) -> JobResponse:
+        """Get a job's status, and its outputs and trace once finished."""
+        job = request.app.state.jobs.store.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+        return JobResponse(**job)
+
+    @app.get("/jobs/{job_id}/events")
+    async def job_events(
+        job_id: str,
+        request: Request,
+        last_event_id: Optional[int] = Header(default=None)
+    ) -> StreamingResponse:
+        """Stream a job's progress as Server-Sent Events, one per completed phase."""
+        runner = request.app.state.jobs
+        if runner.store.get(job_id) is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+        return StreamingResponse(
+            stream_job_events(runner, job_id, after=last_event_id or 0),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"}
+        )
+
+    return app
+
+
+app = create_app()
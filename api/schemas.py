@@ -0,0 +1,73 @@
+"""Request and response models for the Lexic API."""
+
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PipelineRequest(BaseModel):
+    """Inputs of a full pipeline run."""
+    client_request: str = Field(description="Client's initial request/message")
+    client_persona: str = Field(description="Client background and context")
+    initial_facts: str = Field(description="Initial facts from client")
+    case_id: str = Field(default="", description="Case ID recorded in the trace")
+
+
+class IntakeRequest(BaseModel):
+    """Inputs of the intake & analysis phase."""
+    client_request: str = Field(description="Client's initial request/message")
+    case_id: str = ""
+
+
+class InvestigationRequest(BaseModel):
+    """Inputs of the investigation phase."""
+    initial_analysis: str = Field(description="Initial legal analysis")
+    client_persona: str = Field(description="Client profile and context")
+    initial_facts: str = Field(description="Initial facts from intake")
+    case_complexity: Optional[int] = Field(
+        default=None, description="Complexity score (1-10) from qualification, for model routing"
+    )
+    case_id: str = ""
+
+
+class LegalAnalysisRequest(BaseModel):
+    """Inputs of the legal analysis phase."""
+    factual_record: str = Field(description="Structured factual record")
+    case_complexity: Optional[int] = Field(
+        default=None, description="Complexity score (1-10) from qualification, for model routing"
+    )
+    case_id: str = ""
+
+
+class FinalRequest(BaseModel):
+    """Inputs of the final phase."""
+    legal_arguments: str = Field(description="Legal arguments")
+    factual_record: str = Field(description="Factual record")
+    client_objectives: str = Field(description="Client objectives from qualification")
+    use_predicted_judgment: bool = True
+    case_complexity: Optional[int] = Field(
+        default=None, description="Complexity score (1-10) from qualification, for model routing"
+    )
+    case_id: str = ""
+
+
+class RunResponse(BaseModel):
+    """Outputs of a pipeline or phase run with its per-step trace."""
+    outputs: Dict[str, str]
+    trace: Dict[str, Any]
+    case_complexity: Optional[int] = Field(
+        default=None, description="Complexity score parsed from qualification, to pass to later phases"
+    )
+
+
+class JobResponse(BaseModel):
+    """State of a background pipeline job."""
+    id: str
+    case_id: str
+    status: str = Field(description="queued, running, succeeded or failed")
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    outputs: Optional[Dict[str, str]] = None
+    trace: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
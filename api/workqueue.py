@@ -0,0 +1,144 @@
+"""Bounded in-process work queue with backpressure for the Lexic API."""
+
+import asyncio
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class QueueFullError(Exception):
+    """Raised when a request is submitted to a saturated queue."""
+
+    def __init__(self, retry_after: int):
+        """
+        Initialize error.
+
+        Args:
+            retry_after: Suggested seconds to wait before retrying
+        """
+        super().__init__(f"Work queue is full, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class WorkQueue:
+    """
+    Fixed pool of async workers fed by a bounded queue.
+
+    At most ``workers`` jobs run at once and at most ``maxsize`` wait;
+    :meth:`submit` fails fast with :class:`QueueFullError` beyond that instead
+    of letting requests pile up in memory. The suggested retry delay is the
+    time the current backlog needs to drain at the observed service time (an
+    exponentially weighted moving average of job durations).
+    """
+
+    def __init__(self, workers: int, maxsize: int, initial_service_time_s: float = 30.0):
+        """
+        Initialize queue.
+
+        Args:
+            workers: Number of jobs processed concurrently
+            maxsize: Number of jobs allowed to wait for a worker
+            initial_service_time_s: Service time assumed before any job completes
+        """
+        self.workers = workers
+        self.maxsize = maxsize
+        self.service_time_s = initial_service_time_s
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.running = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """Start the worker tasks on the running event loop."""
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Cancel the workers; jobs still waiting are cancelled too."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    def retry_after(self) -> int:
+        """Seconds until the current backlog is expected to drain (at least 1)."""
+        backlog = self._queue.qsize() + self.running if self._queue is not None else 0
+        return max(1, math.ceil(self.service_time_s * backlog / self.workers))
+
+    async def submit(self, job: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Queue a job and wait for its result.
+
+        Args:
+            job: Zero-argument coroutine function
+
+        Returns:
+            The job's result
+
+        Raises:
+            QueueFullError: If ``maxsize`` jobs are already waiting
+        """
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((job, future))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise QueueFullError(self.retry_after()) from None
+        return await future
+
+    async def _worker(self):
+        """Run queued jobs one at a time."""
+        while True:
+            job, future = await self._queue.get()
+            if future.cancelled():
+                # The client went away while the job was waiting
+                self._queue.task_done()
+                continue
+
+            self.running += 1
+            started = time.perf_counter()
+            try:
+                result = await job()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                self.failed += 1
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                self.completed += 1
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self.running -= 1
+                self._queue.task_done()
+            self._observe(time.perf_counter() - started)
+
+    def _observe(self, duration: float, alpha: float = 0.2):
+        """Update the service time average with a finished job's duration."""
+        self.service_time_s = alpha * duration + (1 - alpha) * self.service_time_s
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue counters.
+
+        Returns:
+            Dict with workers, maxsize, queued, running, completed, failed,
+            rejected and service_time_s
+        """
+        return {
+            "workers": self.workers,
+            "maxsize": self.maxsize,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "service_time_s": round(self.service_time_s, 3),
+        }
@@ -1,27 +1,41 @@
-"""Production agents for Lexic legal AI pipeline."""
-
-from lexic.agents.qualification import QualificationAgent
-from lexic.agents.initial_analysis import InitialAnalysisAgent
-from lexic.agents.investigation_order import InvestigationOrderAgent
-from lexic.agents.investigation_report import InvestigationReportAgent
-from lexic.agents.factual_record import FactualRecordAgent
-from lexic.agents.legal_basis import LegalBasisAgent
-from lexic.agents.arguments import ArgumentationAgent
-from lexic.agents.considerations import ConsiderationAgent
-from lexic.agents.judgment import JudgmentAgent
-from lexic.agents.recommendations import RecommendationAgent
-from lexic.agents.pipeline import LexicPipeline
-
-__all__ = [
-    "QualificationAgent",
-    "InitialAnalysisAgent",
-    "InvestigationOrderAgent",
-    "InvestigationReportAgent",
-    "FactualRecordAgent",
-    "LegalBasisAgent",
-    "ArgumentationAgent",
-    "ConsiderationAgent",
-    "JudgmentAgent",
-    "RecommendationAgent",
-    "LexicPipeline",
-]
+"""Production agents for Lexic legal AI pipeline.
+
+Exports are imported on first access (PEP 562), so importing this package,
+or a light submodule such as ``lexic.agents.registry``, does not load dspy
+and all ten agents.
+"""
+
+import importlib
+
+# Map exported names to the modules that define them
+_EXPORTS = {
+    "QualificationAgent": "lexic.agents.qualification",
+    "InitialAnalysisAgent": "lexic.agents.initial_analysis",
+    "InvestigationOrderAgent": "lexic.agents.investigation_order",
+    "InvestigationReportAgent": "lexic.agents.investigation_report",
+    "FactualRecordAgent": "lexic.agents.factual_record",
+    "LegalBasisAgent": "lexic.agents.legal_basis",
+    "ArgumentationAgent": "lexic.agents.arguments",
+    "ConsiderationAgent": "lexic.agents.considerations",
+    "JudgmentAgent": "lexic.agents.judgment",
+    "RecommendationAgent": "lexic.agents.recommendations",
+    "LexicPipeline": "lexic.agents.pipeline",
+    "AgentRegistry": "lexic.agents.registry",
+    "get_agent": "lexic.agents.registry",
+    "get_registry": "lexic.agents.registry",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
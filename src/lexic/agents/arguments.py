@@ -1,10 +1,7 @@
 """Argumentation agent - develops legal arguments."""
 
 import dspy
-from lexic.shared.prompts import create_signature
-
-# Create signature from YAML
-DevelopArguments = create_signature("agents", "arguments")
+from lexic.shared.prompts import get_signature
 
 
 class ArgumentationAgent(dspy.Module):
@@ -12,7 +9,7 @@ class ArgumentationAgent(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.develop = dspy.ChainOfThought(DevelopArguments)
+        self.develop = dspy.ChainOfThought(get_signature("agents", "arguments"))
 
     def forward(self, factual_record: str, legal_basis: str) -> str:
         """
@@ -30,3 +27,11 @@ class ArgumentationAgent(dspy.Module):
             legal_basis=legal_basis
         )
         return result.arguments
+
+    async def aforward(self, factual_record: str, legal_basis: str) -> str:
+        """Asynchronous variant of :meth:`forward`."""
+        result = await self.develop.acall(
+            factual_record=factual_record,
+            legal_basis=legal_basis
+        )
+        return result.arguments
@@ -1,10 +1,7 @@
 """Consideration agent - analyzes legal considerations."""
 
 import dspy
-from lexic.shared.prompts import create_signature
-
-# Create signature from YAML
-AnalyzeConsiderations = create_signature("agents", "considerations")
+from lexic.shared.prompts import get_signature
 
 
 class ConsiderationAgent(dspy.Module):
@@ -12,7 +9,7 @@ class ConsiderationAgent(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.analyze = dspy.ChainOfThought(AnalyzeConsiderations)
+        self.analyze = dspy.ChainOfThought(get_signature("agents", "considerations"))
 
     def forward(self, arguments: str, factual_record: str) -> str:
         """
@@ -30,3 +27,11 @@ class ConsiderationAgent(dspy.Module):
             factual_record=factual_record
         )
         return result.considerations
+
+    async def aforward(self, arguments: str, factual_record: str) -> str:
+        """Asynchronous variant of :meth:`forward`."""
+        result = await self.analyze.acall(
+            arguments=arguments,
+            factual_record=factual_record
+        )
+        return result.considerations
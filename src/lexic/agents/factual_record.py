@@ -1,10 +1,7 @@
 """Factual record agent - creates structured factual records."""
 
 import dspy
-from lexic.shared.prompts import create_signature
-
-# Create signature from YAML
-CreateFactualRecord = create_signature("agents", "factual_record")
+from lexic.shared.prompts import get_signature
 
 
 class FactualRecordAgent(dspy.Module):
@@ -12,7 +9,7 @@ class FactualRecordAgent(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.create_record = dspy.ChainOfThought(CreateFactualRecord)
+        self.create_record = dspy.ChainOfThought(get_signature("agents", "factual_record"))
 
     def forward(self, initial_facts: str, investigation_report: str = "") -> str:
         """
@@ -30,3 +27,11 @@ class FactualRecordAgent(dspy.Module):
             investigation_report=investigation_report
         )
         return result.factual_record
+
+    async def aforward(self, initial_facts: str, investigation_report: str = "") -> str:
+        """Asynchronous variant of :meth:`forward`."""
+        result = await self.create_record.acall(
+            initial_facts=initial_facts,
+            investigation_report=investigation_report
+        )
+        return result.factual_record
@@ -1,10 +1,7 @@
 """Initial analysis agent - produces initial legal analysis from qualification."""
 
 import dspy
-from lexic.shared.prompts import create_signature
-
-# Create signature from YAML
-PerformInitialAnalysis = create_signature("agents", "initial_analysis")
+from lexic.shared.prompts import get_signature
 
 
 class InitialAnalysisAgent(dspy.Module):
@@ -12,7 +9,7 @@ class InitialAnalysisAgent(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.analyze = dspy.ChainOfThought(PerformInitialAnalysis)
+        self.analyze = dspy.ChainOfThought(get_signature("agents", "initial_analysis"))
 
     def forward(self, qualification: str) -> str:
         """
@@ -26,3 +23,8 @@ class InitialAnalysisAgent(dspy.Module):
         """
         result = self.analyze(qualification=qualification)
         return result.initial_analysis
+
+    async def aforward(self, qualification: str) -> str:
+        """Asynchronous variant of :meth:`forward`."""
+        result = await self.analyze.acall(qualification=qualification)
+        return result.initial_analysis
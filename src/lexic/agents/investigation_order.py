@@ -1,10 +1,7 @@
 """Investigation order agent - creates orders for client to gather information."""
 
 import dspy
-from lexic.shared.prompts import create_signature
-
-# Create signature from YAML
-CreateInvestigationOrder = create_signature("agents", "investigation_order")
+from lexic.shared.prompts import get_signature
 
 
 class InvestigationOrderAgent(dspy.Module):
@@ -12,7 +9,7 @@ class InvestigationOrderAgent(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.create_order = dspy.ChainOfThought(CreateInvestigationOrder)
+        self.create_order = dspy.ChainOfThought(get_signature("agents", "investigation_order"))
 
     def forward(self, initial_analysis: str) -> str:
         """
@@ -26,3 +23,8 @@ class InvestigationOrderAgent(dspy.Module):
         """
         result = self.create_order(initial_analysis=initial_analysis)
         return result.investigation_order
+
+    async def aforward(self, initial_analysis: str) -> str:
+        """Asynchronous variant of :meth:`forward`."""
+        result = await self.create_order.acall(initial_analysis=initial_analysis)
+        return result.investigation_order
@@ -1,10 +1,7 @@
 """Investigation report agent - simulates client responses to investigation questions."""
 
 import dspy
-from lexic.shared.prompts import create_signature
-
-# Create signature from YAML
-GenerateInvestigationReport = create_signature("agents", "investigation_report")
+from lexic.shared.prompts import get_signature
 
 
 class InvestigationReportAgent(dspy.Module):
@@ -12,7 +9,7 @@ class InvestigationReportAgent(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.generate_report = dspy.ChainOfThought(GenerateInvestigationReport)
+        self.generate_report = dspy.ChainOfThought(get_signature("agents", "investigation_report"))
 
     def forward(
         self,
@@ -37,3 +34,17 @@ class InvestigationReportAgent(dspy.Module):
             initial_facts=initial_facts
         )
         return result.investigation_report
+
+    async def aforward(
+        self,
+        investigation_order: str,
+        client_persona: str,
+        initial_facts: str
+    ) -> str:
+        """Asynchronous variant of :meth:`forward`."""
+        result = await self.generate_report.acall(
+            investigation_order=investigation_order,
+            client_persona=client_persona,
+            initial_facts=initial_facts
+        )
+        return result.investigation_report
@@ -1,10 +1,7 @@
 """Judgment agent - predicts likely court outcome based on legal considerations."""
 
 import dspy
-from lexic.shared.prompts import create_signature
-
-# Create signature from YAML
-PredictJudgment = create_signature("agents", "judgment")
+from lexic.shared.prompts import get_signature
 
 
 class JudgmentAgent(dspy.Module):
@@ -12,7 +9,7 @@ class JudgmentAgent(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.predict = dspy.ChainOfThought(PredictJudgment)
+        self.predict = dspy.ChainOfThought(get_signature("agents", "judgment"))
 
     def forward(self, considerations: str, factual_record: str) -> str:
         """
@@ -30,3 +27,11 @@ class JudgmentAgent(dspy.Module):
             factual_record=factual_record
         )
         return result.judgment
+
+    async def aforward(self, considerations: str, factual_record: str) -> str:
+        """Asynchronous variant of :meth:`forward`."""
+        result = await self.predict.acall(
+            considerations=considerations,
+            factual_record=factual_record
+        )
+        return result.judgment
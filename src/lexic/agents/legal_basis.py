@@ -1,10 +1,7 @@
 """Legal basis agent - identifies applicable legal provisions."""
 
 import dspy
-from lexic.shared.prompts import create_signature
-
-# Create signature from YAML
-IdentifyLegalBasis = create_signature("agents", "legal_basis")
+from lexic.shared.prompts import get_signature
 
 
 class LegalBasisAgent(dspy.Module):
@@ -12,7 +9,7 @@ class LegalBasisAgent(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.identify = dspy.ChainOfThought(IdentifyLegalBasis)
+        self.identify = dspy.ChainOfThought(get_signature("agents", "legal_basis"))
 
     def forward(self, factual_record: str) -> str:
         """
@@ -26,3 +23,8 @@ class LegalBasisAgent(dspy.Module):
         """
         result = self.identify(factual_record=factual_record)
         return result.legal_basis
+
+    async def aforward(self, factual_record: str) -> str:
+        """Asynchronous variant of :meth:`forward`."""
+        result = await self.identify.acall(factual_record=factual_record)
+        return result.legal_basis
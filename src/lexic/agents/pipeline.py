@@ -1,8 +1,12 @@
 """Full orchestrated pipeline for Lexic legal AI system."""
 
-from typing import Dict
+import asyncio
+from contextlib import ExitStack, aclosing, nullcontext, suppress
+from typing import Any, AsyncIterator, ContextManager, Dict, Iterator, Optional, Tuple
 from pathlib import Path
 
+import dspy
+
 from lexic.agents.qualification import QualificationAgent
 from lexic.agents.initial_analysis import InitialAnalysisAgent
 from lexic.agents.investigation_order import InvestigationOrderAgent
@@ -13,6 +17,12 @@ from lexic.agents.arguments import ArgumentationAgent
 from lexic.agents.considerations import ConsiderationAgent
 from lexic.agents.judgment import JudgmentAgent
 from lexic.agents.recommendations import RecommendationAgent
+from lexic.agents.prefix_cache import PrefixCacheAdapter
+from lexic.agents.registry import AgentRegistry, get_registry
+from lexic.agents.resilience import get_stage_resilience
+from lexic.agents.routing import ModelRouter, get_model_router, parse_case_complexity
+from lexic.agents.run import PipelineRun, step_input_hash
+from lexic.agents.streaming import AgentStream
 
 
 class LexicPipeline:
@@ -20,41 +30,165 @@ class LexicPipeline:
     Full legal AI pipeline orchestrating all agents.
 
     This implements the complete workflow from client intake to recommendations.
+
+    Every ``run_*`` phase has an ``arun_*`` coroutine counterpart built on the
+    agents' async DSPy calls, so a single event loop can keep many cases in
+    flight while each case waits on the LM. The instance holds no per-case
+    state and can be shared across concurrent cases; per-case state (step
+    persistence, checkpoints) lives in the optional ``run`` argument.
+
+    ``astream_full_pipeline`` / ``stream_full_pipeline`` run the same stages
+    while yielding ``(stage, chunk)`` events as output tokens arrive.
+
+    With ``prefix_cache=True`` every stage is formatted by
+    :class:`PrefixCacheAdapter`, which sends the factual record, legal basis
+    and arguments as a stable, cacheable prompt prefix shared by the legal
+    analysis and final stages; prefix reuse is reported in the run's usage.
+
+    Agent calls get per-stage deadlines and optional hedging from
+    :func:`~lexic.agents.resilience.get_stage_resilience`; transient LM
+    errors are retried by LexicLM.
+
+    Each stage runs on the model chosen by the :class:`ModelRouter`, from the
+    stage and, once qualification has run, the case's complexity score
+    (kept on the run). The model is recorded in each output's frontmatter
+    and in the trace.
     """
 
-    def __init__(self):
-        """Initialize all agents."""
-        self.qualification_agent = QualificationAgent()
-        self.initial_analysis_agent = InitialAnalysisAgent()
-        self.investigation_order_agent = InvestigationOrderAgent()
-        self.investigation_report_agent = InvestigationReportAgent()
-        self.factual_record_agent = FactualRecordAgent()
-        self.legal_basis_agent = LegalBasisAgent()
-        self.argumentation_agent = ArgumentationAgent()
-        self.consideration_agent = ConsiderationAgent()
-        self.judgment_agent = JudgmentAgent()
-        self.recommendation_agent = RecommendationAgent()
+    def __init__(
+        self,
+        registry: Optional[AgentRegistry] = None,
+        prefix_cache: bool = False,
+        router: Optional[ModelRouter] = None
+    ):
+        """
+        Initialize all agents.
+
+        Args:
+            registry: Registry to take the agents from (default: the
+                process-wide registry, so pipelines share built agents)
+            prefix_cache: Whether to lay prompts out for provider-side
+                prefix caching (default: False)
+            router: Per-stage model routing (default: the process-wide router)
+        """
+        self.prefix_cache = prefix_cache
+        self.adapter = PrefixCacheAdapter() if prefix_cache else None
+        self.router = router or get_model_router()
+        registry = registry or get_registry()
+        self.qualification_agent: QualificationAgent = registry.get("qualification")
+        self.initial_analysis_agent: InitialAnalysisAgent = registry.get("initial_analysis")
+        self.investigation_order_agent: InvestigationOrderAgent = registry.get("investigation_order")
+        self.investigation_report_agent: InvestigationReportAgent = registry.get("investigation_report")
+        self.factual_record_agent: FactualRecordAgent = registry.get("factual_record")
+        self.legal_basis_agent: LegalBasisAgent = registry.get("legal_basis")
+        self.argumentation_agent: ArgumentationAgent = registry.get("legal_arguments")
+        self.consideration_agent: ConsiderationAgent = registry.get("considerations")
+        self.judgment_agent: JudgmentAgent = registry.get("judgment")
+        self.recommendation_agent: RecommendationAgent = registry.get("recommendations")
+
+    def _adapter_context(self) -> ContextManager:
+        """Context in which agents use this pipeline's prompt layout."""
+        if self.adapter is None:
+            return nullcontext()
+        return dspy.context(adapter=self.adapter)
+
+    def _step_context(self, step_name: str, run: Optional[PipelineRun]) -> ExitStack:
+        """Context in which a step uses this pipeline's prompt layout and its routed model."""
+        stack = ExitStack()
+        stack.enter_context(self._adapter_context())
+        complexity = run.case_complexity if run is not None else None
+        stack.enter_context(self.router.context(step_name, complexity))
+        return stack
+
+    @staticmethod
+    def _observe_output(step_name: str, run: Optional[PipelineRun], output: str):
+        """Keep the case complexity from the qualification report for routing later stages."""
+        if step_name == "qualification" and run is not None:
+            run.case_complexity = parse_case_complexity(output)
+
+    def _run_step(
+        self,
+        step_name: str,
+        agent: dspy.Module,
+        run: Optional[PipelineRun],
+        **inputs: str
+    ) -> str:
+        """
+        Run one agent, going through the run's checkpoint if provided.
+
+        The agent call gets the stage's deadline and, if enabled, hedging
+        (see :mod:`lexic.agents.resilience`), and runs on the stage's routed
+        model (see :mod:`lexic.agents.routing`).
+
+        Args:
+            step_name: Name of the pipeline step
+            agent: Agent module for the step
+            run: Per-case run state (default: none)
+            **inputs: Agent inputs
+
+        Returns:
+            Step output
+        """
+        resilience = get_stage_resilience()
+        with self._step_context(step_name, run):
+            if run is None:
+                return resilience.call(step_name, lambda: agent(**inputs)).strip()
+
+            input_hash = step_input_hash(step_name, agent, inputs)
+            output = run.load_step(step_name, input_hash)
+            if output is None:
+                with run.trace_step(step_name):
+                    output = resilience.call(step_name, lambda: agent(**inputs)).strip()
+                run.save_step(step_name, input_hash, output)
+        self._observe_output(step_name, run, output)
+        return output
+
+    async def _arun_step(
+        self,
+        step_name: str,
+        agent: dspy.Module,
+        run: Optional[PipelineRun],
+        **inputs: str
+    ) -> str:
+        """Asynchronous variant of :meth:`_run_step`."""
+        resilience = get_stage_resilience()
+        with self._step_context(step_name, run):
+            if run is None:
+                return (await resilience.acall(step_name, lambda: agent.acall(**inputs))).strip()
+
+            input_hash = step_input_hash(step_name, agent, inputs)
+            output = run.load_step(step_name, input_hash)
+            if output is None:
+                with run.trace_step(step_name):
+                    output = (await resilience.acall(step_name, lambda: agent.acall(**inputs))).strip()
+                run.save_step(step_name, input_hash, output)
+        self._observe_output(step_name, run, output)
+        return output
 
     def run_intake_to_analysis(
         self,
-        client_request: str
+        client_request: str,
+        run: Optional[PipelineRun] = None
     ) -> Dict[str, str]:
         """
         Run first phase: intake to initial analysis.
 
         Args:
             client_request: Client's initial request/message
+            run: Per-case run state for persistence and resume (default: none)
 
         Returns:
             Dict with qualification and initial_analysis
         """
         # Step 1: Qualification
-        qualification = self.qualification_agent(
+        qualification = self._run_step(
+            "qualification", self.qualification_agent, run,
             client_request=client_request
         )
 
         # Step 2: Initial analysis
-        initial_analysis = self.initial_analysis_agent(
+        initial_analysis = self._run_step(
+            "initial_analysis", self.initial_analysis_agent, run,
             qualification=qualification
         )
 
@@ -67,7 +201,8 @@ class LexicPipeline:
         self,
         initial_analysis: str,
         client_persona: str,
-        initial_facts: str
+        initial_facts: str,
+        run: Optional[PipelineRun] = None
     ) -> Dict[str, str]:
         """
         Run investigation phase.
@@ -76,24 +211,28 @@ class LexicPipeline:
             initial_analysis: Initial legal analysis
             client_persona: Client profile and context
             initial_facts: Initial facts from intake
+            run: Per-case run state for persistence and resume (default: none)
 
         Returns:
             Dict with investigation_order, investigation_report, and factual_record
         """
         # Step 3: Investigation order
-        investigation_order = self.investigation_order_agent(
+        investigation_order = self._run_step(
+            "investigation_order", self.investigation_order_agent, run,
             initial_analysis=initial_analysis
         )
 
         # Step 4: Investigation report (simulated client responses)
-        investigation_report = self.investigation_report_agent(
+        investigation_report = self._run_step(
+            "investigation_report", self.investigation_report_agent, run,
             investigation_order=investigation_order,
             client_persona=client_persona,
             initial_facts=initial_facts
         )
 
         # Step 5: Factual record (after investigation)
-        factual_record = self.factual_record_agent(
+        factual_record = self._run_step(
+            "factual_record", self.factual_record_agent, run,
             initial_facts=initial_facts,
             investigation_report=investigation_report
         )
@@ -106,24 +245,28 @@ class LexicPipeline:
 
     def run_legal_analysis(
         self,
-        factual_record: str
+        factual_record: str,
+        run: Optional[PipelineRun] = None
     ) -> Dict[str, str]:
         """
         Run legal analysis phase.
 
         Args:
             factual_record: Structured factual record
+            run: Per-case run state for persistence and resume (default: none)
 
         Returns:
             Dict with legal_basis and legal_arguments
         """
         # Step 5: Identify legal basis
-        legal_basis = self.legal_basis_agent(
+        legal_basis = self._run_step(
+            "legal_basis", self.legal_basis_agent, run,
             factual_record=factual_record
         )
 
         # Step 6: Develop legal arguments
-        legal_arguments = self.argumentation_agent(
+        legal_arguments = self._run_step(
+            "legal_arguments", self.argumentation_agent, run,
             factual_record=factual_record,
             legal_basis=legal_basis
         )
@@ -138,7 +281,8 @@ class LexicPipeline:
         legal_arguments: str,
         factual_record: str,
         client_objectives: str,
-        use_predicted_judgment: bool = True
+        use_predicted_judgment: bool = True,
+        run: Optional[PipelineRun] = None
     ) -> Dict[str, str]:
         """
         Run final phase: considerations, judgment prediction, and recommendations.
@@ -148,12 +292,14 @@ class LexicPipeline:
             factual_record: Factual record
             client_objectives: Client objectives from qualification
             use_predicted_judgment: Whether to predict judgment (default: True)
+            run: Per-case run state for persistence and resume (default: none)
 
         Returns:
             Dict with considerations, judgment, and recommendations
         """
         # Step 7: Legal considerations
-        considerations = self.consideration_agent(
+        considerations = self._run_step(
+            "considerations", self.consideration_agent, run,
             arguments=legal_arguments,
             factual_record=factual_record
         )
@@ -161,13 +307,15 @@ class LexicPipeline:
         # Step 8: Predict judgment
         judgment = None
         if use_predicted_judgment:
-            judgment = self.judgment_agent(
+            judgment = self._run_step(
+                "judgment", self.judgment_agent, run,
                 considerations=considerations,
                 factual_record=factual_record
             )
 
         # Step 9: Recommendations
-        recommendations = self.recommendation_agent(
+        recommendations = self._run_step(
+            "recommendations", self.recommendation_agent, run,
             considerations=considerations,
             judgment=judgment if judgment else considerations,
             client_objectives=client_objectives
@@ -188,7 +336,8 @@ class LexicPipeline:
         client_request: str,
         client_persona: str,
         initial_facts: str,
-        verbose: bool = False
+        verbose: bool = False,
+        run: Optional[PipelineRun] = None
     ) -> Dict[str, str]:
         """
         Run the complete pipeline from intake to recommendations.
@@ -198,6 +347,7 @@ class LexicPipeline:
             client_persona: Client background and context
             initial_facts: Initial facts from client
             verbose: Whether to print progress messages (default: False)
+            run: Per-case run state for persistence and resume (default: none)
 
         Returns:
             Dict with all pipeline outputs including predicted judgment
@@ -205,7 +355,7 @@ class LexicPipeline:
         # Phase 1: Intake to analysis
         if verbose:
             print("  [1/4] Running intake & analysis phase...")
-        phase1 = self.run_intake_to_analysis(client_request)
+        phase1 = self.run_intake_to_analysis(client_request, run=run)
         if verbose:
             print("    ✓ Qualification complete")
             print("    ✓ Initial analysis complete")
@@ -216,7 +366,8 @@ class LexicPipeline:
         phase2 = self.run_investigation_phase(
             phase1["initial_analysis"],
             client_persona,
-            initial_facts
+            initial_facts,
+            run=run
         )
         if verbose:
             print("    ✓ Investigation order complete")
@@ -226,7 +377,7 @@ class LexicPipeline:
         # Phase 3: Legal analysis
         if verbose:
             print("  [3/4] Running legal analysis phase...")
-        phase3 = self.run_legal_analysis(phase2["factual_record"])
+        phase3 = self.run_legal_analysis(phase2["factual_record"], run=run)
         if verbose:
             print("    ✓ Legal basis complete")
             print("    ✓ Legal arguments complete")
@@ -238,7 +389,8 @@ class LexicPipeline:
             phase3["legal_arguments"],
             phase2["factual_record"],
             phase1["qualification"],
-            use_predicted_judgment=True
+            use_predicted_judgment=True,
+            run=run
         )
         if verbose:
             print("    ✓ Considerations complete")
@@ -252,3 +404,398 @@ class LexicPipeline:
             **phase3,
             **phase4
         }
+
+    async def arun_intake_to_analysis(
+        self,
+        client_request: str,
+        run: Optional[PipelineRun] = None
+    ) -> Dict[str, str]:
+        """
+        Run first phase asynchronously: intake to initial analysis.
+
+        Args:
+            client_request: Client's initial request/message
+            run: Per-case run state for persistence and resume (default: none)
+
+        Returns:
+            Dict with qualification and initial_analysis
+        """
+        qualification = await self._arun_step(
+            "qualification", self.qualification_agent, run,
+            client_request=client_request
+        )
+
+        initial_analysis = await self._arun_step(
+            "initial_analysis", self.initial_analysis_agent, run,
+            qualification=qualification
+        )
+
+        return {
+            "qualification": qualification,
+            "initial_analysis": initial_analysis
+        }
+
+    async def arun_investigation_phase(
+        self,
+        initial_analysis: str,
+        client_persona: str,
+        initial_facts: str,
+        run: Optional[PipelineRun] = None
+    ) -> Dict[str, str]:
+        """
+        Run investigation phase asynchronously.
+
+        Args:
+            initial_analysis: Initial legal analysis
+            client_persona: Client profile and context
+            initial_facts: Initial facts from intake
+            run: Per-case run state for persistence and resume (default: none)
+
+        Returns:
+            Dict with investigation_order, investigation_report, and factual_record
+        """
+        investigation_order = await self._arun_step(
+            "investigation_order", self.investigation_order_agent, run,
+            initial_analysis=initial_analysis
+        )
+
+        investigation_report = await self._arun_step(
+            "investigation_report", self.investigation_report_agent, run,
+            investigation_order=investigation_order,
+            client_persona=client_persona,
+            initial_facts=initial_facts
+        )
+
+        factual_record = await self._arun_step(
+            "factual_record", self.factual_record_agent, run,
+            initial_facts=initial_facts,
+            investigation_report=investigation_report
+        )
+
+        return {
+            "investigation_order": investigation_order,
+            "investigation_report": investigation_report,
+            "factual_record": factual_record
+        }
+
+    async def arun_legal_analysis(
+        self,
+        factual_record: str,
+        run: Optional[PipelineRun] = None
+    ) -> Dict[str, str]:
+        """
+        Run legal analysis phase asynchronously.
+
+        Args:
+            factual_record: Structured factual record
+            run: Per-case run state for persistence and resume (default: none)
+
+        Returns:
+            Dict with legal_basis and legal_arguments
+        """
+        legal_basis = await self._arun_step(
+            "legal_basis", self.legal_basis_agent, run,
+            factual_record=factual_record
+        )
+
+        legal_arguments = await self._arun_step(
+            "legal_arguments", self.argumentation_agent, run,
+            factual_record=factual_record,
+            legal_basis=legal_basis
+        )
+
+        return {
+            "legal_basis": legal_basis,
+            "legal_arguments": legal_arguments
+        }
+
+    async def arun_final_phase(
+        self,
+        legal_arguments: str,
+        factual_record: str,
+        client_objectives: str,
+        use_predicted_judgment: bool = True,
+        run: Optional[PipelineRun] = None
+    ) -> Dict[str, str]:
+        """
+        Run final phase asynchronously.
+
+        Args:
+            legal_arguments: Legal arguments
+            factual_record: Factual record
+            client_objectives: Client objectives from qualification
+            use_predicted_judgment: Whether to predict judgment (default: True)
+            run: Per-case run state for persistence and resume (default: none)
+
+        Returns:
+            Dict with considerations, judgment, and recommendations
+        """
+        considerations = await self._arun_step(
+            "considerations", self.consideration_agent, run,
+            arguments=legal_arguments,
+            factual_record=factual_record
+        )
+
+        judgment = None
+        if use_predicted_judgment:
+            judgment = await self._arun_step(
+                "judgment", self.judgment_agent, run,
+                considerations=considerations,
+                factual_record=factual_record
+            )
+
+        recommendations = await self._arun_step(
+            "recommendations", self.recommendation_agent, run,
+            considerations=considerations,
+            judgment=judgment if judgment else considerations,
+            client_objectives=client_objectives
+        )
+
+        result = {
+            "considerations": considerations,
+            "recommendations": recommendations
+        }
+
+        if judgment:
+            result["judgment"] = judgment
+
+        return result
+
+    async def arun_full_pipeline(
+        self,
+        client_request: str,
+        client_persona: str,
+        initial_facts: str,
+        verbose: bool = False,
+        run: Optional[PipelineRun] = None
+    ) -> Dict[str, str]:
+        """
+        Run the complete pipeline asynchronously.
+
+        Each stage consumes the previous stage's output, so stages of one case
+        run in order; the gain comes from awaiting the LM instead of blocking,
+        which lets many cases share one event loop (e.g. with ``asyncio.gather``).
+
+        Args:
+            client_request: Client's initial request/message
+            client_persona: Client background and context
+            initial_facts: Initial facts from client
+            verbose: Whether to print progress messages (default: False)
+            run: Per-case run state for persistence and resume (default: none)
+
+        Returns:
+            Dict with all pipeline outputs including predicted judgment
+        """
+        if verbose:
+            print("  [1/4] Running intake & analysis phase...")
+        phase1 = await self.arun_intake_to_analysis(client_request, run=run)
+
+        if verbose:
+            print("  [2/4] Running investigation phase...")
+        phase2 = await self.arun_investigation_phase(
+            phase1["initial_analysis"],
+            client_persona,
+            initial_facts,
+            run=run
+        )
+
+        if verbose:
+            print("  [3/4] Running legal analysis phase...")
+        phase3 = await self.arun_legal_analysis(phase2["factual_record"], run=run)
+
+        if verbose:
+            print("  [4/4] Running final phase...")
+        phase4 = await self.arun_final_phase(
+            phase3["legal_arguments"],
+            phase2["factual_record"],
+            phase1["qualification"],
+            use_predicted_judgment=True,
+            run=run
+        )
+
+        return {
+            **phase1,
+            **phase2,
+            **phase3,
+            **phase4
+        }
+
+    async def _astream_step(
+        self,
+        step_name: str,
+        agent: dspy.Module,
+        run: Optional[PipelineRun],
+        results: Dict[str, str],
+        **inputs: str
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Stream one step as ``(step_name, chunk)`` events.
+
+        The complete output is stored in ``results[step_name]`` once the step
+        finishes. A step served from the run's checkpoint is emitted as a
+        single chunk.
+
+        The step runs in its own task, which holds the step's contexts
+        (routed model, prompt layout, deadline, trace) and passes chunks
+        through a queue: no context stays open across a ``yield``, so the
+        consumer may close the stream between chunks, which cancels the task.
+        """
+        chunks: asyncio.Queue = asyncio.Queue()
+        end = object()
+
+        async def produce() -> str:
+            try:
+                with self._step_context(step_name, run):
+                    input_hash = None
+                    output = None
+                    if run is not None:
+                        input_hash = step_input_hash(step_name, agent, inputs)
+                        output = run.load_step(step_name, input_hash)
+
+                    if output is not None:
+                        chunks.put_nowait(output)
+                        return output
+
+                    stream = AgentStream(agent, **inputs)
+                    step_trace = run.trace_step(step_name) if run is not None else nullcontext()
+                    # Streams are not hedged; the stage deadline still applies
+                    with step_trace, get_stage_resilience().deadline(step_name):
+                        async for chunk in stream:
+                            chunks.put_nowait(chunk)
+                    if run is not None:
+                        run.save_step(step_name, input_hash, stream.output)
+                    return stream.output
+            finally:
+                chunks.put_nowait(end)
+
+        task = asyncio.create_task(produce())
+        try:
+            while (chunk := await chunks.get()) is not end:
+                yield step_name, chunk
+            output = await task
+        finally:
+            if not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+        results[step_name] = output
+        self._observe_output(step_name, run, output)
+
+    async def astream_full_pipeline(
+        self,
+        client_request: str,
+        client_persona: str,
+        initial_facts: str,
+        run: Optional[PipelineRun] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Run the complete pipeline, streaming each stage's output as it arrives.
+
+        Yields ``(stage, chunk)`` tuples where ``stage`` is the step name (same
+        keys as :meth:`run_full_pipeline`) and ``chunk`` a piece of its output
+        text; a stage is complete when the next stage's first chunk arrives.
+        The last event is ``("done", results)`` with the dict that
+        :meth:`run_full_pipeline` would have returned.
+
+        Args:
+            client_request: Client's initial request/message
+            client_persona: Client background and context
+            initial_facts: Initial facts from client
+            run: Per-case run state for persistence and resume (default: none)
+        """
+        results = {}
+
+        # Phase 1: Intake to analysis
+        async with aclosing(self._astream_step(
+            "qualification", self.qualification_agent, run, results,
+            client_request=client_request
+        )) as events:
+            async for event in events:
+                yield event
+        async with aclosing(self._astream_step(
+            "initial_analysis", self.initial_analysis_agent, run, results,
+            qualification=results["qualification"]
+        )) as events:
+            async for event in events:
+                yield event
+
+        # Phase 2: Investigation
+        async with aclosing(self._astream_step(
+            "investigation_order", self.investigation_order_agent, run, results,
+            initial_analysis=results["initial_analysis"]
+        )) as events:
+            async for event in events:
+                yield event
+        async with aclosing(self._astream_step(
+            "investigation_report", self.investigation_report_agent, run, results,
+            investigation_order=results["investigation_order"],
+            client_persona=client_persona,
+            initial_facts=initial_facts
+        )) as events:
+            async for event in events:
+                yield event
+        async with aclosing(self._astream_step(
+            "factual_record", self.factual_record_agent, run, results,
+            initial_facts=initial_facts,
+            investigation_report=results["investigation_report"]
+        )) as events:
+            async for event in events:
+                yield event
+
+        # Phase 3: Legal analysis
+        async with aclosing(self._astream_step(
+            "legal_basis", self.legal_basis_agent, run, results,
+            factual_record=results["factual_record"]
+        )) as events:
+            async for event in events:
+                yield event
+        async with aclosing(self._astream_step(
+            "legal_arguments", self.argumentation_agent, run, results,
+            factual_record=results["factual_record"],
+            legal_basis=results["legal_basis"]
+        )) as events:
+            async for event in events:
+                yield event
+
+        # Phase 4: Final phase
+        async with aclosing(self._astream_step(
+            "considerations", self.consideration_agent, run, results,
+            arguments=results["legal_arguments"],
+            factual_record=results["factual_record"]
+        )) as events:
+            async for event in events:
+                yield event
+        async with aclosing(self._astream_step(
+            "judgment", self.judgment_agent, run, results,
+            considerations=results["considerations"],
+            factual_record=results["factual_record"]
+        )) as events:
+            async for event in events:
+                yield event
+        async with aclosing(self._astream_step(
+            "recommendations", self.recommendation_agent, run, results,
+            considerations=results["considerations"],
+            judgment=results["judgment"],
+            client_objectives=results["qualification"]
+        )) as events:
+            async for event in events:
+                yield event
+
+        yield "done", results
+
+    def stream_full_pipeline(
+        self,
+        client_request: str,
+        client_persona: str,
+        initial_facts: str,
+        run: Optional[PipelineRun] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Synchronous generator over :meth:`astream_full_pipeline` events.
+
+        The pipeline runs on an event loop in a background thread.
+        """
+        return dspy.streaming.apply_sync_streaming(
+            self.astream_full_pipeline(client_request, client_persona, initial_facts, run=run)
+        )
@@ -0,0 +1,69 @@
+"""Prompt layout that lets stages sharing the case file reuse a cached prefix."""
+
+from typing import Any, Dict, List
+
+import dspy
+from dspy.adapters.utils import format_field_value
+
+
+# Long inputs shared by the legal analysis and final stages, in prefix order
+SHARED_CONTEXT_FIELDS = ("factual_record", "legal_basis", "arguments")
+
+# Stage-independent system prompt, so the cached prefix starts identically for every stage
+SHARED_CONTEXT_SYSTEM = (
+    "Les pièces du dossier communes à plusieurs étapes de l'analyse sont fournies en premier, "
+    "chacune sous son marqueur [[ ## champ ## ]]. Les instructions propres à la tâche suivent."
+)
+
+
+class PrefixCacheAdapter(dspy.ChatAdapter):
+    """
+    Chat adapter that moves shared case documents ahead of stage instructions.
+
+    The default layout starts every request with a stage-specific system
+    message, so the factual record passed to the legal basis, arguments,
+    considerations and judgment stages never shares a prompt prefix. This
+    adapter sends a fixed system message, then the shared fields present in
+    the signature (factual record, then legal basis, then arguments) as
+    content blocks marked ``cache_control: ephemeral``, and only then the
+    usual system message, demos and remaining inputs. Each stage thus
+    re-reads the longest prefix an earlier stage already wrote to the
+    provider's prompt cache.
+
+    Signatures without shared fields are formatted exactly as by ChatAdapter.
+    """
+
+    def format(
+        self,
+        signature: type[dspy.Signature],
+        demos: List[Dict[str, Any]],
+        inputs: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        shared = [
+            name for name in SHARED_CONTEXT_FIELDS
+            if name in signature.input_fields and name in inputs
+        ]
+        if not shared:
+            return super().format(signature, demos, inputs)
+
+        # Standard layout for the stage-specific part, without the shared values
+        remaining = {name: value for name, value in inputs.items() if name not in shared}
+        messages = super().format(signature, demos, remaining)
+        stage_system = messages[0]["content"]
+
+        prefix_blocks = [
+            {
+                "type": "text",
+                "text": f"[[ ## {name} ## ]]\n"
+                        f"{format_field_value(field_info=signature.input_fields[name], value=inputs[name])}",
+                "cache_control": {"type": "ephemeral"},
+            }
+            for name in shared
+        ]
+        prefix_blocks.append({"type": "text", "text": stage_system})
+
+        return [
+            {"role": "system", "content": SHARED_CONTEXT_SYSTEM},
+            {"role": "user", "content": prefix_blocks},
+            *messages[1:],
+        ]
@@ -2,10 +2,7 @@
 
 import dspy
 from lexic.shared.models import ClientPersona, InitialFacts, Qualification
-from lexic.shared.prompts import create_signature
-
-# Create signature from YAML
-QualifyClientQualification = create_signature("agents", "qualification")
+from lexic.shared.prompts import get_signature
 
 
 class QualificationAgent(dspy.Module):
@@ -18,7 +15,7 @@ class QualificationAgent(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.qualify = dspy.ChainOfThought(QualifyClientQualification)
+        self.qualify = dspy.ChainOfThought(get_signature("agents", "qualification"))
 
     def forward(self, client_request: str) -> str:
         """
@@ -33,16 +30,24 @@ class QualificationAgent(dspy.Module):
         result = self.qualify(client_request=client_request)
         return result.qualification
 
+    async def aforward(self, client_request: str) -> str:
+        """Asynchronous variant of :meth:`forward`."""
+        result = await self.qualify.acall(client_request=client_request)
+        return result.qualification
+
 
 def run_qualification(client_request: str) -> str:
     """
     Run qualification agent.
 
+    Uses the shared agent from the process-wide registry.
+
     Args:
         client_request: Client's initial request/message
 
     Returns:
         Qualification report
     """
-    agent = QualificationAgent()
-    return agent(client_request=client_request)
+    from lexic.agents.registry import get_agent
+
+    return get_agent("qualification")(client_request=client_request)
@@ -1,10 +1,7 @@
 """Recommendation agent - provides client recommendations."""
 
 import dspy
-from lexic.shared.prompts import create_signature
-
-# Create signature from YAML
-GenerateRecommendations = create_signature("agents", "recommendations")
+from lexic.shared.prompts import get_signature
 
 
 class RecommendationAgent(dspy.Module):
@@ -12,7 +9,7 @@ class RecommendationAgent(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.generate = dspy.ChainOfThought(GenerateRecommendations)
+        self.generate = dspy.ChainOfThought(get_signature("agents", "recommendations"))
 
     def forward(self, considerations: str, judgment: str, client_objectives: str) -> str:
         """
@@ -32,3 +29,12 @@ class RecommendationAgent(dspy.Module):
             client_objectives=client_objectives
         )
         return result.recommendations
+
+    async def aforward(self, considerations: str, judgment: str, client_objectives: str) -> str:
+        """Asynchronous variant of :meth:`forward`."""
+        result = await self.generate.acall(
+            considerations=considerations,
+            judgment=judgment,
+            client_objectives=client_objectives
+        )
+        return result.recommendations
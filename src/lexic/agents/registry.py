@@ -0,0 +1,133 @@
+"""Per-process registry of built (and optionally optimized) agents."""
+
+import importlib
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from lexic.shared.config import Config
+
+if TYPE_CHECKING:
+    import dspy
+
+
+# Map step names to agent modules and classes (imported when first built)
+AGENT_CLASSES = {
+    "qualification": ("lexic.agents.qualification", "QualificationAgent"),
+    "initial_analysis": ("lexic.agents.initial_analysis", "InitialAnalysisAgent"),
+    "investigation_order": ("lexic.agents.investigation_order", "InvestigationOrderAgent"),
+    "investigation_report": ("lexic.agents.investigation_report", "InvestigationReportAgent"),
+    "factual_record": ("lexic.agents.factual_record", "FactualRecordAgent"),
+    "legal_basis": ("lexic.agents.legal_basis", "LegalBasisAgent"),
+    "legal_arguments": ("lexic.agents.arguments", "ArgumentationAgent"),
+    "considerations": ("lexic.agents.considerations", "ConsiderationAgent"),
+    "judgment": ("lexic.agents.judgment", "JudgmentAgent"),
+    "recommendations": ("lexic.agents.recommendations", "RecommendationAgent"),
+}
+
+
+class AgentRegistry:
+    """
+    Builds each agent at most once per process and hands out the shared instance.
+
+    Agents hold no per-call state, so one instance can serve concurrent
+    callers. If an optimized-programs directory is set, ``<step_name>.json``
+    files saved with ``agent.save(...)`` (e.g. after a DSPy optimizer run)
+    are loaded into the agents when they are built.
+    """
+
+    def __init__(self, optimized_dir: Optional[Path] = None):
+        """
+        Initialize registry.
+
+        Args:
+            optimized_dir: Directory of saved optimized agent states (default: none)
+        """
+        self.optimized_dir = Path(optimized_dir) if optimized_dir else None
+        self._agents: Dict[str, "dspy.Module"] = {}
+        self._lock = threading.Lock()
+
+    def get(self, step_name: str) -> "dspy.Module":
+        """
+        Get the shared agent for a pipeline step, building it on first use.
+
+        Args:
+            step_name: Name of the pipeline step
+
+        Returns:
+            Agent module
+
+        Raises:
+            ValueError: If the step is unknown
+        """
+        agent = self._agents.get(step_name)
+        if agent is not None:
+            return agent
+
+        if step_name not in AGENT_CLASSES:
+            raise ValueError(f"Unknown step: {step_name}")
+
+        with self._lock:
+            # Another thread may have built it while we waited
+            if step_name not in self._agents:
+                self._agents[step_name] = self._build(step_name)
+            return self._agents[step_name]
+
+    def _build(self, step_name: str) -> "dspy.Module":
+        """Instantiate an agent and load its optimized state if available."""
+        module_name, class_name = AGENT_CLASSES[step_name]
+        agent_class = getattr(importlib.import_module(module_name), class_name)
+        agent = agent_class()
+
+        if self.optimized_dir is not None:
+            state_path = self.optimized_dir / f"{step_name}.json"
+            if state_path.exists():
+                agent.load(str(state_path))
+        return agent
+
+    def load_optimized(self, optimized_dir: Path) -> List[str]:
+        """
+        Load optimized states for all steps, typically once at startup.
+
+        Agents already built are rebuilt so they pick up the new state.
+
+        Args:
+            optimized_dir: Directory containing ``<step_name>.json`` files
+
+        Returns:
+            Step names for which an optimized state was loaded
+        """
+        optimized_dir = Path(optimized_dir)
+        if not optimized_dir.is_dir():
+            raise FileNotFoundError(f"Optimized programs directory not found: {optimized_dir}")
+
+        with self._lock:
+            self.optimized_dir = optimized_dir
+            self._agents = {}
+            loaded = []
+            for step_name in AGENT_CLASSES:
+                self._agents[step_name] = self._build(step_name)
+                if (optimized_dir / f"{step_name}.json").exists():
+                    loaded.append(step_name)
+        return loaded
+
+
+_registry = AgentRegistry(optimized_dir=Config.OPTIMIZED_PROGRAMS_DIR)
+
+
+def get_registry() -> AgentRegistry:
+    """Get the process-wide agent registry."""
+    return _registry
+
+
+def get_agent(step_name: str) -> "dspy.Module":
+    """
+    Get the shared agent for a pipeline step from the process-wide registry.
+
+    Args:
+        step_name: Name of the pipeline step
+
+    Returns:
+        Agent module
+    """
+    return _registry.get(step_name)
@@ -0,0 +1,422 @@
+"""Per-stage deadlines and hedged requests for pipeline steps."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, ContextManager, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from lexic.agents.tracing import percentile
+from lexic.shared.config import Config
+from lexic.shared.lm import (
+    DeadlineExceeded,
+    lm_cancel_event,
+    lm_deadline,
+    lm_time_left,
+    report_lm_usage,
+    summarize_usage,
+    track_lm_usage,
+)
+
+
+T = TypeVar("T")
+
+
+class StageResilience:
+    """
+    Deadlines and hedging for the LM calls of each pipeline stage.
+
+    Every call of a stage runs within the stage's deadline, which covers the
+    whole call: each attempt and retry LexicLM makes, backoff, rate-limit
+    waits and hedging; a call that runs out raises
+    :class:`~lexic.shared.lm.DeadlineExceeded`. With hedging on, once a stage
+    has ``min_samples`` recorded latencies, a call still running after the
+    stage's p95 latency gets a duplicate request and whichever finishes first
+    wins. Hedged attempts run on a bounded thread pool (a call that finds it
+    full is not hedged) and each records its LM usage apart: the winner's
+    goes to the caller's :func:`~lexic.shared.lm.track_lm_usage` blocks, the
+    loser's is counted as hedge cost per stage, next to the hedge rate and
+    wins, to weigh against the tail latency saved. Asynchronous losers are
+    cancelled; synchronous ones cannot be interrupted, so they are abandoned:
+    the request in flight completes, but no further retry or call starts.
+    """
+
+    def __init__(
+        self,
+        timeouts: Optional[Dict[str, float]] = None,
+        default_timeout: float = 0.0,
+        hedge: bool = False,
+        min_samples: int = 10,
+        window: int = 200,
+        max_workers: int = 16
+    ):
+        """
+        Initialize stage policies.
+
+        Args:
+            timeouts: Per-stage deadlines in seconds
+            default_timeout: Deadline of other stages (0 = none)
+            hedge: Whether to hedge slow calls
+            min_samples: Latencies a stage needs before it is hedged
+            window: Number of recent latencies kept per stage
+            max_workers: Threads running synchronous hedged attempts (primaries and hedges)
+        """
+        self.timeouts = dict(timeouts or {})
+        self.default_timeout = default_timeout
+        self.hedge = hedge
+        self.min_samples = min_samples
+        self.window = window
+        self.max_workers = max(1, max_workers)
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Free executor threads; attempts are only submitted with one, so none ever queues
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+
+    def timeout_for(self, stage: str) -> Optional[float]:
+        """Get a stage's deadline in seconds (None = none)."""
+        return self.timeouts.get(stage, self.default_timeout) or None
+
+    def deadline(self, stage: str) -> ContextManager[None]:
+        """Apply a stage's deadline to the LM calls made inside the block (see :func:`lm_deadline`)."""
+        return lm_deadline(self.timeout_for(stage))
+
+    def hedge_delay(self, stage: str) -> Optional[float]:
+        """Get how long a call may run before it is hedged (None = never)."""
+        if not self.hedge:
+            return None
+        with self._lock:
+            latencies = list(self._latencies.get(stage, ()))
+        if len(latencies) < self.min_samples:
+            return None
+        return percentile(latencies, 95)
+
+    def _stage_stats(self, stage: str) -> Dict[str, float]:
+        return self._stats.setdefault(stage, {
+            "calls": 0, "hedged": 0, "hedge_wins": 0, "deadline_exceeded": 0,
+            "hedge_lm_calls": 0, "hedge_tokens": 0, "hedge_cost_usd": 0.0,
+            "abandoned_lm_calls": 0, "abandoned_cost_usd": 0.0,
+        })
+
+    def _observe(
+        self,
+        stage: str,
+        latency: Optional[float],
+        hedged: bool = False,
+        hedge_won: bool = False,
+        error: Optional[BaseException] = None
+    ):
+        """Count a finished call and record its latency (None for failed calls)."""
+        with self._lock:
+            stats = self._stage_stats(stage)
+            stats["calls"] += 1
+            stats["hedged"] += hedged
+            stats["hedge_wins"] += hedge_won
+            stats["deadline_exceeded"] += isinstance(error, DeadlineExceeded)
+            if latency is not None:
+                self._latencies.setdefault(stage, deque(maxlen=self.window)).append(latency)
+
+    def _charge_hedge(self, stage: str, records: List[Dict[str, Any]]):
+        """Count the LM usage of a losing attempt as the stage's hedge cost."""
+        usage = summarize_usage(records)
+        with self._lock:
+            stats = self._stage_stats(stage)
+            stats["hedge_lm_calls"] += usage["calls"]
+            stats["hedge_tokens"] += usage["prompt_tokens"] + usage["completion_tokens"]
+            stats["hedge_cost_usd"] += usage["cost_usd"]
+
+    def _charge_abandoned(self, stage: str, records: List[Dict[str, Any]]):
+        """Count the LM usage an attempt made after its call ran out of time."""
+        usage = summarize_usage(records)
+        with self._lock:
+            stats = self._stage_stats(stage)
+            stats["abandoned_lm_calls"] += usage["calls"]
+            stats["abandoned_cost_usd"] += usage["cost_usd"]
+
+    def _run_inline(self, stage: str, fn: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._observe(stage, None, error=e)
+            raise
+        self._observe(stage, time.perf_counter() - started)
+        return result
+
+    def _submit(self, fn: Callable[[], T]) -> Optional[Tuple[Future, List[Dict[str, Any]], threading.Event]]:
+        """
+        Start an attempt on the executor, if a thread is free.
+
+        The attempt sees this thread's context (DSPy settings, deadline) but
+        records its LM usage apart, and stops making calls once its event is set.
+
+        Returns:
+            (future, usage records as its calls finish, cancel event), or None if the executor is full
+        """
+        if not self._slots.acquire(blocking=False):
+            return None
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="lexic-hedge"
+                    )
+
+        records: List[Dict[str, Any]] = []
+        cancel = threading.Event()
+
+        def attempt() -> T:
+            with track_lm_usage(isolated=True, records=records), lm_cancel_event(cancel):
+                return fn()
+
+        future = self._executor.submit(contextvars.copy_context().run, attempt)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future, records, cancel
+
+    def call(self, stage: str, fn: Callable[[], T]) -> T:
+        """
+        Run a stage's call within its deadline, hedging it if it runs slow.
+
+        Args:
+            stage: Pipeline step name
+            fn: Zero-argument function making the call
+
+        Returns:
+            Result of the first attempt to succeed
+
+        Raises:
+            DeadlineExceeded: If no attempt succeeded within the stage's deadline
+        """
+        with self.deadline(stage):
+            delay = self.hedge_delay(stage)
+            primary = self._submit(fn) if delay is not None else None
+            if primary is None:
+                return self._run_inline(stage, fn)
+
+            attempts = [primary]
+            started = {primary[0]: time.perf_counter()}
+            try:
+                done, _ = wait([primary[0]], timeout=self._wait_time(delay))
+                if not done:
+                    hedge = self._submit(fn)
+                    if hedge is not None:
+                        attempts.append(hedge)
+                        started[hedge[0]] = time.perf_counter()
+            except DeadlineExceeded as e:
+                self._give_up(stage, attempts, e)
+
+            pending = {future for future, _, _ in attempts}
+            hedged = len(attempts) > 1
+            error: Optional[BaseException] = None
+            while pending:
+                try:
+                    done, pending = wait(pending, timeout=self._wait_time(), return_when=FIRST_COMPLETED)
+                except DeadlineExceeded as e:
+                    self._give_up(stage, attempts, e)
+                for future in done:
+                    if future.exception() is None:
+                        self._observe(
+                            stage,
+                            time.perf_counter() - started[future],
+                            hedged=hedged,
+                            hedge_won=future is not primary[0]
+                        )
+                        self._settle_attempts(stage, attempts, future)
+                        return future.result()
+                    error = future.exception()
+            self._observe(stage, None, hedged=hedged, error=error)
+            self._settle_attempts(stage, attempts, None)
+            raise error
+
+    @staticmethod
+    def _wait_time(delay: Optional[float] = None) -> Optional[float]:
+        """Time to wait for attempts: ``delay``, cut to the deadline (raises once it has passed)."""
+        left = lm_time_left()
+        if left is None:
+            return delay
+        return left if delay is None else min(delay, left)
+
+    def _settle_attempts(self, stage: str, attempts: List[Tuple], winner: Optional[Future]):
+        """
+        Report the winner's usage to the caller; abandon the others and charge their usage as hedge cost.
+
+        Without a winner every attempt has finished and all usage goes to the caller.
+        """
+        for future, records, cancel in attempts:
+            if winner is None or future is winner:
+                report_lm_usage(records)
+            else:
+                cancel.set()
+                future.add_done_callback(lambda _, records=records: self._charge_hedge(stage, records))
+
+    def _give_up(self, stage: str, attempts: List[Tuple], error: DeadlineExceeded):
+        """
+        Abandon every attempt of a call out of time and raise its error.
+
+        Usage recorded so far goes to the caller; calls the attempts still
+        finish afterwards are counted as abandoned, apart from the caller's.
+        """
+        self._observe(stage, None, hedged=len(attempts) > 1, error=error)
+        for future, records, cancel in attempts:
+            cancel.set()
+            reported = len(records)
+            report_lm_usage(records[:reported])
+            future.add_done_callback(
+                lambda _, records=records, reported=reported: self._charge_abandoned(stage, records[reported:])
+            )
+        raise error
+
+    async def acall(self, stage: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Asynchronous variant of :meth:`call`; the losing attempt is cancelled."""
+        with self.deadline(stage):
+            delay = self.hedge_delay(stage)
+            attempts: List[Tuple[asyncio.Task, List[Dict[str, Any]]]] = []
+            started = {}
+
+            def submit():
+                records: List[Dict[str, Any]] = []
+
+                async def attempt() -> T:
+                    with track_lm_usage(isolated=True, records=records):
+                        return await fn()
+
+                task = asyncio.ensure_future(attempt())
+                started[task] = time.perf_counter()
+                attempts.append((task, records))
+
+            submit()
+            primary = attempts[0][0]
+            winner: Optional[asyncio.Task] = None
+            error: Optional[BaseException] = None
+            try:
+                try:
+                    done, _ = await asyncio.wait([primary], timeout=self._wait_time(delay))
+                    if not done:
+                        submit()
+
+                    pending = {task for task, _ in attempts}
+                    while pending and winner is None:
+                        done, pending = await asyncio.wait(
+                            pending, timeout=self._wait_time(), return_when=asyncio.FIRST_COMPLETED
+                        )
+                        if not done:
+                            lm_time_left()
+                        for task in done:
+                            if task.exception() is None:
+                                winner = task
+                                break
+                            error = task.exception()
+                except DeadlineExceeded as e:
+                    error = e
+
+                hedged = len(attempts) > 1
+                if winner is None:
+                    self._observe(stage, None, hedged=hedged, error=error)
+                    raise error
+                self._observe(
+                    stage,
+                    time.perf_counter() - started[winner],
+                    hedged=hedged,
+                    hedge_won=winner is not primary
+                )
+                return winner.result()
+            finally:
+                self._settle_tasks(stage, attempts, winner)
+
+    def _settle_tasks(self, stage: str, attempts: List[Tuple], winner: Optional[asyncio.Task]):
+        """
+        Cancel the attempts of an asynchronous call and account for their usage.
+
+        The winner's usage goes to the caller and the losers' is charged as
+        hedge cost; without a winner, usage recorded so far goes to the caller
+        and calls finished after the cancellation are counted as abandoned.
+        """
+        for task, records in attempts:
+            reported = len(records)
+            if winner is None or task is winner:
+                report_lm_usage(records[:reported])
+                charge_late = self._charge_abandoned
+            else:
+                self._charge_hedge(stage, records[:reported])
+                charge_late = self._charge_hedge
+            if not task.done():
+                task.cancel()
+                task.add_done_callback(
+                    lambda _, records=records, reported=reported, charge=charge_late: charge(
+                        stage, records[reported:]
+                    )
+                )
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-stage hedging counters.
+
+        Returns:
+            Dict mapping each stage called so far to calls, hedged,
+            hedge_wins, deadline_exceeded, hedge_lm_calls, hedge_tokens and
+            hedge_cost_usd (LM usage of losing attempts), abandoned_lm_calls
+            and abandoned_cost_usd (LM usage of attempts after their call ran
+            out of time), hedge_rate, win_rate (of hedged calls) and p95_s
+        """
+        with self._lock:
+            snapshot = {stage: dict(stats) for stage, stats in self._stats.items()}
+            latencies = {stage: list(values) for stage, values in self._latencies.items()}
+        return {
+            stage: {
+                **stats,
+                "hedge_rate": stats["hedged"] / stats["calls"] if stats["calls"] else 0.0,
+                "win_rate": stats["hedge_wins"] / stats["hedged"] if stats["hedged"] else 0.0,
+                "p95_s": percentile(latencies.get(stage, []), 95),
+            }
+            for stage, stats in snapshot.items()
+        }
+
+
+def format_hedge_stats(stats: Dict[str, Dict[str, Any]]) -> str:
+    """Format :meth:`StageResilience.stats` as a one-line hedging report."""
+    calls = sum(stage["calls"] for stage in stats.values())
+    hedged = sum(stage["hedged"] for stage in stats.values())
+    wins = sum(stage["hedge_wins"] for stage in stats.values())
+    if not hedged:
+        return f"Hedging: no hedged calls ({calls} calls)"
+    cost = sum(stage["hedge_cost_usd"] for stage in stats.values())
+    extra_calls = sum(stage["hedge_lm_calls"] for stage in stats.values())
+    per_stage = ", ".join(
+        f"{name} {stage['hedged']}/{stage['hedge_wins']}"
+        for name, stage in stats.items() if stage["hedged"]
+    )
+    return (
+        f"Hedging: {hedged} of {calls} calls hedged ({hedged / calls:.0%}), "
+        f"{wins} won by the hedge ({wins / hedged:.0%}), losing attempts cost {extra_calls} LM calls "
+        f"(${cost:.4f}); hedged/won per stage: {per_stage}"
+    )
+
+
+_stage_resilience: Optional[StageResilience] = None
+
+
+def get_stage_resilience() -> StageResilience:
+    """
+    Get the process-wide stage policies, creating them on first use.
+
+    Settings come from ``Config.STAGE_TIMEOUTS``, ``Config.STAGE_TIMEOUT_S``,
+    ``Config.HEDGE_REQUESTS``, ``Config.HEDGE_MIN_SAMPLES`` and
+    ``Config.HEDGE_MAX_WORKERS``.
+
+    Returns:
+        Shared stage policies
+    """
+    global _stage_resilience
+
+    if _stage_resilience is None:
+        _stage_resilience = StageResilience(
+            timeouts=Config.STAGE_TIMEOUTS,
+            default_timeout=Config.STAGE_TIMEOUT_S,
+            hedge=Config.HEDGE_REQUESTS,
+            min_samples=Config.HEDGE_MIN_SAMPLES,
+            max_workers=Config.HEDGE_MAX_WORKERS
+        )
+    return _stage_resilience
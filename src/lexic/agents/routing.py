@@ -0,0 +1,168 @@
+"""Per-stage model routing by stage and case complexity."""
+
+import re
+import threading
+from collections import Counter
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Iterable, List, Optional, Tuple
+
+import dspy
+
+from lexic.shared.config import Config
+
+
+# Stages whose output decides the case; the small-model rule never applies to them
+HIGH_STAKES_STAGES = ("considerations", "judgment")
+
+# "Complexité ... 7/10" as written in qualification reports
+_COMPLEXITY_PATTERN = re.compile(r"complexit[ée][^\n]{0,120}?\b(10|[1-9])\s*/\s*10", re.IGNORECASE)
+
+
+def parse_case_complexity(qualification: str) -> Optional[int]:
+    """
+    Extract the 1-10 complexity score from a qualification report.
+
+    Args:
+        qualification: Qualification report (markdown)
+
+    Returns:
+        Complexity score, or None if the report does not state one
+    """
+    match = _COMPLEXITY_PATTERN.search(qualification or "")
+    return int(match.group(1)) if match else None
+
+
+class ModelRouter:
+    """
+    Chooses the model of each pipeline stage.
+
+    In order of precedence: an explicit per-stage model, then the small model
+    for mechanical stages or for cases whose complexity is at most
+    ``small_model_max_complexity`` (never for :data:`HIGH_STAKES_STAGES`),
+    then the default model. Stages on the default model keep the configured
+    LM, so without a small model or stage map routing is a no-op.
+    """
+
+    def __init__(
+        self,
+        default_model: str,
+        stage_models: Optional[Dict[str, str]] = None,
+        small_model: str = "",
+        small_model_stages: Iterable[str] = (),
+        small_model_max_complexity: int = 0
+    ):
+        """
+        Initialize router.
+
+        Args:
+            default_model: Model of unrouted stages, without provider prefix
+            stage_models: Per-stage models, without provider prefix
+            small_model: Smaller, faster model ("" to disable the small-model rule)
+            small_model_stages: Stages always sent to the small model
+            small_model_max_complexity: Highest case complexity sent to the small model (0 = none)
+        """
+        self.default_model = default_model
+        self.stage_models = dict(stage_models or {})
+        self.small_model = small_model
+        self.small_model_stages = set(small_model_stages)
+        self.small_model_max_complexity = small_model_max_complexity
+        self._lock = threading.Lock()
+        self._lms: Dict[Tuple[int, str], dspy.LM] = {}
+
+    def model_for(self, stage: str, complexity: Optional[int] = None) -> str:
+        """
+        Choose the model of a stage.
+
+        Args:
+            stage: Pipeline step name
+            complexity: Case complexity from qualification (None if unknown)
+
+        Returns:
+            Model name without provider prefix
+        """
+        if stage in self.stage_models:
+            return self.stage_models[stage]
+        if self.small_model and stage not in HIGH_STAKES_STAGES:
+            if stage in self.small_model_stages:
+                return self.small_model
+            if complexity is not None and complexity <= self.small_model_max_complexity:
+                return self.small_model
+        return self.default_model
+
+    def lm_for(self, model: str) -> dspy.LM:
+        """
+        Get the configured LM switched to another model.
+
+        Copies keep the configured LM's class, request parameters, response
+        cache and limits; one copy is made per model.
+
+        Args:
+            model: Model name without provider prefix
+
+        Returns:
+            LM for the model
+        """
+        base = dspy.settings.lm
+        provider, _, base_model = base.model.rpartition("/")
+        if base_model == model:
+            return base
+        key = (id(base), model)
+        with self._lock:
+            lm = self._lms.get(key)
+            if lm is None:
+                lm = self._lms[key] = base.copy(model=f"{provider}/{model}" if provider else model)
+        return lm
+
+    def context(self, stage: str, complexity: Optional[int] = None) -> ContextManager:
+        """
+        Context in which DSPy calls of a stage use the stage's model.
+
+        Stages routed to the default model keep the configured LM.
+
+        Args:
+            stage: Pipeline step name
+            complexity: Case complexity from qualification (None if unknown)
+        """
+        model = self.model_for(stage, complexity)
+        if model == self.default_model or dspy.settings.lm is None:
+            return nullcontext()
+        return dspy.context(lm=self.lm_for(model))
+
+
+def format_routing_summary(traces: List[Dict[str, Any]]) -> str:
+    """Format the number of computed steps per model across run traces."""
+    models = Counter(
+        step.get("model", "?")
+        for trace in traces
+        for step in trace["steps"].values()
+        if step["status"] == "computed"
+    )
+    if not models:
+        return "Routing: no computed steps"
+    return "Routing: " + ", ".join(f"{model} {count} steps" for model, count in models.most_common())
+
+
+_model_router: Optional[ModelRouter] = None
+
+
+def get_model_router() -> ModelRouter:
+    """
+    Get the process-wide model router, creating it on first use.
+
+    Settings come from ``Config.STAGE_MODELS``, ``Config.SMALL_MODEL``,
+    ``Config.SMALL_MODEL_STAGES`` and ``Config.SMALL_MODEL_MAX_COMPLEXITY``.
+
+    Returns:
+        Shared router
+    """
+    global _model_router
+
+    if _model_router is None:
+        _model_router = ModelRouter(
+            default_model=Config.DEFAULT_MODEL,
+            stage_models=Config.STAGE_MODELS,
+            small_model=Config.SMALL_MODEL,
+            small_model_stages=Config.SMALL_MODEL_STAGES,
+            small_model_max_complexity=Config.SMALL_MODEL_MAX_COMPLEXITY
+        )
+    return _model_router
@@ -0,0 +1,299 @@
+"""Per-case run state for the Lexic pipeline: step outputs, checkpoints and traces."""
+
+import hashlib
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import dspy
+
+from lexic.shared.config import Config
+from lexic.shared.io import read_markdown, write_markdown
+from lexic.shared.lm import summarize_usage, track_lm_usage
+
+
+# Map step names to output filenames with numbering matching ground truth
+STEP_OUTPUT_FILES = {
+    "qualification": "02_pred_initial_qualification.md",
+    "initial_analysis": "03_pred_initial_analysis.md",
+    "investigation_order": "04_pred_initial_investigation_order.md",
+    "investigation_report": "11_pred_final_investigation_report.md",
+    "factual_record": "12_pred_final_factual_record.md",
+    "legal_basis": "14_pred_final_legal_basis.md",
+    "legal_arguments": "15_pred_final_legal_arguments.md",
+    "considerations": "16_pred_considerations.md",
+    "judgment": "17_pred_expected_judgment.md",
+    "recommendations": "18_pred_recommendations.md",
+}
+
+
+# Per-run trace written next to the step outputs
+TRACE_FILENAME = "trace.json"
+
+# Non-numeric fields of a step trace
+TRACE_LABEL_FIELDS = ("status", "model")
+
+
+def step_output_filename(step_name: str) -> str:
+    """Get the output filename for a pipeline step."""
+    return STEP_OUTPUT_FILES.get(step_name, f"pred_{step_name}.md")
+
+
+def active_model() -> str:
+    """Model of the LM DSPy currently uses, without provider prefix."""
+    lm = dspy.settings.lm
+    return lm.model.rpartition("/")[2] if lm is not None else Config.DEFAULT_MODEL
+
+
+def step_input_hash(step_name: str, agent: dspy.Module, inputs: Dict[str, str]) -> str:
+    """
+    Hash everything that determines a step's output.
+
+    Covers the step name, the active LM model, the agent's prompt (signature
+    instructions and field descriptions) and the step inputs, so a checkpoint
+    goes stale when any of them changes.
+
+    Args:
+        step_name: Name of the pipeline step
+        agent: Agent module that runs the step
+        inputs: Keyword arguments passed to the agent
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    prompts = []
+    for predictor in agent.predictors():
+        signature = predictor.signature
+        prompts.append({
+            "instructions": signature.instructions,
+            "fields": {
+                name: (field.json_schema_extra or {}).get("desc")
+                for name, field in signature.fields.items()
+            },
+        })
+
+    payload = {
+        "step": step_name,
+        "model": getattr(dspy.settings.lm, "model", None),
+        "prompts": prompts,
+        "inputs": inputs,
+    }
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class PipelineRun:
+    """
+    State of one pipeline execution on one case.
+
+    When an output directory is set, every step output is written as soon as
+    the step completes, with the hash of its inputs in the frontmatter. With
+    ``resume=True``, a step whose file exists and carries a matching input
+    hash is served from disk instead of calling the LM. Because each step's
+    output feeds the next step's inputs, the first missing or stale step
+    invalidates everything downstream of it.
+
+    Every step is traced: wall time, LM calls and retries, input/output
+    tokens, prompt and response cache hits, cost and time spent waiting on
+    rate limits. :meth:`trace` returns
+    the structured per-run trace, which is also kept up to date in
+    ``trace.json`` next to the step outputs.
+    """
+
+    def __init__(
+        self,
+        case_id: str = "",
+        output_dir: Optional[Path] = None,
+        resume: bool = False,
+        verbose: bool = True
+    ):
+        """
+        Initialize run state.
+
+        Args:
+            case_id: Case ID recorded in output frontmatter
+            output_dir: Directory for step outputs (default: do not persist)
+            resume: Whether to reuse valid step outputs found in output_dir
+            verbose: Whether to print a line per saved or reused step
+        """
+        self.case_id = case_id
+        self.output_dir = output_dir
+        self.resume = resume
+        self.verbose = verbose
+        self.reused_steps = []
+        self.computed_steps = []
+        self.started_at = datetime.now().isoformat()
+        # Set from the qualification report, for model routing
+        self.case_complexity: Optional[int] = None
+        self.usage: Dict[str, List[Dict[str, Any]]] = {}
+        self.steps: Dict[str, Dict[str, Any]] = {}
+
+    def load_step(self, step_name: str, input_hash: str) -> Optional[str]:
+        """
+        Load a checkpointed step output if it is still valid.
+
+        Args:
+            step_name: Name of the pipeline step
+            input_hash: Hash of the step's current inputs
+
+        Returns:
+            Saved output, or None if missing, stale or not resuming
+        """
+        if not self.resume or self.output_dir is None:
+            return None
+
+        path = self.output_dir / step_output_filename(step_name)
+        if not path.exists():
+            return None
+
+        metadata, content = read_markdown(path)
+        if metadata.get("input_hash") != input_hash:
+            if self.verbose:
+                print(f"      ↻ {self.case_id}/{path.name} is stale, recomputing")
+            return None
+
+        self.reused_steps.append(step_name)
+        self._record_step(step_name, "reused", 0.0, [], metadata.get("model", ""))
+        if self.verbose:
+            print(f"      ✓ Reusing {self.case_id}/{path.name}")
+        return content
+
+    def save_step(self, step_name: str, input_hash: str, content: str):
+        """
+        Record a computed step output, writing it to disk if persisting.
+
+        The frontmatter records the model of the active LM, so call this in
+        the same DSPy context as the step itself.
+
+        Args:
+            step_name: Name of the pipeline step
+            input_hash: Hash of the inputs the output was computed from
+            content: Step output
+        """
+        self.computed_steps.append(step_name)
+        if self.output_dir is None:
+            return
+
+        metadata = {
+            "case_id": self.case_id,
+            "run_at": datetime.now().isoformat(),
+            "model": active_model(),
+            "step": step_name,
+            "input_hash": input_hash,
+        }
+        filename = step_output_filename(step_name)
+        write_markdown(self.output_dir / filename, metadata, content)
+        if self.verbose:
+            print(f"      → Saved {self.case_id}/{filename}")
+
+    @contextmanager
+    def trace_step(self, step_name: str) -> Iterator[None]:
+        """
+        Trace the computation of a step.
+
+        Wrap the agent call; the step's wall time and the usage of every LM
+        call made inside the block are recorded when it exits, including
+        when it raises (status ``failed``).
+
+        Args:
+            step_name: Name of the pipeline step
+        """
+        model = active_model()
+        started = time.perf_counter()
+        with track_lm_usage() as usage:
+            try:
+                yield
+            except BaseException:
+                self._record_step(step_name, "failed", time.perf_counter() - started, usage, model)
+                raise
+        self._record_step(step_name, "computed", time.perf_counter() - started, usage, model)
+
+    def _record_step(
+        self,
+        step_name: str,
+        status: str,
+        wall_time: float,
+        records: List[Dict[str, Any]],
+        model: str
+    ):
+        """Add a step to the trace and refresh trace.json."""
+        self.usage.setdefault(step_name, []).extend(records)
+        summary = summarize_usage(records)
+        self.steps[step_name] = {
+            "status": status,
+            "model": model,
+            "wall_time_s": round(wall_time, 3),
+            "lm_calls": summary["calls"],
+            # Retries of failed provider requests (see LexicLM)
+            "retries": summary["retries"],
+            # LM calls beyond the one an agent's predictor makes, i.e. re-asks such as adapter
+            # fallbacks; losing hedged attempts are not in the step's usage (see StageResilience)
+            "extra_calls": max(0, summary["calls"] - 1),
+            "input_tokens": summary["prompt_tokens"],
+            "output_tokens": summary["completion_tokens"],
+            "cache_read_tokens": summary["cache_read_tokens"],
+            "cache_creation_tokens": summary["cache_creation_tokens"],
+            "response_cache_hits": summary["cached_responses"],
+            "cost_usd": round(summary["cost_usd"], 6),
+            "rate_limit_wait_s": round(summary["rate_limit_wait_s"], 3),
+        }
+        if self.output_dir is not None:
+            self.write_trace()
+
+    def trace(self) -> Dict[str, Any]:
+        """
+        Get the structured trace of this run.
+
+        Returns:
+            Dict with case_id, models (sorted models the steps ran on),
+            started_at, steps (step name -> status, model, wall_time_s,
+            lm_calls, retries, extra_calls, input_tokens, output_tokens,
+            cache_read_tokens, cache_creation_tokens, response_cache_hits,
+            cost_usd, rate_limit_wait_s) and totals (the numeric step fields summed)
+        """
+        totals: Dict[str, Any] = {}
+        for step in self.steps.values():
+            for key, value in step.items():
+                if key not in TRACE_LABEL_FIELDS:
+                    totals[key] = totals.get(key, 0) + value
+        if "wall_time_s" in totals:
+            totals["wall_time_s"] = round(totals["wall_time_s"], 3)
+            totals["cost_usd"] = round(totals["cost_usd"], 6)
+
+        return {
+            "case_id": self.case_id,
+            "models": sorted({step["model"] for step in self.steps.values() if step["model"]}),
+            "started_at": self.started_at,
+            "steps": dict(self.steps),
+            "totals": totals,
+        }
+
+    def write_trace(self) -> Path:
+        """
+        Write the trace to ``trace.json`` in the output directory.
+
+        Returns:
+            Path of the written file
+        """
+        path = self.output_dir / TRACE_FILENAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f, indent=2, ensure_ascii=False)
+        return path
+
+    def usage_summary(self, step_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Aggregate recorded LM usage.
+
+        Args:
+            step_name: Step to summarize (default: all steps)
+
+        Returns:
+            Summary as returned by ``summarize_usage``
+        """
+        if step_name is not None:
+            return summarize_usage(self.usage.get(step_name, []))
+        return summarize_usage(record for records in self.usage.values() for record in records)
@@ -0,0 +1,64 @@
+"""Token streaming for Lexic agents."""
+
+from typing import AsyncIterator, Optional
+
+import dspy
+from dspy.streaming import StreamListener, StreamResponse
+
+
+class AgentStream:
+    """
+    Stream an agent's output field as it is generated.
+
+    Iterate asynchronously to receive text chunks; once iteration ends the
+    full output is available as ``output``. When the response comes from a
+    cache, nothing is streamed and the whole output arrives as one chunk.
+
+    Example:
+        >>> stream = AgentStream(RecommendationAgent(), considerations=..., judgment=..., client_objectives=...)
+        >>> async for chunk in stream:
+        ...     print(chunk, end="")
+        >>> stream.output
+    """
+
+    def __init__(self, agent: dspy.Module, **inputs: str):
+        """
+        Prepare a stream.
+
+        Args:
+            agent: Lexic agent (a module wrapping exactly one predictor)
+            **inputs: Agent inputs, as passed to ``agent(...)``
+        """
+        predictors = agent.predictors()
+        if len(predictors) != 1:
+            raise ValueError(
+                f"{type(agent).__name__} has {len(predictors)} predictors; "
+                "streaming supports single-predictor agents only"
+            )
+        self.predictor = predictors[0]
+        # ChainOfThought prepends `reasoning`; the agent's output is the last field
+        self.output_field = list(self.predictor.signature.output_fields)[-1]
+        self.inputs = inputs
+        self.output: Optional[str] = None
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        listener = StreamListener(signature_field_name=self.output_field)
+        program = dspy.streamify(
+            self.predictor,
+            stream_listeners=[listener],
+            is_async_program=True
+        )
+
+        streamed = False
+        async for value in program(**self.inputs):
+            if isinstance(value, StreamResponse):
+                if value.chunk:
+                    streamed = True
+                    yield value.chunk
+            elif isinstance(value, dspy.Prediction):
+                self.output = getattr(value, self.output_field).strip()
+
+        if self.output is None:
+            raise RuntimeError(f"Stream ended without a final `{self.output_field}` prediction")
+        if not streamed:
+            yield self.output
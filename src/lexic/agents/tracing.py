@@ -0,0 +1,153 @@
+"""Aggregation, reporting and MLflow logging of pipeline run traces."""
+
+from typing import Any, Dict, List, Optional
+
+from lexic.agents.run import STEP_OUTPUT_FILES, TRACE_LABEL_FIELDS
+from lexic.shared.config import Config
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Linear-interpolated percentile.
+
+    Args:
+        values: Sample values
+        q: Percentile in [0, 100]
+
+    Returns:
+        Percentile value (0.0 for an empty sample)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def stage_statistics(traces: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """
+    Aggregate per-stage latency, tokens and cost across run traces.
+
+    Only computed steps count towards latency percentiles; reused
+    (checkpointed) steps are excluded.
+
+    Args:
+        traces: Traces from ``PipelineRun.trace()``
+
+    Returns:
+        Dict mapping step name (in pipeline order) to n, mean/p50/p95/max
+        wall time, total input/output/cache-read tokens, retries (of provider
+        requests), extra_calls (re-asks), cost and rate limit wait
+    """
+    stats = {}
+    for step_name in STEP_OUTPUT_FILES:
+        steps = [
+            trace["steps"][step_name] for trace in traces
+            if trace["steps"].get(step_name, {}).get("status") == "computed"
+        ]
+        if not steps:
+            continue
+        wall_times = [step["wall_time_s"] for step in steps]
+        stats[step_name] = {
+            "n": len(steps),
+            "mean_wall_time_s": sum(wall_times) / len(wall_times),
+            "p50_wall_time_s": percentile(wall_times, 50),
+            "p95_wall_time_s": percentile(wall_times, 95),
+            "max_wall_time_s": max(wall_times),
+            "input_tokens": sum(step["input_tokens"] for step in steps),
+            "output_tokens": sum(step["output_tokens"] for step in steps),
+            "cache_read_tokens": sum(step["cache_read_tokens"] for step in steps),
+            "retries": sum(step["retries"] for step in steps),
+            "extra_calls": sum(step.get("extra_calls", 0) for step in steps),
+            "cost_usd": sum(step["cost_usd"] for step in steps),
+            "rate_limit_wait_s": sum(step.get("rate_limit_wait_s", 0.0) for step in steps),
+        }
+    return stats
+
+
+def format_stage_report(stats: Dict[str, Dict[str, float]]) -> str:
+    """
+    Format stage statistics as a fixed-width table.
+
+    Args:
+        stats: Output of :func:`stage_statistics`
+
+    Returns:
+        Multi-line report
+    """
+    lines = [
+        f"{'Stage':<22}{'n':>4}{'p50 s':>9}{'p95 s':>9}{'in tok':>11}{'out tok':>10}"
+        f"{'retries':>9}{'extra':>7}{'wait s':>9}{'cost $':>10}"
+    ]
+    total_cost = 0.0
+    for step_name, stage in stats.items():
+        total_cost += stage["cost_usd"]
+        lines.append(
+            f"{step_name:<22}{stage['n']:>4}{stage['p50_wall_time_s']:>9.1f}"
+            f"{stage['p95_wall_time_s']:>9.1f}{stage['input_tokens']:>11,}"
+            f"{stage['output_tokens']:>10,}{stage['retries']:>9}{stage['extra_calls']:>7}"
+            f"{stage['rate_limit_wait_s']:>9.1f}"
+            f"{stage['cost_usd']:>10.4f}"
+        )
+    lines.append(f"Total cost: ${total_cost:.4f}")
+    return "\n".join(lines)
+
+
+def log_traces_to_mlflow(
+    traces: List[Dict[str, Any]],
+    experiment_name: Optional[str] = None,
+    run_name: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Log run traces to MLflow as one run.
+
+    Per-case step metrics are logged as ``<step>/<field>`` with the case's
+    index as the MLflow step, per-case totals as ``case/<field>``, per-stage
+    aggregates as ``summary/<step>/<field>`` (e.g. ``p95_wall_time_s``) and
+    the raw traces as the ``traces.json`` artifact.
+
+    Args:
+        traces: Traces from ``PipelineRun.trace()``
+        experiment_name: MLflow experiment (default: from config)
+        run_name: MLflow run name (default: MLflow-generated)
+        params: Extra run parameters to log
+
+    Returns:
+        MLflow run ID
+    """
+    import mlflow
+
+    mlflow.set_tracking_uri(Config.mlflow_tracking_uri())
+    mlflow.set_experiment(experiment_name or Config.MLFLOW_EXPERIMENT_NAME)
+
+    with mlflow.start_run(run_name=run_name) as active_run:
+        mlflow.log_param("n_cases", len(traces))
+        models = sorted({model for trace in traces for model in trace.get("models", ())})
+        mlflow.log_param("models", ",".join(models) or Config.DEFAULT_MODEL)
+        for key, value in (params or {}).items():
+            mlflow.log_param(key, value)
+
+        for index, trace in enumerate(traces):
+            for step_name, step in trace["steps"].items():
+                if step["status"] != "computed":
+                    continue
+                mlflow.log_metrics(
+                    {
+                        f"{step_name}/{key}": value for key, value in step.items()
+                        if key not in TRACE_LABEL_FIELDS
+                    },
+                    step=index
+                )
+            mlflow.log_metrics(
+                {f"case/{key}": value for key, value in trace["totals"].items()},
+                step=index
+            )
+
+        for step_name, stage in stage_statistics(traces).items():
+            mlflow.log_metrics({f"summary/{step_name}/{key}": value for key, value in stage.items()})
+
+        mlflow.log_dict({trace["case_id"]: trace for trace in traces}, "traces.json")
+        return active_run.info.run_id
@@ -0,0 +1,64 @@
+"""Command-line entry point: ``lexic <command> [options]``.
+
+Subcommand modules import only the standard library and light Lexic modules
+at module level; dspy, mlflow and docling are imported inside each command's
+``run`` so ``--help`` and argument errors return immediately.
+"""
+
+import argparse
+import importlib
+from typing import List, Optional
+
+
+# Map subcommand names to (module, one-line help)
+COMMANDS = {
+    "extract": ("lexic.cli.extract", "Extract court decisions to structured markdown"),
+    "generate": ("lexic.cli.generate", "Generate synthetic cases from court decisions"),
+    "eval": ("lexic.cli.evaluate", "Run evaluation for a pipeline step"),
+    "run": ("lexic.cli.run", "Run the full Lexic pipeline on synthetic case data"),
+    "judge-bench": ("lexic.cli.judgebench", "Compare the single-call and per-dimension judges"),
+    "eval-stats": ("lexic.cli.evalstats", "Summarize and compare earlier evaluation runs"),
+    "mlflow-sync": ("lexic.cli.mlflowsync", "Copy offline MLFlow runs to the tracking server"),
+    "importtime": ("lexic.cli.importtime", "Report the import time of Lexic entry points"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the top-level parser with one subparser per command."""
+    parser = argparse.ArgumentParser(
+        prog="lexic",
+        description="Lexic legal AI evaluation framework"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    for name, (module_name, help_text) in COMMANDS.items():
+        module = importlib.import_module(module_name)
+        subparser = subparsers.add_parser(
+            name,
+            help=help_text,
+            description=help_text,
+            epilog=getattr(module, "EPILOG", None),
+            formatter_class=argparse.RawDescriptionHelpFormatter
+        )
+        module.add_arguments(subparser)
+        subparser.set_defaults(handler=module.run, subparser=subparser)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Parse arguments and dispatch to the selected command.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit status
+    """
+    # Config reads the environment when first imported, so load .env first
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    args = build_parser().parse_args(argv)
+    return args.handler(args) or 0
@@ -0,0 +1,8 @@
+"""Allow ``python -m lexic.cli``."""
+
+import sys
+
+from lexic.cli import main
+
+
+sys.exit(main())
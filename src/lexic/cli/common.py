@@ -0,0 +1,39 @@
+"""Argument helpers shared by the ``lexic`` subcommands.
+
+This module must stay importable without dspy, mlflow or docling.
+"""
+
+from lexic.shared.config import Config
+
+
+def add_cache_arguments(parser):
+    """Add the --no-cache / --cache-readonly switches to an argument parser."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the persistent LM response and judge verdict caches"
+    )
+    group.add_argument(
+        "--cache-readonly",
+        action="store_true",
+        help="Serve cached LM responses and judge verdicts but do not store new ones"
+    )
+
+
+def apply_cache_arguments(args):
+    """Apply parsed --no-cache / --cache-readonly switches to Config."""
+    if args.no_cache:
+        Config.LM_CACHE_MODE = "off"
+        Config.JUDGE_CACHE_MODE = "off"
+    elif args.cache_readonly:
+        Config.LM_CACHE_MODE = "readonly"
+        Config.JUDGE_CACHE_MODE = "readonly"
+
+
+def enable_mlflow_autolog():
+    """Point MLflow at the configured tracking server (or offline store) and autolog DSPy calls."""
+    import mlflow
+
+    mlflow.set_tracking_uri(Config.mlflow_tracking_uri())
+    mlflow.dspy.autolog()
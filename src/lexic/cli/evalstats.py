@@ -0,0 +1,79 @@
+"""``lexic eval-stats``: summarize and compare earlier evaluation runs."""
+
+from pathlib import Path
+
+from lexic.shared.config import Config
+
+
+EPILOG = """examples:
+  lexic eval-stats data/eval_runs/qualification_*
+  lexic eval-stats data/eval_runs/qualification_20250102_* --baseline data/eval_runs/qualification_20250101_120000
+"""
+
+
+def add_arguments(parser):
+    """Add the eval-stats command's arguments."""
+    parser.add_argument(
+        "run_dirs",
+        nargs="+",
+        help="Output directories of step runs (data/eval_runs/<step>_<timestamp>)"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Run directory to compute paired differences against"
+    )
+    parser.add_argument(
+        "--resamples",
+        type=int,
+        default=2000,
+        help="Bootstrap resamples per interval (default: 2000)"
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level of the intervals (default: 0.95)"
+    )
+
+
+def run(args) -> int:
+    """Print the mean score, its interval, per-party means and the difference from a baseline per run."""
+    from lexic.evals.sampling import case_strata
+    from lexic.evals.stats import ScoreMatrix, format_interval, summarize_matrix
+    from lexic.shared.case_store import get_case_store
+
+    store = get_case_store(Config.SYNTHETIC_CASES_DIR)
+
+    def load(run_dir: str) -> ScoreMatrix:
+        matrix = ScoreMatrix.from_run_dir(Path(run_dir))
+        matrix.set_strata(case_strata(matrix.case_ids, store))
+        return matrix
+
+    baseline = load(args.baseline) if args.baseline else None
+    status = 0
+    for run_dir in args.run_dirs:
+        try:
+            matrix = load(run_dir)
+        except FileNotFoundError as e:
+            print(f"✗ {e}")
+            status = 1
+            continue
+
+        summary = summarize_matrix(matrix, baseline, args.resamples, args.confidence)
+        parties = ", ".join(
+            f"{party or '-'} {stats['mean_overall_score']:.2f}"
+            for party, stats in summary["by_party"].items()
+        )
+        line = (
+            f"{Path(run_dir).name}: n={len(matrix.case_ids)}, "
+            f"mean {summary['mean_overall_score']:.2f} {format_interval(**summary['overall_ci'])} ({parties})"
+        )
+        if baseline is not None:
+            delta = summary["baseline"]["overall"]
+            line += (
+                f", Δ {delta['mean']:+.2f} {format_interval(delta['ci_low'], delta['ci_high'], signed=True)}"
+                f" over {summary['baseline']['n_paired']} cases"
+            )
+        print(line)
+    return status
@@ -0,0 +1,243 @@
+"""``lexic eval``: run evaluations on a pipeline step."""
+
+from pathlib import Path
+
+from lexic.agents.registry import AGENT_CLASSES
+from lexic.cli.common import add_cache_arguments, apply_cache_arguments, enable_mlflow_autolog
+from lexic.shared.config import Config
+
+
+# All available steps (in pipeline order)
+ALL_STEPS = list(AGENT_CLASSES)
+
+
+def add_arguments(parser):
+    """Add the eval command's arguments."""
+    parser.add_argument(
+        "--step",
+        default="all",
+        choices=ALL_STEPS + ["all"],
+        help="Pipeline step to evaluate (default: all)"
+    )
+    parser.add_argument(
+        "--n-cases",
+        type=int,
+        default=None,
+        help="Number of cases to evaluate (default: all)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of cases to evaluate concurrently; with --step all, the number of "
+             "(case, step) pairs in flight in total (default: 1)"
+    )
+    parser.add_argument(
+        "--judge-mode",
+        default=None,
+        choices=["per_dimension", "single_call"],
+        help="Score each rubric dimension in its own call, or all dimensions and critical "
+             "errors in one call (default: JUDGE_MODE from config)"
+    )
+    parser.add_argument(
+        "--triage",
+        default=None,
+        choices=["off", "shadow", "on"],
+        help="Pre-score outputs to skip the judge on empty ones and judge close matches in one "
+             "call (on), or only log what triage would decide (shadow) (default: TRIAGE_MODE from config)"
+    )
+    sampling = parser.add_argument_group(
+        "sampling",
+        "Evaluate cases in random order stratified by source decision and party, so "
+        "--n-cases picks a balanced subset, and optionally stop early"
+    )
+    sampling.add_argument(
+        "--sample",
+        action="store_true",
+        help="Evaluate cases in random stratified order (implied by --target-width and --baseline-run)"
+    )
+    sampling.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed of the case order (default: random, printed and logged)"
+    )
+    sampling.add_argument(
+        "--target-width",
+        type=float,
+        default=None,
+        help="Stop once the confidence interval of the mean overall score is narrower than this"
+    )
+    sampling.add_argument(
+        "--baseline-run",
+        default=None,
+        help="Output directory of an earlier run of the step (data/eval_runs/<step>_<timestamp>): "
+             "report paired differences from its scores and stop once they are significant"
+    )
+    sampling.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level of the intervals (default: 0.95)"
+    )
+    sampling.add_argument(
+        "--min-cases",
+        type=int,
+        default=10,
+        help="Cases evaluated before stopping early (default: 10)"
+    )
+    parser.add_argument(
+        "--experiment",
+        default=None,
+        help="MLFlow experiment name (default: from config)"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Log runs to the local MLFlow store (MLFLOW_OFFLINE_URI) instead of the tracking "
+             "server; copy them later with `lexic mlflow-sync`"
+    )
+    parser.add_argument(
+        "--optimized-dir",
+        default=None,
+        help="Directory of optimized agent states (<step_name>.json) to load at startup "
+             "(default: OPTIMIZED_PROGRAMS_DIR from config)"
+    )
+    add_cache_arguments(parser)
+
+
+def run(args) -> int:
+    """Main evaluation workflow."""
+    apply_cache_arguments(args)
+    if args.workers < 1:
+        args.subparser.error("--workers must be at least 1")
+    if args.judge_mode:
+        Config.JUDGE_MODE = args.judge_mode
+    if args.offline:
+        Config.MLFLOW_OFFLINE = True
+    if args.triage:
+        Config.TRIAGE_MODE = args.triage
+    sequential = args.target_width is not None or args.baseline_run is not None
+    if sequential and args.step == "all":
+        args.subparser.error("--target-width and --baseline-run need a single --step")
+    if not 0 < args.confidence < 1:
+        args.subparser.error("--confidence must be between 0 and 1")
+
+    # Determine which steps to run
+    steps_to_run = ALL_STEPS if args.step == "all" else [args.step]
+
+    # Validate config
+    Config.validate()
+
+    import dspy
+    from lexic.agents.registry import get_registry
+    from lexic.evals.orchestrator import run_all_evaluations, run_evaluation
+    from lexic.evals.sampling import SequentialSampler
+    from lexic.evals.stats import ScoreMatrix
+    from lexic.shared.case_store import format_case_store_stats, get_case_store
+    from lexic.shared.lm import build_lm, format_cache_stats
+    from lexic.shared.rate_limit import format_rate_limit_stats, get_rate_limiter
+
+    # Configure DSPy with Anthropic for agents
+    agent_lm = build_lm(
+        Config.DEFAULT_MODEL,
+        temperature=Config.TEMPERATURE,
+        max_tokens=32000  # Increase for generation
+    )
+
+    # Enable MLflow autologging for DSPy
+    enable_mlflow_autolog()
+
+    dspy.configure(lm=agent_lm)
+
+    # Configure separate LM for judge
+    judge_lm = build_lm(
+        Config.JUDGE_MODEL,
+        temperature=Config.JUDGE_TEMPERATURE
+    )
+
+    # Build agents once, loading optimized program states if provided
+    if args.optimized_dir:
+        loaded = get_registry().load_optimized(Path(args.optimized_dir))
+        print(f"Loaded optimized agents: {', '.join(loaded) if loaded else 'none'}")
+
+    # Note: We'll use the agent_lm for both for now
+    # In production, you might want to configure separate adapters
+
+    baseline = ScoreMatrix.from_run_dir(Path(args.baseline_run)) if args.baseline_run else None
+    sampler = None
+    if args.sample or args.seed is not None or sequential:
+        sampler = SequentialSampler(
+            target_width=args.target_width,
+            baseline_scores=baseline.overall_by_case() if baseline else None,
+            confidence=args.confidence,
+            min_cases=args.min_cases,
+            seed=args.seed
+        )
+
+    print("=" * 60)
+    if args.step == "all":
+        print("Evaluation: All Steps")
+    else:
+        print(f"Evaluation: {args.step}")
+    print("=" * 60)
+    print(f"Agent model: {Config.DEFAULT_MODEL}")
+    print(f"Judge model: {Config.JUDGE_MODEL}")
+    print(f"Judge mode: {Config.JUDGE_MODE}")
+    if Config.TRIAGE_MODE != "off":
+        print(f"Triage: {Config.TRIAGE_MODE}")
+    print(f"Cases directory: {Config.SYNTHETIC_CASES_DIR}")
+    if args.n_cases:
+        print(f"Number of cases: {args.n_cases}")
+    print(f"Workers: {args.workers}")
+    if args.target_width is not None:
+        print(f"Target CI width: {args.target_width}")
+    if args.baseline_run:
+        print(f"Baseline run: {args.baseline_run}")
+    if Config.MLFLOW_OFFLINE:
+        print(f"MLFlow: offline ({Config.MLFLOW_OFFLINE_URI})")
+    if args.step == "all":
+        print(f"Steps to evaluate: {', '.join(steps_to_run)}")
+    print()
+
+    # Run evaluation: all steps in one pass over the cases, or a single step
+    if args.step == "all":
+        all_summaries = run_all_evaluations(
+            step_names=steps_to_run,
+            n_cases=args.n_cases,
+            experiment_name=args.experiment,
+            workers=args.workers,
+            sampler=sampler
+        )
+    else:
+        all_summaries = {
+            args.step: run_evaluation(
+                step_name=args.step,
+                n_cases=args.n_cases,
+                experiment_name=args.experiment,
+                workers=args.workers,
+                sampler=sampler,
+                baseline=baseline
+            )
+        }
+
+    for step_name, summary in all_summaries.items():
+        if summary:
+            print(f"\nDimension scores for {step_name}:")
+            for dim, score in summary['dimension_means'].items():
+                print(f"  {dim}: {score:.2f}/5.00")
+
+    # Print overall summary if running all steps
+    if args.step == "all":
+        print(f"\n{'='*60}")
+        print("OVERALL SUMMARY")
+        print(f"{'='*60}\n")
+        for step_name, summary in all_summaries.items():
+            if summary:
+                print(f"{step_name}: {summary['mean_overall_score']:.2f}/5.00")
+        print()
+
+    print(format_cache_stats())
+    print(format_case_store_stats(get_case_store().stats()))
+    print(format_rate_limit_stats(get_rate_limiter().stats()))
+    return 0
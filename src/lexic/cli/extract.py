@@ -0,0 +1,49 @@
+"""``lexic extract``: extract court decision PDFs to structured markdown files."""
+
+from lexic.cli.common import add_cache_arguments, apply_cache_arguments, enable_mlflow_autolog
+from lexic.shared.config import Config
+
+
+def add_arguments(parser):
+    """Add the extract command's arguments."""
+    add_cache_arguments(parser)
+
+
+def run(args) -> int:
+    """Main extraction workflow."""
+    apply_cache_arguments(args)
+
+    # Validate config
+    Config.validate()
+
+    import dspy
+    from lexic.shared.lm import build_lm, format_cache_stats
+    from lexic.shared.rate_limit import format_rate_limit_stats, get_rate_limiter
+    from lexic.synthetic_data.extract import extract_all_decisions
+
+    # Configure DSPy with Anthropic
+    lm = build_lm(
+        Config.EXTRACTION_MODEL,
+        temperature=Config.TEMPERATURE,
+        max_tokens=32000  # Increase for generation
+    )
+
+    # Enable MLflow autologging for DSPy
+    enable_mlflow_autolog()
+
+    dspy.configure(lm=lm)
+
+    print("=" * 60)
+    print("Court Decision Extraction")
+    print("=" * 60)
+    print(f"Model: {Config.EXTRACTION_MODEL}")
+    print(f"Input directory: {Config.COURT_DECISIONS_DIR}")
+    print()
+
+    # Extract all decisions
+    extract_all_decisions(Config.COURT_DECISIONS_DIR)
+
+    print("\n✓ Extraction complete!")
+    print(format_cache_stats())
+    print(format_rate_limit_stats(get_rate_limiter().stats()))
+    return 0
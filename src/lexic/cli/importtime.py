@@ -0,0 +1,174 @@
+"""``lexic importtime``: report the import time of Lexic entry points.
+
+Each module is imported in a fresh interpreter under ``python -X importtime``
+and the per-module timings are parsed from its stderr, so results are not
+skewed by anything the current process has already imported.
+"""
+
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import List
+
+
+# Modules measured when none are given on the command line
+DEFAULT_MODULES = [
+    "lexic.cli",
+    "lexic.agents",
+    "lexic.agents.pipeline",
+    "lexic.evals.orchestrator",
+    "lexic.synthetic_data.generate",
+    "lexic.synthetic_data.extract",
+]
+
+# Dependencies that cost seconds to import and should only load when needed
+HEAVY_PACKAGES = ["dspy", "litellm", "mlflow", "docling", "torch"]
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """
+    Parse the stderr of ``python -X importtime``.
+
+    Args:
+        stderr: Captured stderr
+
+    Returns:
+        Import records in the order they were reported
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name_field = fields[2].rstrip()
+        name = name_field.lstrip()
+        # Nested imports are indented by two spaces per level after one leading space
+        depth = (len(name_field) - len(name) - 1) // 2
+        records.append(ImportRecord(
+            name=name,
+            self_us=int(fields[0]),
+            cumulative_us=int(fields[1]),
+            depth=depth
+        ))
+    return records
+
+
+def measure_import(module: str) -> List[ImportRecord]:
+    """
+    Import a module in a fresh interpreter and collect its import timings.
+
+    Args:
+        module: Dotted module name, or "" for interpreter startup only
+
+    Returns:
+        Import records
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}" if module else "pass"],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(errors[-1] if errors else f"import {module} failed")
+    return parse_importtime(result.stderr)
+
+
+def total_import_ms(module: str, records: List[ImportRecord]) -> float:
+    """Cumulative import time of a module, including its parent packages."""
+    parents = {".".join(module.split(".")[:i]) for i in range(1, module.count(".") + 2)}
+    return sum(
+        record.cumulative_us for record in records
+        if record.depth == 0 and record.name in parents
+    ) / 1000
+
+
+def measure_help_ms() -> float:
+    """Wall time of ``lexic --help`` in a fresh interpreter."""
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "lexic.cli", "--help"],
+        capture_output=True
+    )
+    return (time.perf_counter() - started) * 1000
+
+
+def add_arguments(parser):
+    """Add the importtime command's arguments."""
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        metavar="MODULE",
+        help=f"Modules to measure (default: {', '.join(DEFAULT_MODULES)})"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of slowest individual imports to list per module (default: 10)"
+    )
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="Exit with status 1 if any module takes longer than this to import"
+    )
+
+
+def run(args) -> int:
+    """Measure and report import times."""
+    modules = args.modules or DEFAULT_MODULES
+    over_budget = []
+    # Modules every interpreter loads at startup are not attributed to Lexic
+    startup = {record.name for record in measure_import("")}
+
+    print("=" * 60)
+    print("Import Time Report")
+    print("=" * 60)
+    print(f"Python: {sys.executable}")
+    print(f"lexic --help wall time: {measure_help_ms():.0f} ms")
+    print()
+
+    for module in modules:
+        try:
+            records = measure_import(module)
+        except RuntimeError as e:
+            print(f"{module}: ✗ {e}\n")
+            over_budget.append(module)
+            continue
+
+        total_ms = total_import_ms(module, records)
+        records = [record for record in records if record.name not in startup]
+        imported = {record.name.split(".")[0] for record in records}
+        heavy = [package for package in HEAVY_PACKAGES if package in imported]
+
+        print(f"{module}: {total_ms:.0f} ms ({len(records)} modules)")
+        print(f"  Heavy dependencies loaded: {', '.join(heavy) if heavy else 'none'}")
+        if args.top > 0:
+            print("  Slowest imports (self time):")
+            for record in sorted(records, key=lambda r: -r.self_us)[:args.top]:
+                print(f"    {record.self_us / 1000:8.1f} ms  {record.name}")
+        print()
+
+        if args.max_ms is not None and total_ms > args.max_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"✗ Over budget or failed: {', '.join(over_budget)}")
+        return 1
+    return 0
@@ -0,0 +1,56 @@
+"""``lexic judge-bench``: compare the single-call and per-dimension judges."""
+
+from lexic.agents.registry import AGENT_CLASSES
+from lexic.cli.common import add_cache_arguments, apply_cache_arguments
+from lexic.shared.config import Config
+
+
+def add_arguments(parser):
+    """Add the judge-bench command's arguments."""
+    parser.add_argument(
+        "--step",
+        required=True,
+        choices=list(AGENT_CLASSES),
+        help="Pipeline step whose rubric is used"
+    )
+    parser.add_argument(
+        "--n-cases",
+        type=int,
+        default=None,
+        help="Number of cases to judge (default: all)"
+    )
+    add_cache_arguments(parser)
+
+
+def run(args) -> int:
+    """Judge the same predictions with both judge modes and report the differences."""
+    apply_cache_arguments(args)
+    # Cached verdicts would hide the calls being compared
+    Config.JUDGE_CACHE_MODE = "off"
+    Config.validate()
+
+    import dspy
+    from lexic.evals.judges.benchmark import benchmark_judge_modes, format_judge_benchmark
+    from lexic.shared.lm import build_lm
+
+    dspy.configure(lm=build_lm(
+        Config.DEFAULT_MODEL,
+        temperature=Config.TEMPERATURE,
+        max_tokens=32000
+    ))
+
+    print("=" * 60)
+    print(f"Judge Benchmark: {args.step}")
+    print("=" * 60)
+    print(f"Agent model: {Config.DEFAULT_MODEL}")
+    print(f"Cases directory: {Config.SYNTHETIC_CASES_DIR}")
+    print()
+
+    report = benchmark_judge_modes(args.step, n_cases=args.n_cases)
+    if not report["case_ids"]:
+        print("No cases judged")
+        return 1
+
+    print()
+    print(format_judge_benchmark(report))
+    return 0
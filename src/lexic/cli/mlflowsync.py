@@ -0,0 +1,37 @@
+"""``lexic mlflow-sync``: copy runs logged offline to the MLFlow tracking server."""
+
+from lexic.shared.config import Config
+
+
+def add_arguments(parser):
+    """Add the mlflow-sync command's arguments."""
+    parser.add_argument(
+        "--experiment",
+        default=None,
+        help="Only sync this experiment (default: all)"
+    )
+    parser.add_argument(
+        "--source",
+        default=None,
+        help="Offline store URI (default: MLFLOW_OFFLINE_URI from config)"
+    )
+    parser.add_argument(
+        "--target",
+        default=None,
+        help="Tracking server URI (default: MLFLOW_TRACKING_URI from config)"
+    )
+
+
+def run(args) -> int:
+    """Copy finished offline runs that were not synced yet."""
+    from lexic.evals.tracking import sync_offline_runs
+
+    source = args.source or Config.MLFLOW_OFFLINE_URI
+    target = args.target or Config.MLFLOW_TRACKING_URI
+    print(f"Syncing MLFlow runs from {source} to {target}")
+
+    synced = sync_offline_runs(args.experiment, source_uri=source, target_uri=target)
+    for run in synced:
+        print(f"  ✓ {run['experiment']}/{run['run_name']}: {run['offline_run_id']} → {run['run_id']}")
+    print(f"{len(synced)} run(s) synced")
+    return 0
@@ -0,0 +1,481 @@
+"""``lexic run``: run the full Lexic pipeline on synthetic case data."""
+
+import asyncio
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from lexic.cli.common import add_cache_arguments, apply_cache_arguments
+from lexic.shared.config import Config
+from lexic.shared.case_store import format_case_store_stats, get_case_store
+
+if TYPE_CHECKING:
+    from lexic.agents.pipeline import LexicPipeline
+    from lexic.agents.run import PipelineRun
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration in seconds as e.g. '1h02m', '4m05s' or '12.3s'."""
+    if seconds >= 3600:
+        return f"{int(seconds // 3600)}h{int(seconds % 3600 // 60):02d}m"
+    if seconds >= 60:
+        return f"{int(seconds // 60)}m{int(seconds % 60):02d}s"
+    return f"{seconds:.1f}s"
+
+
+class ProgressTracker:
+    """Track completed cases and print a throughput/ETA line after each one."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.started_at = time.monotonic()
+        self.wall_times: Dict[str, float] = {}
+        self.failed: List[str] = []
+
+    def case_done(self, case_id: str, wall_time: float, ok: bool = True):
+        """Record a finished case and print the live progress line."""
+        self.wall_times[case_id] = wall_time
+        if not ok:
+            self.failed.append(case_id)
+
+        done = len(self.wall_times)
+        elapsed = time.monotonic() - self.started_at
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - done) / rate if rate > 0 else 0.0
+        status = "done" if ok else "FAILED"
+        print(
+            f"[{done}/{self.total}] {case_id} {status} in {format_duration(wall_time)}"
+            f" | {rate * 60:.2f} cases/min | elapsed {format_duration(elapsed)}"
+            f" | ETA {format_duration(eta)}"
+        )
+
+    def print_report(self):
+        """Print per-case wall times, slowest first."""
+        if not self.wall_times:
+            return
+        print("Per-case wall time:")
+        for case_id, wall_time in sorted(self.wall_times.items(), key=lambda x: -x[1]):
+            marker = "  ✗" if case_id in self.failed else ""
+            print(f"  {case_id}: {format_duration(wall_time)}{marker}")
+        print(f"Total wall time: {format_duration(time.monotonic() - self.started_at)}")
+
+
+def load_case_inputs(case_dir: Path) -> Dict[str, str]:
+    """Load the client persona, initial facts and client request of a case."""
+    store = get_case_store(case_dir.parent)
+    _, client_persona = store.read(case_dir.name, "00a_client_persona.md")
+    _, initial_facts = store.read(case_dir.name, "00b_initial_facts_known.md")
+    _, client_request = store.read(case_dir.name, "01_client_request.md")
+    return {
+        "client_persona": client_persona,
+        "initial_facts": initial_facts,
+        "client_request": client_request,
+    }
+
+
+def run_pipeline_on_case(
+    case_dir: Path,
+    output_dir: Path,
+    pipeline: Optional["LexicPipeline"] = None,
+    resume: bool = False,
+    runs: Optional[List["PipelineRun"]] = None
+) -> dict:
+    """
+    Run the full pipeline on a single case, saving outputs after each step.
+
+    Args:
+        case_dir: Path to the case directory
+        output_dir: Path to save pipeline outputs
+        pipeline: Pipeline instance to reuse (default: build a new one)
+        resume: Whether to reuse step outputs already in output_dir whose
+            input hash still matches (default: False)
+        runs: List to append the case's PipelineRun to, for its trace
+
+    Returns:
+        Dictionary with all pipeline outputs
+    """
+    # Load inputs
+    inputs = load_case_inputs(case_dir)
+    client_persona = inputs["client_persona"]
+    initial_facts = inputs["initial_facts"]
+    client_request = inputs["client_request"]
+
+    print(f"Running pipeline for case: {case_dir.name}")
+    print(f"  Client persona loaded: {len(client_persona)} chars")
+    print(f"  Initial facts loaded: {len(initial_facts)} chars")
+    print(f"  Client request loaded: {len(client_request)} chars")
+    print()
+
+    from lexic.agents.pipeline import LexicPipeline
+    from lexic.agents.run import PipelineRun
+    from lexic.shared.lm import format_usage_summary
+
+    # Initialize pipeline
+    if pipeline is None:
+        pipeline = LexicPipeline()
+
+    # Create output directory
+    output_dir.mkdir(parents=True, exist_ok=True)
+    run = PipelineRun(case_id=case_dir.name, output_dir=output_dir, resume=resume)
+    if runs is not None:
+        runs.append(run)
+
+    # Run pipeline step by step; the run saves each step as it completes
+    print("Running pipeline with incremental saves...")
+    all_results = {}
+
+    # Phase 1: Intake to analysis
+    print("  [1/4] Running intake & analysis phase...")
+    phase1 = pipeline.run_intake_to_analysis(client_request, run=run)
+    all_results.update(phase1)
+
+    # Phase 2: Investigation
+    print("  [2/4] Running investigation phase...")
+    phase2 = pipeline.run_investigation_phase(
+        phase1["initial_analysis"],
+        client_persona,
+        initial_facts,
+        run=run
+    )
+    all_results.update(phase2)
+
+    # Phase 3: Legal analysis
+    print("  [3/4] Running legal analysis phase...")
+    phase3 = pipeline.run_legal_analysis(phase2["factual_record"], run=run)
+    all_results.update(phase3)
+
+    # Phase 4: Final phase
+    print("  [4/4] Running final phase...")
+    phase4 = pipeline.run_final_phase(
+        phase3["legal_arguments"],
+        phase2["factual_record"],
+        phase1["qualification"],
+        use_predicted_judgment=True,
+        run=run
+    )
+    all_results.update(phase4)
+
+    if resume:
+        print(f"\n  Reused {len(run.reused_steps)} step(s), computed {len(run.computed_steps)}")
+    if pipeline.prefix_cache:
+        print(f"\n  {format_usage_summary(run.usage_summary())}")
+    print(f"\n✓ All outputs saved to: {output_dir}")
+    return all_results
+
+
+async def arun_pipeline_on_case(
+    pipeline: "LexicPipeline",
+    case_dir: Path,
+    output_dir: Path,
+    resume: bool = False,
+    runs: Optional[List["PipelineRun"]] = None
+) -> dict:
+    """
+    Run the full pipeline on a single case asynchronously.
+
+    Same phases, incremental saves and resume behaviour as
+    :func:`run_pipeline_on_case`, with progress lines prefixed by the case ID
+    since several cases interleave.
+
+    Args:
+        pipeline: Shared pipeline instance
+        case_dir: Path to the case directory
+        output_dir: Path to save pipeline outputs
+        resume: Whether to reuse valid step outputs in output_dir (default: False)
+        runs: List to append the case's PipelineRun to, for its trace
+
+    Returns:
+        Dictionary with all pipeline outputs
+    """
+    from lexic.agents.run import PipelineRun
+    from lexic.shared.lm import format_usage_summary
+
+    case_id = case_dir.name
+    inputs = load_case_inputs(case_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    run = PipelineRun(case_id=case_id, output_dir=output_dir, resume=resume)
+    if runs is not None:
+        runs.append(run)
+    all_results = {}
+
+    print(f"  [{case_id}] [1/4] Running intake & analysis phase...")
+    phase1 = await pipeline.arun_intake_to_analysis(inputs["client_request"], run=run)
+    all_results.update(phase1)
+
+    print(f"  [{case_id}] [2/4] Running investigation phase...")
+    phase2 = await pipeline.arun_investigation_phase(
+        phase1["initial_analysis"],
+        inputs["client_persona"],
+        inputs["initial_facts"],
+        run=run
+    )
+    all_results.update(phase2)
+
+    print(f"  [{case_id}] [3/4] Running legal analysis phase...")
+    phase3 = await pipeline.arun_legal_analysis(phase2["factual_record"], run=run)
+    all_results.update(phase3)
+
+    print(f"  [{case_id}] [4/4] Running final phase...")
+    phase4 = await pipeline.arun_final_phase(
+        phase3["legal_arguments"],
+        phase2["factual_record"],
+        phase1["qualification"],
+        use_predicted_judgment=True,
+        run=run
+    )
+    all_results.update(phase4)
+
+    if pipeline.prefix_cache:
+        print(f"  [{case_id}] {format_usage_summary(run.usage_summary())}")
+    return all_results
+
+
+async def run_cases_concurrently(
+    case_dirs: List[Path],
+    output_base: Path,
+    workers: int,
+    progress: ProgressTracker,
+    resume: bool = False,
+    prefix_cache: bool = False,
+    runs: Optional[List["PipelineRun"]] = None
+) -> Dict[str, dict]:
+    """
+    Run the pipeline on many cases with at most ``workers`` in flight.
+
+    All cases share one pipeline instance and one event loop.
+
+    Returns:
+        Dict mapping case ID to pipeline outputs, for successful cases only
+    """
+    from lexic.agents.pipeline import LexicPipeline
+
+    pipeline = LexicPipeline(prefix_cache=prefix_cache)
+    semaphore = asyncio.Semaphore(workers)
+    all_results = {}
+
+    async def run_one(case_dir: Path):
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                all_results[case_dir.name] = await arun_pipeline_on_case(
+                    pipeline, case_dir, output_base / case_dir.name, resume=resume, runs=runs
+                )
+                ok = True
+            except Exception as e:
+                print(f"Error running pipeline on {case_dir.name}: {e}")
+                import traceback
+                traceback.print_exc()
+                ok = False
+            progress.case_done(case_dir.name, time.monotonic() - started, ok=ok)
+
+    await asyncio.gather(*(run_one(case_dir) for case_dir in case_dirs))
+    return all_results
+
+
+def add_arguments(parser):
+    """Add the run command's arguments."""
+    parser.add_argument(
+        "--case",
+        default=None,
+        help="Specific case ID to run (e.g., case_001_pl). If not specified, runs on all cases."
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Output directory for results (default: data/pipeline_runs/<timestamp>)"
+    )
+    parser.add_argument(
+        "--resume",
+        default=None,
+        metavar="OUTPUT_DIR",
+        help="Resume an interrupted run: reuse step outputs in OUTPUT_DIR whose input hash "
+             "still matches and recompute from the first missing or stale step"
+    )
+    parser.add_argument(
+        "--n-cases",
+        type=int,
+        default=None,
+        help="Number of cases to run (default: all)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of cases to run concurrently (default: 1)"
+    )
+    parser.add_argument(
+        "--prefix-cache",
+        action="store_true",
+        help="Send the factual record, legal basis and arguments as a cacheable prompt prefix "
+             "shared across stages, and report prefix reuse per case"
+    )
+    parser.add_argument(
+        "--small-model",
+        default=None,
+        metavar="MODEL",
+        help="Route mechanical stages and low-complexity cases to this model "
+             "(default: SMALL_MODEL; considerations and judgment always use the default model)"
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Send a duplicate request when a stage runs past its p95 latency and keep the "
+             "first answer (default: HEDGE_REQUESTS)"
+    )
+    parser.add_argument(
+        "--mlflow",
+        action="store_true",
+        help="Log per-stage latency, token and cost metrics to MLflow"
+    )
+    parser.add_argument(
+        "--experiment",
+        default=None,
+        help="MLFlow experiment name for --mlflow (default: from config)"
+    )
+    add_cache_arguments(parser)
+
+
+def run(args) -> int:
+    """Main pipeline workflow."""
+    apply_cache_arguments(args)
+    if args.workers < 1:
+        args.subparser.error("--workers must be at least 1")
+    if args.resume and args.output_dir:
+        args.subparser.error("--resume and --output-dir are mutually exclusive")
+
+    if args.hedge:
+        Config.HEDGE_REQUESTS = True
+    if args.small_model:
+        Config.SMALL_MODEL = args.small_model
+
+    # Validate config
+    Config.validate()
+
+    import dspy
+    from lexic.agents.pipeline import LexicPipeline
+    from lexic.agents.resilience import format_hedge_stats, get_stage_resilience
+    from lexic.agents.routing import format_routing_summary
+    from lexic.agents.tracing import format_stage_report, log_traces_to_mlflow, stage_statistics
+    from lexic.shared.lm import (
+        build_lm, format_cache_stats, format_usage_summary, summarize_usage, track_lm_usage
+    )
+    from lexic.shared.rate_limit import format_rate_limit_stats, get_rate_limiter
+
+    # Configure DSPy with Anthropic
+    lm = build_lm(
+        Config.DEFAULT_MODEL,
+        temperature=Config.TEMPERATURE,
+        max_tokens=32000
+    )
+    dspy.configure(lm=lm)
+
+    # Determine output directory
+    if args.resume:
+        output_base = Path(args.resume)
+        if not output_base.exists():
+            print(f"Error: Resume directory not found: {output_base}")
+            return 1
+    elif args.output_dir:
+        output_base = Path(args.output_dir)
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_base = Config.DATA_DIR / "pipeline_runs" / timestamp
+
+    print("=" * 60)
+    print("Lexic Full Pipeline Runner")
+    print("=" * 60)
+    print(f"Model: {Config.DEFAULT_MODEL}")
+    print(f"Output directory: {output_base}")
+    print(f"Workers: {args.workers}")
+    if args.resume:
+        print("Mode: resume")
+    print()
+
+    # Get list of cases
+    if args.case:
+        # Run on specific case
+        case_dir = Config.SYNTHETIC_CASES_DIR / args.case
+        if not case_dir.exists():
+            print(f"Error: Case directory not found: {case_dir}")
+            return 1
+
+        case_dirs = [case_dir]
+    else:
+        # Run on all cases
+        case_ids = get_case_store(Config.SYNTHETIC_CASES_DIR).list_cases()
+        if args.n_cases:
+            case_ids = case_ids[:args.n_cases]
+        # Convert case IDs to Path objects
+        case_dirs = [Config.SYNTHETIC_CASES_DIR / case_id for case_id in case_ids]
+
+    print(f"Running pipeline on {len(case_dirs)} case(s)\n")
+
+    progress = ProgressTracker(total=len(case_dirs))
+    runs = []
+
+    with track_lm_usage() as usage:
+        if args.workers > 1:
+            # Run cases concurrently on one event loop with a shared pipeline
+            all_results = asyncio.run(
+                run_cases_concurrently(
+                    case_dirs, output_base, args.workers, progress,
+                    resume=bool(args.resume), prefix_cache=args.prefix_cache, runs=runs
+                )
+            )
+            print()
+        else:
+            # Run pipeline on each case
+            pipeline = LexicPipeline(prefix_cache=args.prefix_cache)
+            all_results = {}
+            for case_dir in case_dirs:
+                case_output_dir = output_base / case_dir.name
+                started = time.monotonic()
+                try:
+                    results = run_pipeline_on_case(
+                        case_dir, case_output_dir, pipeline, resume=bool(args.resume), runs=runs
+                    )
+                    all_results[case_dir.name] = results
+                    progress.case_done(case_dir.name, time.monotonic() - started)
+                    print()
+                except Exception as e:
+                    print(f"Error running pipeline on {case_dir.name}: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    progress.case_done(case_dir.name, time.monotonic() - started, ok=False)
+                    print()
+
+    # Summary
+    print("=" * 60)
+    print(f"Completed {len(all_results)}/{len(case_dirs)} cases successfully")
+    print("=" * 60)
+    progress.print_report()
+    print(format_cache_stats())
+    print(format_case_store_stats(get_case_store().stats()))
+    print(format_rate_limit_stats(get_rate_limiter().stats()))
+    if Config.HEDGE_REQUESTS:
+        print(format_hedge_stats(get_stage_resilience().stats()))
+    print(format_usage_summary(summarize_usage(usage)))
+    print()
+
+    # Per-stage latency, token and cost breakdown
+    traces = [pipeline_run.trace() for pipeline_run in runs]
+    print(format_stage_report(stage_statistics(traces)))
+    if Config.SMALL_MODEL or Config.STAGE_MODELS:
+        print(format_routing_summary(traces))
+    if args.mlflow:
+        mlflow_run_id = log_traces_to_mlflow(
+            traces,
+            experiment_name=args.experiment,
+            run_name=f"pipeline_{output_base.name}",
+            params={
+                "workers": args.workers,
+                "prefix_cache": args.prefix_cache,
+                "hedge": Config.HEDGE_REQUESTS,
+                "small_model": Config.SMALL_MODEL or "none",
+                "output_dir": str(output_base),
+            }
+        )
+        print(f"MLFlow run: {mlflow_run_id}")
+    print()
+    return 0
@@ -0,0 +1,153 @@
+"""Benchmark of the single-call judge against the per-dimension judge."""
+
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from lexic.evals.judges.judge import JUDGE_MODES, evaluate_output
+from lexic.evals.orchestrator import STEP_GROUND_TRUTH, run_agent_on_case
+from lexic.shared.config import Config
+from lexic.shared.case_store import get_case_store
+from lexic.shared.io import get_case_path
+from lexic.shared.lm import summarize_usage, track_lm_usage
+
+
+def agreement(baseline: List[Dict], candidate: List[Dict]) -> Dict[str, float]:
+    """
+    Measure how closely two judges' results on the same cases agree.
+
+    Args:
+        baseline: Evaluation results dicts of the reference judge
+        candidate: Evaluation results dicts of the other judge, in the same case order
+
+    Returns:
+        Dict with exact (share of dimension scores equal), within_one (share
+        at most one point apart), mean_abs_diff (mean absolute difference of
+        dimension scores) and overall_mean_abs_diff (of weighted overall scores)
+    """
+    diffs = [
+        abs(base["scores"][dim] - other["scores"][dim])
+        for base, other in zip(baseline, candidate)
+        for dim in base["scores"]
+    ]
+    overall_diffs = [
+        abs(base["overall_score"] - other["overall_score"])
+        for base, other in zip(baseline, candidate)
+    ]
+    if not diffs:
+        return {"exact": 0.0, "within_one": 0.0, "mean_abs_diff": 0.0, "overall_mean_abs_diff": 0.0}
+    return {
+        "exact": sum(diff == 0 for diff in diffs) / len(diffs),
+        "within_one": sum(diff <= 1 for diff in diffs) / len(diffs),
+        "mean_abs_diff": sum(diffs) / len(diffs),
+        "overall_mean_abs_diff": sum(overall_diffs) / len(overall_diffs),
+    }
+
+
+def benchmark_judge_modes(
+    step_name: str,
+    cases_dir: Optional[Path] = None,
+    n_cases: Optional[int] = None
+) -> Dict:
+    """
+    Judge the same agent predictions with every judge mode and compare them.
+
+    The agent runs once per case; each mode then judges its prediction
+    against the ground truth with LM usage tracked and wall time measured
+    around the judge alone.
+
+    Args:
+        step_name: Name of the pipeline step
+        cases_dir: Directory containing synthetic cases (default: from config)
+        n_cases: Number of cases to judge (default: all)
+
+    Returns:
+        Dict with step, case_ids, modes (per mode: results, usage from
+        summarize_usage, wall_s) and agreement of each other mode with
+        per_dimension (see :func:`agreement`)
+    """
+    if cases_dir is None:
+        cases_dir = Config.SYNTHETIC_CASES_DIR
+    store = get_case_store(cases_dir)
+    case_ids = store.list_cases()
+    if n_cases:
+        case_ids = case_ids[:n_cases]
+
+    modes = {mode: {"results": [], "records": [], "wall_s": 0.0} for mode in JUDGE_MODES}
+    judged = []
+    for case_id in case_ids:
+        case_dir = get_case_path(cases_dir, case_id)
+        try:
+            print(f"  Running agent on {case_id}...")
+            prediction = run_agent_on_case(step_name, case_dir)
+            _, ground_truth = store.read(case_id, STEP_GROUND_TRUTH[step_name])
+            case_results = {}
+            for mode in JUDGE_MODES:
+                print(f"  Judging {case_id} ({mode})...")
+                with track_lm_usage() as records:
+                    started = time.perf_counter()
+                    case_results[mode] = evaluate_output(step_name, prediction, ground_truth, mode=mode)
+                    wall_s = time.perf_counter() - started
+                modes[mode]["records"].extend(records)
+                modes[mode]["wall_s"] += wall_s
+        except Exception as e:
+            print(f"  ✗ Error benchmarking {case_id}: {e}")
+            continue
+        judged.append(case_id)
+        for mode, result in case_results.items():
+            modes[mode]["results"].append(result)
+
+    return {
+        "step": step_name,
+        "case_ids": judged,
+        "modes": {
+            mode: {
+                "results": data["results"],
+                "usage": summarize_usage(data["records"]),
+                "wall_s": data["wall_s"],
+            }
+            for mode, data in modes.items()
+        },
+        "agreement": {
+            mode: agreement(modes["per_dimension"]["results"], modes[mode]["results"])
+            for mode in JUDGE_MODES if mode != "per_dimension"
+        },
+    }
+
+
+def format_judge_benchmark(report: Dict) -> str:
+    """Format :func:`benchmark_judge_modes` as a per-mode table and agreement lines."""
+    n_cases = len(report["case_ids"])
+    lines = [
+        f"Judge modes on {report['step']} ({n_cases} cases)",
+        "",
+        f"{'mode':<15}{'calls':>7}{'input tok':>12}{'output tok':>12}{'cost $':>9}{'wall s':>9}{'mean':>7}",
+    ]
+    for mode, data in report["modes"].items():
+        usage = data["usage"]
+        scores = [result["overall_score"] for result in data["results"]]
+        mean = sum(scores) / len(scores) if scores else 0.0
+        lines.append(
+            f"{mode:<15}{usage['calls']:>7}{usage['prompt_tokens']:>12,}{usage['completion_tokens']:>12,}"
+            f"{usage['cost_usd']:>9.3f}{data['wall_s']:>9.1f}{mean:>7.2f}"
+        )
+        if usage["cached_responses"]:
+            lines.append(f"{'':<15}({usage['cached_responses']} responses from the local LM cache; use --no-cache)")
+
+    baseline = report["modes"]["per_dimension"]
+    for mode, scores in report["agreement"].items():
+        data = report["modes"][mode]
+        tokens = data["usage"]["prompt_tokens"] + data["usage"]["completion_tokens"]
+        baseline_tokens = baseline["usage"]["prompt_tokens"] + baseline["usage"]["completion_tokens"]
+        lines.append("")
+        lines.append(
+            f"{mode} vs per_dimension: {scores['exact']:.0%} of dimension scores equal, "
+            f"{scores['within_one']:.0%} within one point, mean |Δ| {scores['mean_abs_diff']:.2f} "
+            f"(overall {scores['overall_mean_abs_diff']:.2f})"
+        )
+        if baseline_tokens and baseline["wall_s"]:
+            lines.append(
+                f"  tokens {tokens / baseline_tokens:.0%} and wall time "
+                f"{data['wall_s'] / baseline['wall_s']:.0%} of per_dimension"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,118 @@
+"""Persistent cache of judge verdicts, keyed on what each verdict depends on."""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+import dspy
+
+from lexic.evals.judges.rubrics import EvaluationDimension, Rubric
+from lexic.shared.cache import CACHE_MODES, SQLiteCache, content_key
+from lexic.shared.config import Config
+from lexic.shared.prompts import get_prompt_registry
+
+
+def text_hash(text: str) -> str:
+    """Hex SHA-256 of a text."""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def _judge_fingerprint(prompt_name: str) -> Dict[str, Any]:
+    """Describe the judge LM and prompt a verdict was produced with."""
+    lm = dspy.settings.lm
+    return {
+        "model": getattr(lm, "model", None),
+        "temperature": getattr(lm, "kwargs", {}).get("temperature"),
+        "prompt": get_prompt_registry().content_hash("evals", prompt_name),
+    }
+
+
+def dimension_key(dim: EvaluationDimension, prediction: str, ground_truth: str) -> str:
+    """
+    Cache key of one dimension's verdict.
+
+    Depends on the judge LM and prompt, the dimension's own definition
+    (name, description, criteria, weight) and the prediction and ground
+    truth hashes, so editing one dimension leaves the others' keys intact.
+
+    Args:
+        dim: Rubric dimension
+        prediction: Agent's output
+        ground_truth: Ground truth reference
+
+    Returns:
+        Cache key
+    """
+    return content_key({
+        "kind": "dimension",
+        "judge": _judge_fingerprint("evaluate_dimension"),
+        "dimension": {
+            "name": dim.name,
+            "description": dim.description,
+            "criteria": {str(score): text for score, text in dim.criteria.items()},
+            "weight": dim.weight,
+        },
+        "prediction": text_hash(prediction),
+        "ground_truth": text_hash(ground_truth),
+    })
+
+
+def critical_errors_key(rubric: Rubric, prediction: str, ground_truth: str) -> str:
+    """Cache key of the critical-error pass, which sees the whole rubric."""
+    return content_key({
+        "kind": "critical_errors",
+        "judge": _judge_fingerprint("identify_critical_errors"),
+        "rubric": text_hash(rubric.to_text()),
+        "prediction": text_hash(prediction),
+        "ground_truth": text_hash(ground_truth),
+    })
+
+
+def single_call_key(rubric: Rubric, prediction: str, ground_truth: str) -> str:
+    """Cache key of a single-call judgment, which scores the whole rubric at once."""
+    return content_key({
+        "kind": "single_call",
+        "judge": _judge_fingerprint("evaluate_all_dimensions"),
+        "rubric": text_hash(rubric.to_text()),
+        "prediction": text_hash(prediction),
+        "ground_truth": text_hash(ground_truth),
+    })
+
+
+def format_judge_cache_stats(stats: Dict[str, float]) -> str:
+    """Format judge cache hit/miss counts as a one-line report."""
+    return (
+        f"Judge cache: {stats['hits']} hits, {stats['misses']} misses "
+        f"({stats['hit_rate']:.0%} hit rate)"
+    )
+
+
+_judge_cache: Optional[SQLiteCache] = None
+
+
+def get_judge_cache() -> Optional[SQLiteCache]:
+    """
+    Get the process-wide judge verdict cache, opening it on first use.
+
+    Honors ``Config.JUDGE_CACHE_MODE``: ``readwrite`` (default), ``readonly``
+    (serve hits, never write) or ``off``.
+
+    Returns:
+        Shared cache, or None when disabled
+    """
+    global _judge_cache
+
+    mode = Config.JUDGE_CACHE_MODE
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Unknown judge cache mode: {mode} (expected one of {', '.join(CACHE_MODES)})")
+    if mode == "off":
+        return None
+
+    if _judge_cache is None or _judge_cache.readonly != (mode == "readonly"):
+        # Verdicts stay valid as long as their inputs are unchanged: no age-based eviction
+        _judge_cache = SQLiteCache(
+            Config.JUDGE_CACHE_PATH,
+            max_size_mb=Config.LM_CACHE_MAX_SIZE_MB,
+            max_age_days=0,
+            readonly=(mode == "readonly")
+        )
+    return _judge_cache
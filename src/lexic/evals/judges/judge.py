@@ -1,14 +1,92 @@
 """LLM-as-judge implementation for evaluating agent outputs."""
 
+import asyncio
+import json
+import re
+import threading
 import dspy
-from typing import Dict, List
-from lexic.evals.judges.rubrics import Rubric, get_rubric
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from lexic.evals.judges.cache import critical_errors_key, dimension_key, get_judge_cache, single_call_key
+from lexic.evals.judges.rubrics import EvaluationDimension, Rubric, get_rubric
+from lexic.shared.cache import SQLiteCache
+from lexic.shared.concurrency import map_in_threads
 from lexic.shared.config import Config
-from lexic.shared.prompts import create_signature
+from lexic.shared.prompts import get_signature
 
-# Create judge signatures from YAML
-EvaluateDimension = create_signature("evals", "evaluate_dimension")
-IdentifyCriticalErrors = create_signature("evals", "identify_critical_errors")
+
+# Judge modes: one call per dimension plus one for critical errors, or everything in one call
+JUDGE_MODES = ("per_dimension", "single_call")
+
+# Score used when the judge's answer cannot be parsed
+DEFAULT_SCORE = 3
+
+
+def clamp_score(value: Any) -> int:
+    """Convert a judge score to an int in 1-5 (DEFAULT_SCORE if it is not a number)."""
+    try:
+        score = int(value)
+    except (ValueError, TypeError):
+        score = DEFAULT_SCORE  # Default to middle score if conversion fails
+    return max(1, min(5, score))
+
+
+def parse_critical_errors(value: Any) -> List[str]:
+    """Normalize the judge's critical errors to a list of strings."""
+    # Ensure critical_errors is always a list
+    critical_errors = value if value else []
+    if isinstance(critical_errors, str):
+        # If DSPy returns a string, split it into a list
+        # Assuming errors are separated by newlines or numbered
+        critical_errors = [e.strip() for e in critical_errors.split('\n') if e.strip()]
+    return critical_errors
+
+
+def parse_dimension_scores(
+    text: str,
+    dimensions: List[EvaluationDimension]
+) -> Tuple[Dict[str, int], Dict[str, str]]:
+    """
+    Parse the per-dimension scores of a single-call judgment.
+
+    The judge is asked for a JSON object mapping dimension names to
+    ``{"score": ..., "explanation": ...}``. Names are matched exactly, then
+    case-insensitively; if the answer is not JSON, ``<name>: <score>`` lines
+    are accepted. Dimensions without a usable score get DEFAULT_SCORE.
+
+    Args:
+        text: Judge output for the dimension scores
+        dimensions: Rubric dimensions
+
+    Returns:
+        (scores, explanations) keyed by dimension name
+    """
+    text = str(text or "")
+    parsed: Dict[str, Any] = {}
+    start, end = text.find("{"), text.rfind("}")
+    if start != -1 and end > start:
+        try:
+            loaded = json.loads(text[start:end + 1])
+            if isinstance(loaded, dict):
+                parsed = {str(key).strip().lower(): value for key, value in loaded.items()}
+        except ValueError:
+            pass
+
+    scores = {}
+    explanations = {}
+    for dim in dimensions:
+        value = parsed.get(dim.name.lower())
+        if isinstance(value, dict):
+            scores[dim.name] = clamp_score(value.get("score"))
+            explanations[dim.name] = str(value.get("explanation", ""))
+        elif value is not None:
+            scores[dim.name] = clamp_score(value)
+            explanations[dim.name] = ""
+        else:
+            match = re.search(rf"{re.escape(dim.name)}\W{{0,10}}([1-5])\b", text, re.IGNORECASE)
+            scores[dim.name] = clamp_score(match.group(1) if match else None)
+            explanations[dim.name] = "" if match else "Score non fourni par le juge."
+    return scores, explanations
 
 
 class LexicJudge(dspy.Module):
@@ -16,25 +94,48 @@ class LexicJudge(dspy.Module):
     LLM-as-judge for evaluating Lexic agent outputs.
 
     Evaluates an agent's output against ground truth using a rubric,
-    scoring each dimension and identifying critical errors.
+    scoring each dimension and identifying critical errors. In
+    ``per_dimension`` mode each dimension is scored by its own call and
+    critical errors by another, all issued concurrently (threads for
+    :meth:`forward`, tasks for :meth:`aforward`) so a case takes about as
+    long as its slowest call; in ``single_call`` mode one call scores every
+    dimension and lists critical errors, sending the prediction and ground
+    truth once instead of once per dimension. Both return the same result.
     """
 
-    def __init__(self, rubric: Rubric):
+    def __init__(self, rubric: Rubric, mode: Optional[str] = None, cache: Optional[SQLiteCache] = None):
         """
         Initialize judge with a rubric.
 
         Args:
             rubric: Evaluation rubric for this pipeline step
+            mode: "per_dimension" or "single_call" (default: Config.JUDGE_MODE)
+            cache: Judge verdict cache (default: none)
+
+        Raises:
+            ValueError: If the mode is unknown
         """
         super().__init__()
         self.rubric = rubric
-        self.evaluate_dimension = dspy.ChainOfThought(EvaluateDimension)
-        self.identify_errors = dspy.ChainOfThought(IdentifyCriticalErrors)
+        self.mode = mode or Config.JUDGE_MODE
+        self.cache = cache
+        if self.mode not in JUDGE_MODES:
+            raise ValueError(f"Unknown judge mode: {self.mode} (expected one of {', '.join(JUDGE_MODES)})")
+        if self.mode == "single_call":
+            self.evaluate_all = dspy.ChainOfThought(get_signature("evals", "evaluate_all_dimensions"))
+        else:
+            self.evaluate_dimension = dspy.ChainOfThought(get_signature("evals", "evaluate_dimension"))
+            self.identify_errors = dspy.ChainOfThought(get_signature("evals", "identify_critical_errors"))
 
     def forward(self, prediction: str, ground_truth: str) -> Dict:
         """
         Evaluate a prediction against ground truth.
 
+        With a cache, only verdicts whose inputs changed are requested: in
+        ``per_dimension`` mode each dimension is cached on its own definition,
+        and the critical-error pass on the whole rubric; in ``single_call``
+        mode the whole judgment is cached on the whole rubric.
+
         Args:
             prediction: Agent's output
             ground_truth: Ground truth reference
@@ -46,48 +147,155 @@ class LexicJudge(dspy.Module):
                 - critical_errors: List of critical errors
                 - overall_score: Weighted overall score
         """
-        scores = {}
-        explanations = {}
+        if self.mode == "single_call":
+            key = single_call_key(self.rubric, prediction, ground_truth) if self.cache else None
+            verdict = self.cache.get(key) if key else None
+            if verdict is None:
+                result = self.evaluate_all(**self._single_call_inputs(prediction, ground_truth))
+                verdict = self._store(key, self._single_call_verdict(result))
+            return self._prediction(**verdict)
+
+        keys = self._verdict_keys(prediction, ground_truth)
+        verdicts = self._cached_verdicts(keys)
+        pending = self._pending_calls(verdicts, prediction, ground_truth)
+        # Dimension scores and the critical-error pass are independent: run them together,
+        # on the pool shared by every judge in the process
+        results = map_in_threads(
+            lambda call: call[0](**call[1]), list(pending.values()),
+            workers=len(pending), executor=get_judge_executor()
+        )
+        self._record(pending, results, keys, verdicts)
+        return self._per_dimension_prediction(verdicts)
+
+    async def aforward(self, prediction: str, ground_truth: str) -> Dict:
+        """Asynchronous variant of :meth:`forward`."""
+        if self.mode == "single_call":
+            key = single_call_key(self.rubric, prediction, ground_truth) if self.cache else None
+            verdict = self.cache.get(key) if key else None
+            if verdict is None:
+                result = await self.evaluate_all.acall(**self._single_call_inputs(prediction, ground_truth))
+                verdict = self._store(key, self._single_call_verdict(result))
+            return self._prediction(**verdict)
+
+        keys = self._verdict_keys(prediction, ground_truth)
+        verdicts = self._cached_verdicts(keys)
+        pending = self._pending_calls(verdicts, prediction, ground_truth)
+        results = await asyncio.gather(*(module.acall(**inputs) for module, inputs in pending.values()))
+        self._record(pending, results, keys, verdicts)
+        return self._per_dimension_prediction(verdicts)
+
+    # Per-dimension verdicts are keyed by dimension name; None is the critical-error pass
+
+    def _verdict_keys(self, prediction: str, ground_truth: str) -> Dict[Optional[str], str]:
+        """Cache keys of every per-dimension verdict (empty without a cache)."""
+        if self.cache is None:
+            return {}
+        keys: Dict[Optional[str], str] = {
+            dim.name: dimension_key(dim, prediction, ground_truth)
+            for dim in self.rubric.dimensions
+        }
+        keys[None] = critical_errors_key(self.rubric, prediction, ground_truth)
+        return keys
+
+    def _cached_verdicts(self, keys: Dict[Optional[str], str]) -> Dict[Optional[str], Any]:
+        """Look up cached verdicts."""
+        verdicts = {}
+        for name, key in keys.items():
+            verdict = self.cache.get(key)
+            if verdict is not None:
+                verdicts[name] = verdict
+        return verdicts
 
-        # Evaluate each dimension
+    def _pending_calls(
+        self,
+        verdicts: Dict[Optional[str], Any],
+        prediction: str,
+        ground_truth: str
+    ) -> Dict[Optional[str], Tuple[dspy.Module, Dict[str, str]]]:
+        """Module and inputs of each call whose verdict is not cached yet."""
+        pending = {}
         for dim in self.rubric.dimensions:
-            # Format criteria for the dimension
-            criteria_text = "\n".join(
-                f"Score {score}: {description}"
-                for score, description in sorted(dim.criteria.items())
-            )
+            if dim.name not in verdicts:
+                pending[dim.name] = (self.evaluate_dimension, self._dimension_inputs(dim, prediction, ground_truth))
+        if None not in verdicts:
+            pending[None] = (self.identify_errors, self._errors_inputs(prediction, ground_truth))
+        return pending
 
-            result = self.evaluate_dimension(
-                dimension_name=dim.name,
-                dimension_description=dim.description,
-                scoring_criteria=criteria_text,
-                prediction=prediction,
-                ground_truth=ground_truth
-            )
+    def _record(
+        self,
+        pending: Dict[Optional[str], Any],
+        results: List[Any],
+        keys: Dict[Optional[str], str],
+        verdicts: Dict[Optional[str], Any]
+    ):
+        """Turn call results into verdicts, caching each one."""
+        for name, result in zip(pending, results):
+            if name is None:
+                verdict = parse_critical_errors(result.critical_errors)
+            else:
+                verdict = {"score": clamp_score(result.score), "explanation": result.explanation}
+            verdicts[name] = self._store(keys.get(name), verdict)
 
-            # Convert score to int and ensure it's in valid range
-            try:
-                score = int(result.score)
-            except (ValueError, TypeError):
-                score = 3  # Default to middle score if conversion fails
-            score = max(1, min(5, score))
-            scores[dim.name] = score
-            explanations[dim.name] = result.explanation
-
-        # Identify critical errors
-        error_result = self.identify_errors(
-            prediction=prediction,
-            ground_truth=ground_truth,
-            rubric=self.rubric.to_text()
+    def _store(self, key: Optional[str], verdict: Any) -> Any:
+        """Cache a verdict under ``key`` (if caching) and return it."""
+        if key is not None:
+            self.cache.set(key, verdict)
+        return verdict
+
+    @staticmethod
+    def _dimension_inputs(dim: EvaluationDimension, prediction: str, ground_truth: str) -> Dict[str, str]:
+        """Inputs of one dimension's evaluation call."""
+        # Format criteria for the dimension
+        criteria_text = "\n".join(
+            f"Score {score}: {description}"
+            for score, description in sorted(dim.criteria.items())
         )
+        return {
+            "dimension_name": dim.name,
+            "dimension_description": dim.description,
+            "scoring_criteria": criteria_text,
+            "prediction": prediction,
+            "ground_truth": ground_truth,
+        }
+
+    def _errors_inputs(self, prediction: str, ground_truth: str) -> Dict[str, str]:
+        """Inputs of the critical-error call."""
+        return {"prediction": prediction, "ground_truth": ground_truth, "rubric": self.rubric.to_text()}
+
+    def _single_call_inputs(self, prediction: str, ground_truth: str) -> Dict[str, str]:
+        """Inputs of the single-call evaluation."""
+        return {
+            "rubric": self.rubric.to_text(),
+            "dimension_names": "\n".join(dim.name for dim in self.rubric.dimensions),
+            "prediction": prediction,
+            "ground_truth": ground_truth,
+        }
+
+    def _per_dimension_prediction(self, verdicts: Dict[Optional[str], Any]) -> dspy.Prediction:
+        """Assemble the judgment from per-dimension verdicts and the critical-error pass."""
+        scores = {}
+        explanations = {}
+        for dim in self.rubric.dimensions:
+            scores[dim.name] = verdicts[dim.name]["score"]
+            explanations[dim.name] = verdicts[dim.name]["explanation"]
+        return self._prediction(scores, explanations, verdicts[None])
 
-        # Ensure critical_errors is always a list
-        critical_errors = error_result.critical_errors if error_result.critical_errors else []
-        if isinstance(critical_errors, str):
-            # If DSPy returns a string, split it into a list
-            # Assuming errors are separated by newlines or numbered
-            critical_errors = [e.strip() for e in critical_errors.split('\n') if e.strip()]
+    def _single_call_verdict(self, result: Any) -> Dict[str, Any]:
+        """Parse a single-call evaluation into scores, explanations and critical errors."""
+        scores, explanations = parse_dimension_scores(result.dimension_scores, self.rubric.dimensions)
+        return {
+            "scores": scores,
+            "explanations": explanations,
+            "critical_errors": parse_critical_errors(result.critical_errors),
+        }
 
+    def _prediction(
+        self,
+        scores: Dict[str, int],
+        explanations: Dict[str, str],
+        critical_errors: List[str]
+    ) -> dspy.Prediction:
+        """Wrap a judgment with its weighted overall score."""
         # Compute weighted overall score
         overall_score = sum(
             scores[dim.name] * dim.weight
@@ -102,26 +310,73 @@ class LexicJudge(dspy.Module):
         )
 
 
+_judge_executor: Optional[ThreadPoolExecutor] = None
+_judge_executor_lock = threading.Lock()
+
+
+def get_judge_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide pool of per-dimension judge calls, creating it on first use.
+
+    Its ``Config.JUDGE_MAX_CONCURRENCY`` threads bound the judge calls in
+    flight however many cases and steps are evaluated concurrently.
+
+    Returns:
+        Shared executor
+    """
+    global _judge_executor
+
+    with _judge_executor_lock:
+        if _judge_executor is None:
+            _judge_executor = ThreadPoolExecutor(
+                max_workers=max(1, Config.JUDGE_MAX_CONCURRENCY),
+                thread_name_prefix="lexic-judge"
+            )
+        return _judge_executor
+
+
 def evaluate_output(
     step_name: str,
     prediction: str,
-    ground_truth: str
+    ground_truth: str,
+    mode: Optional[str] = None
 ) -> Dict:
     """
     Evaluate an agent output for a specific pipeline step.
 
+    Verdicts are served from and stored in the judge cache (see
+    ``Config.JUDGE_CACHE_MODE``).
+
     Args:
         step_name: Name of the pipeline step
         prediction: Agent's output
         ground_truth: Ground truth reference
+        mode: Judge mode (default: Config.JUDGE_MODE)
 
     Returns:
         Evaluation results dict
     """
     rubric = get_rubric(step_name)
-    judge = LexicJudge(rubric)
+    judge = LexicJudge(rubric, mode=mode, cache=get_judge_cache())
     result = judge(prediction=prediction, ground_truth=ground_truth)
+    return _result_dict(result)
+
+
+async def aevaluate_output(
+    step_name: str,
+    prediction: str,
+    ground_truth: str,
+    mode: Optional[str] = None
+) -> Dict:
+    """Asynchronous variant of :func:`evaluate_output`."""
+    rubric = get_rubric(step_name)
+    judge = LexicJudge(rubric, mode=mode, cache=get_judge_cache())
+    result = await judge.acall(prediction=prediction, ground_truth=ground_truth)
+    return _result_dict(result)
+
 
+def _result_dict(result: dspy.Prediction) -> Dict:
+    """Convert a judge prediction to an evaluation results dict."""
     return {
         "scores": result.scores,
         "explanations": result.explanations,
@@ -1,8 +1,7 @@
 """Evaluation rubrics for each pipeline step."""
 
 from typing import Dict, List
-from pathlib import Path
-import yaml
+from lexic.shared.prompts import load_prompt_config
 
 
 class EvaluationDimension:
@@ -66,14 +65,7 @@ def load_rubric_from_yaml(step_name: str) -> Rubric:
     Raises:
         FileNotFoundError: If rubric file not found
     """
-    rubrics_dir = Path(__file__).parent.parent.parent / "prompts" / "evals" / "rubrics"
-    rubric_path = rubrics_dir / f"{step_name}.yaml"
-
-    if not rubric_path.exists():
-        raise FileNotFoundError(f"Rubric not found: {rubric_path}")
-
-    with open(rubric_path) as f:
-        config = yaml.safe_load(f)
+    config = load_prompt_config("evals/rubrics", step_name)
 
     dimensions = []
     for dim_config in config['dimensions']:
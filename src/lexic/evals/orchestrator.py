@@ -1,30 +1,31 @@
 """Evaluation orchestrator with MLFlow tracking."""
 
+import json
+import math
+import threading
 import mlflow
+from contextlib import ExitStack
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
-import importlib
+from typing import Dict, List, Optional, Tuple
 
+from lexic.shared.cache import SQLiteCache
 from lexic.shared.config import Config
-from lexic.shared.io import list_cases, load_case_step, write_markdown, get_case_path
+from lexic.shared.concurrency import map_in_threads
+from lexic.agents.registry import get_agent
+from lexic.shared.case_store import get_case_store
+from lexic.shared.io import write_markdown, get_case_path
+from lexic.evals.judges.cache import format_judge_cache_stats, get_judge_cache
 from lexic.evals.judges.judge import evaluate_output
+from lexic.evals.judges.rubrics import get_rubric
+from lexic.evals.sampling import SequentialSampler, case_strata, format_sampling_report
+from lexic.evals.stats import ScoreMatrix, format_interval, summarize_matrix, summary_metrics
+from lexic.evals.tracking import RunLogger, set_up_tracking
+from lexic.evals.triage import (
+    LEGAL_BASIS_FILE, format_triage_stats, skipped_result, summarize_triage, triage_case
+)
 
 
-# Map step names to agent modules and functions
-AGENT_REGISTRY = {
-    "qualification": ("lexic.agents.qualification", "run_qualification"),
-    "initial_analysis": ("lexic.agents.initial_analysis", "InitialAnalysisAgent"),
-    "investigation_order": ("lexic.agents.investigation_order", "InvestigationOrderAgent"),
-    "investigation_report": ("lexic.agents.investigation_report", "InvestigationReportAgent"),
-    "factual_record": ("lexic.agents.factual_record", "FactualRecordAgent"),
-    "legal_basis": ("lexic.agents.legal_basis", "LegalBasisAgent"),
-    "legal_arguments": ("lexic.agents.arguments", "ArgumentationAgent"),
-    "considerations": ("lexic.agents.considerations", "ConsiderationAgent"),
-    "judgment": ("lexic.agents.judgment", "JudgmentAgent"),
-    "recommendations": ("lexic.agents.recommendations", "RecommendationAgent"),
-}
-
 # Map step names to input step files
 STEP_INPUTS = {
     "qualification": ["01_client_request.md"],
@@ -39,6 +40,9 @@ STEP_INPUTS = {
     "recommendations": ["16_gt_considerations.md", "17_gt_expected_judgment.md", "02_gt_initial_qualification.md"],
 }
 
+# Files written by evaluate_case for each case: <case_id>_<kind>.md
+CASE_OUTPUT_KINDS = ["inputs", "prediction", "ground_truth", "evaluation"]
+
 # Map step names to ground truth files
 STEP_GROUND_TRUTH = {
     "qualification": "02_gt_initial_qualification.md",
@@ -58,38 +62,66 @@ def get_agent_runner(step_name: str):
     """
     Get agent runner for a pipeline step.
 
+    The agent is built once per process by the agent registry and shared
+    across cases (and threads).
+
     Args:
         step_name: Name of the pipeline step
 
     Returns:
         Callable that runs the agent
     """
-    if step_name not in AGENT_REGISTRY:
-        raise ValueError(f"Unknown step: {step_name}")
+    return get_agent(step_name)
 
-    module_name, class_or_func_name = AGENT_REGISTRY[step_name]
-    module = importlib.import_module(module_name)
-    agent_class_or_func = getattr(module, class_or_func_name)
 
-    # Handle both function-based and class-based agents
-    if step_name == "qualification":
-        # Function-based
-        return agent_class_or_func
-    else:
-        # Class-based - need to instantiate and call
-        def runner(**kwargs):
-            agent = agent_class_or_func()
-            return agent(**kwargs)
-        return runner
+def load_case_files(case_dir: Path, step_names: List[str]) -> Dict[str, str]:
+    """
+    Read every input and ground truth file of some steps once.
 
+    Files shared by several steps (e.g. the factual record) are looked up
+    once in the case store; missing files are left out, so only the steps
+    that need them fail. With triage on, the legal basis is read too.
 
-def load_step_inputs(case_dir: Path, step_name: str) -> Dict[str, str]:
+    Args:
+        case_dir: Path to case directory
+        step_names: Names of the pipeline steps
+
+    Returns:
+        Dict mapping file names to content
+    """
+    file_names = dict.fromkeys(
+        file_name
+        for step_name in step_names
+        for file_name in STEP_INPUTS[step_name] + [STEP_GROUND_TRUTH[step_name]]
+    )
+    if Config.TRIAGE_MODE != "off":
+        file_names[LEGAL_BASIS_FILE] = None
+    store = get_case_store(case_dir.parent)
+    files = {}
+    for file_name in file_names:
+        try:
+            _, files[file_name] = store.read(case_dir.name, file_name)
+        except FileNotFoundError:
+            pass
+    return files
+
+
+def read_case_file(case_dir: Path, file_name: str, files: Optional[Dict[str, str]] = None) -> str:
+    """Get a case file's content from preloaded ``files`` if present, else from the case store."""
+    if files is not None and file_name in files:
+        return files[file_name]
+    _, content = get_case_store(case_dir.parent).read(case_dir.name, file_name)
+    return content
+
+
+def load_step_inputs(case_dir: Path, step_name: str, files: Optional[Dict[str, str]] = None) -> Dict[str, str]:
     """
     Load input data for a pipeline step.
 
     Args:
         case_dir: Path to case directory
         step_name: Name of the pipeline step
+        files: Case files already read by :func:`load_case_files` (default: read from the case store)
 
     Returns:
         Dict mapping input names to content
@@ -101,7 +133,7 @@ def load_step_inputs(case_dir: Path, step_name: str) -> Dict[str, str]:
     input_files = STEP_INPUTS[step_name]
 
     for input_file in input_files:
-        _, content = load_case_step(case_dir, input_file)
+        content = read_case_file(case_dir, input_file, files)
         # Use simplified key names
         if "client_request" in input_file:
             inputs["client_request"] = content
@@ -155,32 +187,39 @@ def evaluate_case(
     step_name: str,
     case_id: str,
     case_dir: Path,
-    output_dir: Path
+    output_dir: Path,
+    files: Optional[Dict[str, str]] = None
 ) -> Dict:
     """
     Evaluate agent on a single case.
 
+    With triage (``Config.TRIAGE_MODE``), the prediction is pre-scored
+    against the ground truth before the judge is called; in ``on`` mode an
+    empty prediction gets the minimum score without a judge call and a
+    close match is judged in a single call.
+
     Args:
         step_name: Name of the pipeline step
         case_id: Case ID
         case_dir: Path to case directory
         output_dir: Path to save evaluation results
+        files: Case files already read by :func:`load_case_files` (default: read from the case store)
 
     Returns:
-        Evaluation results dict
+        Evaluation results dict (with the triage decision and features
+        under "triage", None with triage off)
     """
-    print(f"  Running agent on {case_id}...")
+    print(f"  Running {step_name} agent on {case_id}...")
 
     # Load inputs
-    inputs = load_step_inputs(case_dir, step_name)
+    inputs = load_step_inputs(case_dir, step_name, files)
 
     # Run agent
     agent_runner = get_agent_runner(step_name)
     prediction = agent_runner(**inputs)
 
     # Load ground truth
-    gt_file = STEP_GROUND_TRUTH[step_name]
-    _, ground_truth = load_case_step(case_dir, gt_file)
+    ground_truth = read_case_file(case_dir, STEP_GROUND_TRUTH[step_name], files)
 
     # Save inputs
     inputs_file = output_dir / f"{case_id}_inputs.md"
@@ -207,27 +246,50 @@ def evaluate_case(
         f"# Ground Truth\n\n{ground_truth}"
     )
 
-    print(f"  Evaluating {case_id}...")
-    eval_result = evaluate_output(step_name, prediction, ground_truth)
+    # Pre-score the prediction to decide how to judge it
+    triage = None
+    if Config.TRIAGE_MODE != "off":
+        try:
+            legal_basis = read_case_file(case_dir, LEGAL_BASIS_FILE, files)
+        except FileNotFoundError:
+            legal_basis = None
+        triage = triage_case(prediction, ground_truth, legal_basis)
+    decision = triage["decision"] if triage and Config.TRIAGE_MODE == "on" else "full"
+
+    if decision == "skip":
+        print(f"  Skipping judge for {case_id} ({step_name}): {triage['reason']}")
+        eval_result = skipped_result(get_rubric(step_name), triage["reason"])
+    else:
+        print(f"  Evaluating {case_id} ({step_name})...")
+        judge_mode = "single_call" if decision == "shortcut" else None
+        eval_result = evaluate_output(step_name, prediction, ground_truth, mode=judge_mode)
 
     # Save evaluation
     eval_content = format_evaluation(eval_result)
     eval_file = output_dir / f"{case_id}_evaluation.md"
-    write_markdown(
-        eval_file,
-        {"case_id": case_id, "step": step_name, "overall_score": eval_result["overall_score"]},
-        eval_content
-    )
+    metadata = {"case_id": case_id, "step": step_name, "overall_score": eval_result["overall_score"]}
+    if triage:
+        metadata["triage"] = triage["decision"]
+    write_markdown(eval_file, metadata, eval_content)
 
     return {
         "case_id": case_id,
         "inputs": inputs,
         "prediction": prediction,
         "ground_truth": ground_truth,
+        "triage": triage,
         **eval_result
     }
 
 
+def upload_case_files(logger: RunLogger, output_dir: Path, case_id: str):
+    """Queue the files :func:`evaluate_case` wrote for a case (all or some, if it failed) for upload."""
+    for kind in CASE_OUTPUT_KINDS:
+        path = output_dir / f"{case_id}_{kind}.md"
+        if path.exists():
+            logger.log_artifact(path, artifact_path="evaluation_results")
+
+
 def format_evaluation(eval_result: Dict) -> str:
     """Format evaluation result as markdown."""
     lines = ["# Evaluation Result\n"]
@@ -250,23 +312,183 @@ def format_evaluation(eval_result: Dict) -> str:
     return "\n".join(lines)
 
 
+def summarize_results(
+    results: List[Dict],
+    cases_dir: Path,
+    baseline: Optional[ScoreMatrix] = None
+) -> Dict:
+    """
+    Compute summary statistics of a step's case results.
+
+    Args:
+        results: Evaluation results dicts (at least one)
+        cases_dir: Directory containing the cases (for their source decision and party)
+        baseline: Score matrix of a baseline run to compare with
+
+    Returns:
+        Summary statistics (see :func:`lexic.evals.stats.summarize_matrix`)
+    """
+    strata = case_strata([result["case_id"] for result in results], get_case_store(cases_dir))
+    return summarize_matrix(ScoreMatrix.from_results(results, strata), baseline)
+
+
+def log_step_summary(
+    logger: RunLogger,
+    step_name: str,
+    summary: Dict,
+    results: List[Dict],
+    output_dir: Path,
+    n_cases: int,
+    timestamp: str
+):
+    """
+    Log a step's summary metrics and save and upload its summary file.
+
+    Args:
+        logger: Logger of the step's MLFlow run
+        step_name: Name of the pipeline step
+        summary: Summary statistics from :func:`summarize_results`
+        results: Evaluation results dicts
+        output_dir: Directory of the step's evaluation files
+        n_cases: Number of cases evaluated
+        timestamp: Run timestamp
+    """
+    # Log metrics to MLFlow (buffered, sent in one batch)
+    logger.log_metrics(summary_metrics(summary))
+
+    # Save summary
+    summary_content = format_summary(step_name, summary, results)
+    summary_file = output_dir / "summary.md"
+    write_markdown(
+        summary_file,
+        {"step": step_name, "n_cases": n_cases, "timestamp": timestamp},
+        summary_content
+    )
+
+    # Full statistics, including the per-decision breakdown, for later analysis
+    stats_file = output_dir / "summary.json"
+    stats_file.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    # Case files were uploaded as they were written
+    logger.log_artifact(summary_file, artifact_path="evaluation_results")
+    logger.log_artifact(stats_file, artifact_path="evaluation_results")
+
+
+def log_triage(logger: RunLogger, step_name: str, summary: Dict, results: List[Dict], output_dir: Path):
+    """
+    Save a step's triage decisions, log how many judge calls they avoid and print it.
+
+    Each case's decision, reason and features go to ``triage.jsonl``, to
+    audit the policy; the counts are added to ``summary`` under "triage".
+    Does nothing with triage off.
+
+    Args:
+        logger: Logger of the step's MLFlow run
+        step_name: Name of the pipeline step
+        summary: Summary statistics from :func:`summarize_results`
+        results: Evaluation results dicts
+        output_dir: Directory of the step's evaluation files
+    """
+    triaged = [result for result in results if result.get("triage")]
+    if not triaged:
+        return
+
+    triage_file = output_dir / "triage.jsonl"
+    with open(triage_file, "w", encoding="utf-8") as f:
+        for result in triaged:
+            f.write(json.dumps({"case_id": result["case_id"], **result["triage"]}, ensure_ascii=False) + "\n")
+
+    stats = summarize_triage([result["triage"] for result in triaged], get_rubric(step_name), Config.JUDGE_MODE)
+    summary["triage"] = {"mode": Config.TRIAGE_MODE, **stats}
+    # In shadow mode every case was judged fully: the calls saved are those triage would have avoided
+    logger.log_metrics({
+        "triage_skipped": stats["skip"],
+        "triage_shortcut": stats["shortcut"],
+        "triage_full": stats["full"],
+        "triage_judge_calls": stats["judge_calls"],
+        "triage_judge_calls_saved": stats["judge_calls_untriaged"] - stats["judge_calls"],
+    })
+    logger.log_artifact(triage_file, artifact_path="evaluation_results")
+    print(f"  {step_name}: {format_triage_stats(stats, applied=Config.TRIAGE_MODE == 'on')}")
+
+
+def log_judge_cache_stats(logger: RunLogger, judge_cache: Optional[SQLiteCache], before: Optional[Dict]):
+    """Log the judge cache hits/misses since ``before`` to an MLFlow run and print them."""
+    if judge_cache is None:
+        return
+    after = judge_cache.stats()
+    cache_stats = {key: after[key] - before[key] for key in ("hits", "misses")}
+    lookups = cache_stats["hits"] + cache_stats["misses"]
+    cache_stats["hit_rate"] = cache_stats["hits"] / lookups if lookups else 0.0
+    logger.log_metrics({
+        "judge_cache_hits": cache_stats["hits"],
+        "judge_cache_misses": cache_stats["misses"],
+    })
+    print(f"  {format_judge_cache_stats(cache_stats)}")
+
+
+def log_sampling_report(logger: RunLogger, sampler: SequentialSampler):
+    """Log a sampler's settings, final estimates and stop reason to an MLFlow run."""
+    report = sampler.report()
+    logger.log_params({
+        "sampling_seed": sampler.seed,
+        "sampling_confidence": sampler.confidence,
+        "sampling_min_cases": sampler.min_cases,
+        "sampling_target_width": sampler.target_width,
+        "sampling_stop_reason": report["stop_reason"] or "exhausted",
+    })
+    # Interval bounds are infinite until two cases are scored
+    logger.log_metrics({
+        f"sampling_{key}": value for key, value in report.items()
+        if key not in ("confidence", "seed", "stop_reason") and math.isfinite(value)
+    })
+
+
+def log_run_params(logger: RunLogger, workers: int, **params):
+    """Log the parameters shared by every evaluation run, plus ``params``, to an MLFlow run."""
+    logger.log_params({
+        **params,
+        "model": Config.DEFAULT_MODEL,
+        "judge_model": Config.JUDGE_MODEL,
+        "judge_mode": Config.JUDGE_MODE,
+        "triage_mode": Config.TRIAGE_MODE,
+        "workers": workers,
+    })
+
+
 def run_evaluation(
     step_name: str,
     cases_dir: Optional[Path] = None,
     n_cases: Optional[int] = None,
-    experiment_name: Optional[str] = None
+    experiment_name: Optional[str] = None,
+    workers: int = 1,
+    sampler: Optional[SequentialSampler] = None,
+    baseline: Optional[ScoreMatrix] = None
 ) -> Dict:
     """
     Run evaluation for a pipeline step on synthetic cases.
 
+    Cases are evaluated by up to ``workers`` threads; each case writes its
+    own files, which are uploaded to MLFlow in the background as soon as
+    the case is done. Results are collected in case order, and params and
+    metrics are sent in one batch at the end.
+
+    With a sampler, cases are taken in its random stratified order and
+    ``n_cases`` caps the sample. If it has a stopping rule, cases are
+    evaluated in batches of ``workers`` and the evaluation stops as soon
+    as the sampler says its estimate is precise enough.
+
     Args:
         step_name: Name of the pipeline step
         cases_dir: Directory containing synthetic cases (default: from config)
         n_cases: Number of cases to evaluate (default: all)
         experiment_name: MLFlow experiment name (default: from config)
+        workers: Number of cases evaluated concurrently
+        sampler: Case order and stopping rule (default: sorted order, all cases)
+        baseline: Score matrix of an earlier run, for paired differences in the summary
 
     Returns:
-        Summary statistics
+        Summary statistics (with a sampler, including its final report under "sampling")
     """
     # Set defaults
     if cases_dir is None:
@@ -275,7 +497,10 @@ def run_evaluation(
         experiment_name = Config.MLFLOW_EXPERIMENT_NAME
 
     # List cases
-    case_ids = list_cases(cases_dir)
+    store = get_case_store(cases_dir)
+    case_ids = store.list_cases()
+    if sampler:
+        case_ids = sampler.order(case_ids, store)
     if n_cases:
         case_ids = case_ids[:n_cases]
 
@@ -283,78 +508,86 @@ def run_evaluation(
         print(f"No cases found in {cases_dir}")
         return {}
 
-    print(f"Evaluating {len(case_ids)} cases for step: {step_name}")
+    if sampler and sampler.sequential:
+        print(f"Evaluating up to {len(case_ids)} cases for step: {step_name} "
+              f"(stratified sampling, seed {sampler.seed})")
+    else:
+        print(f"Evaluating {len(case_ids)} cases for step: {step_name}")
 
     # Create output directory
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_dir = Config.EVAL_RUNS_DIR / f"{step_name}_{timestamp}"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Set up MLFlow
-    mlflow.set_tracking_uri(Config.MLFLOW_TRACKING_URI)
-    mlflow.set_experiment(experiment_name)
+    # Set up MLFlow (the tracking server, or the local store in offline mode)
+    set_up_tracking(experiment_name)
 
-    with mlflow.start_run(run_name=f"{step_name}_{timestamp}"):
+    with mlflow.start_run(run_name=f"{step_name}_{timestamp}") as active_run, \
+            RunLogger(active_run.info.run_id) as logger:
         # Log parameters
-        mlflow.log_param("step", step_name)
-        mlflow.log_param("n_cases", len(case_ids))
-        mlflow.log_param("model", Config.DEFAULT_MODEL)
-        mlflow.log_param("judge_model", Config.JUDGE_MODEL)
+        log_run_params(logger, workers, step=step_name, n_cases=len(case_ids))
 
-        # Evaluate each case
-        results = []
-        for case_id in case_ids:
+        judge_cache = get_judge_cache()
+        cache_before = judge_cache.stats() if judge_cache else None
+
+        def evaluate_one(case_id: str) -> Optional[Dict]:
             case_dir = get_case_path(cases_dir, case_id)
             try:
-                result = evaluate_case(step_name, case_id, case_dir, output_dir)
-                results.append(result)
+                return evaluate_case(step_name, case_id, case_dir, output_dir)
             except Exception as e:
                 print(f"  ✗ Error evaluating {case_id}: {e}")
+                return None
+            finally:
+                upload_case_files(logger, output_dir, case_id)
+
+        # Evaluate each case, in batches checked against the stopping rule if sequential
+        batch_size = workers if sampler and sampler.sequential else len(case_ids)
+        results = []
+        n_evaluated = 0
+        for start in range(0, len(case_ids), batch_size):
+            batch = case_ids[start:start + batch_size]
+            n_evaluated += len(batch)
+            for result in map_in_threads(evaluate_one, batch, workers):
+                if result is not None:
+                    results.append(result)
+                    if sampler:
+                        sampler.add(result["case_id"], result["overall_score"])
+            if sampler and sampler.sequential:
+                print(f"  {format_sampling_report(sampler.report())}")
+                if sampler.stop_reason():
+                    break
+
+        # Judge cache hits/misses of this step (the cache is shared across steps)
+        log_judge_cache_stats(logger, judge_cache, cache_before)
+        if sampler:
+            log_sampling_report(logger, sampler)
 
         # Compute summary statistics
         if results:
-            overall_scores = [r["overall_score"] for r in results]
-            dimension_scores = {}
-            for dim_name in results[0]["scores"].keys():
-                dimension_scores[dim_name] = [r["scores"][dim_name] for r in results]
-
-            summary = {
-                "mean_overall_score": sum(overall_scores) / len(overall_scores),
-                "min_overall_score": min(overall_scores),
-                "max_overall_score": max(overall_scores),
-                "dimension_means": {
-                    dim: sum(scores) / len(scores)
-                    for dim, scores in dimension_scores.items()
-                },
-                "n_cases_with_errors": sum(1 for r in results if r["critical_errors"]),
-                "total_errors": sum(len(r["critical_errors"]) for r in results)
-            }
-
-            # Log metrics to MLFlow
-            mlflow.log_metric("mean_overall_score", summary["mean_overall_score"])
-            mlflow.log_metric("min_overall_score", summary["min_overall_score"])
-            mlflow.log_metric("max_overall_score", summary["max_overall_score"])
-            for dim, mean_score in summary["dimension_means"].items():
-                mlflow.log_metric(f"mean_{dim}", mean_score)
-            mlflow.log_metric("cases_with_errors", summary["n_cases_with_errors"])
-            mlflow.log_metric("total_errors", summary["total_errors"])
-
-            # Save summary
-            summary_content = format_summary(step_name, summary, results)
-            summary_file = output_dir / "summary.md"
-            write_markdown(
-                summary_file,
-                {"step": step_name, "n_cases": len(case_ids), "timestamp": timestamp},
-                summary_content
-            )
-
-            # Log artifacts
-            mlflow.log_artifacts(output_dir, artifact_path="evaluation_results")
+            summary = summarize_results(results, cases_dir, baseline)
+            if sampler:
+                summary["sampling"] = sampler.report()
+            log_triage(logger, step_name, summary, results, output_dir)
+            log_step_summary(logger, step_name, summary, results, output_dir, n_evaluated, timestamp)
 
             print(f"\n✓ Evaluation complete!")
-            print(f"  Mean overall score: {summary['mean_overall_score']:.2f}/5.00")
+            print(
+                f"  Mean overall score: {summary['mean_overall_score']:.2f}/5.00 "
+                f"({summary['confidence']:.0%} CI {format_interval(**summary['overall_ci'])})"
+            )
+            if "baseline" in summary:
+                delta = summary["baseline"]["overall"]
+                print(
+                    f"  Difference from baseline: {delta['mean']:+.2f} "
+                    f"({format_interval(delta['ci_low'], delta['ci_high'], signed=True)}, "
+                    f"{summary['baseline']['n_paired']} paired cases)"
+                )
+            if sampler:
+                print(f"  {format_sampling_report(summary['sampling'])}")
+                if n_evaluated < len(case_ids):
+                    print(f"  Stopped after {n_evaluated} of {len(case_ids)} cases")
             print(f"  Results saved to: {output_dir}")
-            print(f"  MLFlow run: {mlflow.active_run().info.run_id}")
+            print(f"  MLFlow run: {active_run.info.run_id}")
 
             return summary
         else:
@@ -362,20 +595,226 @@ def run_evaluation(
             return {}
 
 
+def run_all_evaluations(
+    step_names: List[str],
+    cases_dir: Optional[Path] = None,
+    n_cases: Optional[int] = None,
+    experiment_name: Optional[str] = None,
+    workers: int = 1,
+    sampler: Optional[SequentialSampler] = None
+) -> Dict[str, Dict]:
+    """
+    Run evaluation for several pipeline steps in one pass over the cases.
+
+    Every step takes ground-truth inputs, so the steps of a case are
+    independent: each (case, step) pair is a unit of work, and up to
+    ``workers`` of them are evaluated concurrently, taken in case order so
+    each case's files are read once and the steps of a case run together.
+    ``workers`` bounds the agent calls in flight; the per-dimension judge
+    calls of those steps share the judge pool (``Config.JUDGE_MAX_CONCURRENCY``).
+    Results
+    are logged under one parent MLFlow run, with a nested run per step;
+    case files are uploaded to their step's run in the background as they
+    are written, and params and metrics are sent in batches at the end.
+
+    With a sampler, cases are taken in its random stratified order and
+    ``n_cases`` caps the sample; its stopping rule is not applied, since
+    each step would stop at a different case.
+
+    Args:
+        step_names: Names of the pipeline steps
+        cases_dir: Directory containing synthetic cases (default: from config)
+        n_cases: Number of cases to evaluate (default: all)
+        experiment_name: MLFlow experiment name (default: from config)
+        workers: Number of (case, step) pairs evaluated concurrently
+        sampler: Case order (default: sorted order)
+
+    Returns:
+        Dict mapping step name to summary statistics (empty for steps with
+        no successful evaluation)
+    """
+    # Set defaults
+    if cases_dir is None:
+        cases_dir = Config.SYNTHETIC_CASES_DIR
+    if experiment_name is None:
+        experiment_name = Config.MLFLOW_EXPERIMENT_NAME
+
+    # List cases
+    store = get_case_store(cases_dir)
+    case_ids = store.list_cases()
+    if sampler:
+        case_ids = sampler.order(case_ids, store)
+    if n_cases:
+        case_ids = case_ids[:n_cases]
+
+    if not case_ids:
+        print(f"No cases found in {cases_dir}")
+        return {}
+
+    print(f"Evaluating {len(case_ids)} cases for steps: {', '.join(step_names)}")
+    if sampler:
+        print(f"Stratified sampling, seed {sampler.seed}")
+
+    # Create output directories
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_dir = Config.EVAL_RUNS_DIR / f"all_{timestamp}"
+    step_dirs = {step_name: output_dir / step_name for step_name in step_names}
+    for step_dir in step_dirs.values():
+        step_dir.mkdir(parents=True, exist_ok=True)
+
+    # Set up MLFlow (the tracking server, or the local store in offline mode)
+    set_up_tracking(experiment_name)
+
+    with mlflow.start_run(run_name=f"all_{timestamp}") as parent_run, \
+            RunLogger(parent_run.info.run_id) as logger, ExitStack() as step_runs:
+        log_run_params(logger, workers, steps=",".join(step_names), n_cases=len(case_ids))
+        if sampler:
+            logger.log_params({"sampling_seed": sampler.seed})
+        # Nested runs are open for the whole pass so case files can be uploaded as they are written
+        step_loggers = {
+            step_name: step_runs.enter_context(
+                RunLogger.start_nested(parent_run.info.run_id, f"{step_name}_{timestamp}")
+            )
+            for step_name in step_names
+        }
+        for step_name, step_logger in step_loggers.items():
+            log_run_params(step_logger, workers, step=step_name, n_cases=len(case_ids))
+
+        judge_cache = get_judge_cache()
+        cache_before = judge_cache.stats() if judge_cache else None
+
+        # A case's files are read by its first step to run and dropped once all its steps are done
+        case_files: Dict[str, Dict[str, str]] = {}
+        case_locks = {case_id: threading.Lock() for case_id in case_ids}
+        steps_left = {case_id: len(step_names) for case_id in case_ids}
+        steps_left_lock = threading.Lock()
+
+        def files_for(case_id: str, case_dir: Path) -> Dict[str, str]:
+            with case_locks[case_id]:
+                if case_id not in case_files:
+                    case_files[case_id] = load_case_files(case_dir, step_names)
+                return case_files[case_id]
+
+        def evaluate_step(pair: Tuple[str, str]) -> Optional[Dict]:
+            case_id, step_name = pair
+            case_dir = get_case_path(cases_dir, case_id)
+            try:
+                files = files_for(case_id, case_dir)
+                return evaluate_case(step_name, case_id, case_dir, step_dirs[step_name], files)
+            except Exception as e:
+                print(f"  ✗ Error evaluating {case_id} ({step_name}): {e}")
+                return None
+            finally:
+                upload_case_files(step_loggers[step_name], step_dirs[step_name], case_id)
+                with steps_left_lock:
+                    steps_left[case_id] -= 1
+                    if not steps_left[case_id]:
+                        case_files.pop(case_id, None)
+
+        # One pool for every (case, step) pair, so at most `workers` steps are in flight in
+        # total; pairs are in case order, so the steps of a case run close together
+        pairs = [(case_id, step_name) for case_id in case_ids for step_name in step_names]
+        step_results = iter(map_in_threads(evaluate_step, pairs, workers))
+        case_results = [[next(step_results) for _ in step_names] for _ in case_ids]
+
+        log_judge_cache_stats(logger, judge_cache, cache_before)
+
+        summaries = {}
+        for index, step_name in enumerate(step_names):
+            results = [row[index] for row in case_results if row[index] is not None]
+            if not results:
+                print(f"  {step_name}: no successful evaluations")
+                summaries[step_name] = {}
+                continue
+
+            summary = summarize_results(results, cases_dir)
+            log_triage(step_loggers[step_name], step_name, summary, results, step_dirs[step_name])
+            log_step_summary(
+                step_loggers[step_name], step_name, summary, results,
+                step_dirs[step_name], len(case_ids), timestamp
+            )
+            logger.log_metrics({f"{step_name}/mean_overall_score": summary["mean_overall_score"]})
+            summaries[step_name] = summary
+
+        print(f"\n✓ Evaluation complete!")
+        print(f"  Results saved to: {output_dir}")
+        print(f"  MLFlow run: {parent_run.info.run_id}")
+
+    return summaries
+
+
 def format_summary(step_name: str, summary: Dict, results: List[Dict]) -> str:
     """Format summary statistics as markdown."""
     lines = [f"# Evaluation Summary: {step_name}\n"]
 
+    confidence = f"{summary['confidence']:.0%} CI"
     lines.append("## Overall Statistics\n")
-    lines.append(f"- **Mean Score**: {summary['mean_overall_score']:.2f}/5.00")
+    lines.append(
+        f"- **Mean Score**: {summary['mean_overall_score']:.2f}/5.00 "
+        f"({confidence} {format_interval(**summary['overall_ci'])})"
+    )
     lines.append(f"- **Min Score**: {summary['min_overall_score']:.2f}/5.00")
     lines.append(f"- **Max Score**: {summary['max_overall_score']:.2f}/5.00")
     lines.append(f"- **Cases with Errors**: {summary['n_cases_with_errors']}/{len(results)}")
     lines.append(f"- **Total Errors**: {summary['total_errors']}\n")
 
-    lines.append("## Dimension Means\n")
+    if "sampling" in summary:
+        sampling = summary["sampling"]
+        lines.append("## Sampling\n")
+        lines.append(f"- **Cases Sampled**: {sampling['n_cases']} (stratified, seed {sampling['seed']})")
+        lines.append(
+            f"- **Mean Score {sampling['confidence']:.0%} CI**: "
+            f"[{sampling['ci_low']:.2f}, {sampling['ci_high']:.2f}]"
+        )
+        if "delta_mean" in sampling:
+            lines.append(
+                f"- **Difference from Baseline**: {sampling['delta_mean']:+.2f} "
+                f"[{sampling['delta_ci_low']:+.2f}, {sampling['delta_ci_high']:+.2f}] "
+                f"over {sampling['n_paired']} paired cases"
+            )
+        lines.append(f"- **Stop Reason**: {sampling['stop_reason'] or 'none (sample exhausted)'}\n")
+
+    if "triage" in summary:
+        triage = summary["triage"]
+        saved = triage["judge_calls_untriaged"] - triage["judge_calls"]
+        lines.append(f"## Triage ({triage['mode']})\n")
+        lines.append(f"- **Skipped**: {triage['skip']}")
+        lines.append(f"- **Shortcut (single call)**: {triage['shortcut']}")
+        lines.append(f"- **Judged Fully**: {triage['full']}")
+        lines.append(
+            f"- **Judge Calls {'Saved' if triage['mode'] == 'on' else 'Saveable'}**: "
+            f"{saved} of {triage['judge_calls_untriaged']}\n"
+        )
+
+    lines.append(f"## Dimension Means ({confidence})\n")
     for dim, mean in summary['dimension_means'].items():
-        lines.append(f"- **{dim}**: {mean:.2f}/5.00")
+        lines.append(f"- **{dim}**: {mean:.2f}/5.00 {format_interval(**summary['dimension_cis'][dim])}")
+
+    if "baseline" in summary:
+        baseline = summary["baseline"]
+        lines.append(f"\n## Difference from Baseline ({baseline['n_paired']} paired cases)\n")
+        lines.append(f"| Score | Difference | {confidence} |")
+        lines.append("|-------|-----------|--------|")
+        for name, delta in [("Overall", baseline["overall"]), *baseline["dimensions"].items()]:
+            lines.append(
+                f"| {name} | {delta['mean']:+.2f} | "
+                f"{format_interval(delta['ci_low'], delta['ci_high'], signed=True)} |"
+            )
+
+    lines.append("\n## By Party\n")
+    lines.append(f"| Party | Cases | Mean Score | {confidence} |")
+    lines.append("|-------|-------|-----------|--------|")
+    for party, stats in summary["by_party"].items():
+        lines.append(
+            f"| {party or '-'} | {stats['n_cases']} | {stats['mean_overall_score']:.2f} | "
+            f"{format_interval(stats['ci_low'], stats['ci_high'])} |"
+        )
+
+    lines.append("\n## By Decision\n")
+    lines.append("| Decision | Cases | Mean Score |")
+    lines.append("|----------|-------|-----------|")
+    for decision, stats in summary["by_decision"].items():
+        lines.append(f"| {decision} | {stats['n_cases']} | {stats['mean_overall_score']:.2f} |")
 
     lines.append("\n## Per-Case Scores\n")
     lines.append("| Case ID | Overall Score | Errors |")
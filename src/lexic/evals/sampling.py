@@ -0,0 +1,306 @@
+"""Stratified case sampling and sequential stopping for step evaluations."""
+
+import math
+import random
+import re
+import statistics
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from lexic.shared.case_store import CaseStore
+
+
+# Case IDs are <decision>_<party>, e.g. case_001_pl (plaintiff) or case_001_df (defendant)
+CASE_ID_PATTERN = re.compile(r"^(?P<decision>.+)_(?P<party>pl|df)$")
+
+# Case file whose frontmatter names the source decision
+STRATUM_FILE = "01_client_request.md"
+
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_MIN_CASES = 10
+
+
+def t_quantile(p: float, df: int) -> float:
+    """
+    Quantile of Student's t distribution.
+
+    Exact for 1 and 2 degrees of freedom; otherwise the Cornish-Fisher
+    expansion around the normal quantile (Abramowitz & Stegun 26.7.5):
+    from 3 degrees of freedom, within 0.005 of the exact 0.975 quantile and
+    0.05 of the 0.995 quantile.
+
+    Args:
+        p: Probability (e.g. 0.975 for a two-sided 95% interval)
+        df: Degrees of freedom (at least 1)
+
+    Returns:
+        Quantile
+    """
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = statistics.NormalDist().inv_cdf(p)
+    terms = [
+        (z ** 3 + z) / 4,
+        (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96,
+        (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384,
+        (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160,
+    ]
+    return z + sum(term / df ** (power + 1) for power, term in enumerate(terms))
+
+
+def mean_interval(values: List[float], confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float, float]:
+    """
+    Mean of some values and its Student t confidence interval.
+
+    Args:
+        values: Observations
+        confidence: Confidence level of the interval
+
+    Returns:
+        (mean, low, high); the bounds are infinite with fewer than two values
+    """
+    if not values:
+        return math.nan, -math.inf, math.inf
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return mean, -math.inf, math.inf
+    half_width = (
+        t_quantile(0.5 + confidence / 2, len(values) - 1)
+        * statistics.stdev(values) / math.sqrt(len(values))
+    )
+    return mean, mean - half_width, mean + half_width
+
+
+def case_stratum(case_id: str, metadata: Optional[Dict] = None) -> Tuple[str, str]:
+    """
+    Source decision and party of a case.
+
+    The decision comes from the ``source_decision`` frontmatter field if
+    present, else from the case ID; the party is the case ID's ``_pl`` /
+    ``_df`` suffix (empty if it has none).
+
+    Args:
+        case_id: Case ID
+        metadata: Frontmatter of one of the case's files
+
+    Returns:
+        (decision, party)
+    """
+    match = CASE_ID_PATTERN.match(case_id)
+    decision = (metadata or {}).get("source_decision") or (match.group("decision") if match else case_id)
+    party = match.group("party") if match else ""
+    return str(decision), party
+
+
+def stratified_order(strata: Dict[str, Tuple[str, str]], seed: Optional[int] = None) -> List[str]:
+    """
+    Order cases randomly so that every prefix is balanced across strata.
+
+    Decisions are shuffled and visited round-robin, one case per decision
+    per round, so no decision contributes a second case before every
+    decision contributed one. Within a round the first party alternates
+    from decision to decision, so plaintiff and defendant cases stay
+    balanced too.
+
+    Args:
+        strata: Dict mapping case ID to (decision, party)
+        seed: Random seed (default: nondeterministic)
+
+    Returns:
+        Case IDs in sampling order
+    """
+    rng = random.Random(seed)
+    by_decision = defaultdict(list)
+    for case_id, (decision, party) in sorted(strata.items()):
+        by_decision[decision].append((party, case_id))
+
+    decisions = sorted(by_decision)
+    rng.shuffle(decisions)
+    parties = sorted({party for _, party in strata.values()})
+    rng.shuffle(parties)
+
+    queues = []
+    for index, decision in enumerate(decisions):
+        cases = by_decision[decision]
+        rng.shuffle(cases)
+        first_party = parties[index % len(parties)]
+        # Stable sort: keeps the shuffled order within each party
+        cases.sort(key=lambda item: item[0] != first_party)
+        queues.append([case_id for _, case_id in cases])
+
+    order = []
+    while any(queues):
+        for queue in queues:
+            if queue:
+                order.append(queue.pop(0))
+    return order
+
+
+def case_strata(case_ids: List[str], store: CaseStore) -> Dict[str, Tuple[str, str]]:
+    """
+    Look up the source decision and party of cases (see :func:`case_stratum`).
+
+    Args:
+        case_ids: Case IDs
+        store: Case store the cases are read from
+
+    Returns:
+        Dict mapping case ID to (decision, party)
+    """
+    strata = {}
+    for case_id in case_ids:
+        try:
+            metadata, _ = store.read(case_id, STRATUM_FILE)
+        except FileNotFoundError:
+            metadata = {}
+        strata[case_id] = case_stratum(case_id, metadata)
+    return strata
+
+
+class SequentialSampler:
+    """
+    Random stratified case order with a running confidence interval and stopping rule.
+
+    Cases are evaluated in :func:`stratified_order`, so any prefix is an
+    unbiased, balanced sample. After each batch the evaluation asks
+    :meth:`stop_reason` whether to go on: it stops once the confidence
+    interval of the mean overall score is narrower than ``target_width``,
+    or, given a baseline run, once the interval of the paired per-case
+    difference from the baseline excludes zero. Neither rule applies before
+    ``min_cases`` cases. Without a target width or baseline the sampler only
+    orders cases.
+
+    Checking the significance after every batch makes a false positive
+    more likely than ``1 - confidence``; use a higher confidence when the
+    decision matters.
+    """
+
+    def __init__(
+        self,
+        target_width: Optional[float] = None,
+        baseline_scores: Optional[Dict[str, float]] = None,
+        confidence: float = DEFAULT_CONFIDENCE,
+        min_cases: int = DEFAULT_MIN_CASES,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            target_width: Stop when the interval of the mean overall score is narrower (default: never)
+            baseline_scores: Per-case overall scores of the variant to compare with
+            confidence: Confidence level of the intervals
+            min_cases: Cases evaluated before either rule may stop the evaluation
+            seed: Random seed of the case order (default: drawn at random and kept in ``seed``)
+        """
+        self.target_width = target_width
+        self.baseline_scores = baseline_scores
+        self.confidence = confidence
+        self.min_cases = min_cases
+        self.seed = seed if seed is not None else random.randrange(2 ** 31)
+        self.scores: Dict[str, float] = {}
+
+    @property
+    def sequential(self) -> bool:
+        """Whether a stopping rule is set."""
+        return self.target_width is not None or self.baseline_scores is not None
+
+    def order(self, case_ids: List[str], store: CaseStore) -> List[str]:
+        """
+        Put cases in random stratified order.
+
+        Args:
+            case_ids: Case IDs
+            store: Case store the cases are read from (for their source decision)
+
+        Returns:
+            Case IDs in sampling order
+        """
+        return stratified_order(case_strata(case_ids, store), self.seed)
+
+    def add(self, case_id: str, overall_score: float):
+        """Record a case's overall score."""
+        self.scores[case_id] = overall_score
+
+    def interval(self) -> Tuple[float, float, float]:
+        """(mean, low, high) of the overall score so far."""
+        return mean_interval(list(self.scores.values()), self.confidence)
+
+    def deltas(self) -> List[float]:
+        """Per-case differences from the baseline, for the cases it scored."""
+        if not self.baseline_scores:
+            return []
+        return [
+            score - self.baseline_scores[case_id]
+            for case_id, score in self.scores.items()
+            if case_id in self.baseline_scores
+        ]
+
+    def stop_reason(self) -> Optional[str]:
+        """
+        Tell whether the evaluation can stop.
+
+        Returns:
+            "target_width" or "significant_difference", or None to go on
+        """
+        if len(self.scores) < self.min_cases:
+            return None
+        if self.target_width is not None:
+            _, low, high = self.interval()
+            if high - low <= self.target_width:
+                return "target_width"
+        deltas = self.deltas()
+        if len(deltas) >= self.min_cases:
+            _, low, high = mean_interval(deltas, self.confidence)
+            if low > 0 or high < 0:
+                return "significant_difference"
+        return None
+
+    def report(self) -> Dict:
+        """
+        Current estimates.
+
+        Returns:
+            Dict with n_cases, mean, ci_low, ci_high, ci_width, confidence,
+            seed, stop_reason and, with a baseline, n_paired, delta_mean,
+            delta_ci_low and delta_ci_high
+        """
+        mean, low, high = self.interval()
+        report = {
+            "n_cases": len(self.scores),
+            "mean": mean,
+            "ci_low": low,
+            "ci_high": high,
+            "ci_width": high - low,
+            "confidence": self.confidence,
+            "seed": self.seed,
+            "stop_reason": self.stop_reason(),
+        }
+        if self.baseline_scores is not None:
+            deltas = self.deltas()
+            delta_mean, delta_low, delta_high = mean_interval(deltas, self.confidence)
+            report.update({
+                "n_paired": len(deltas),
+                "delta_mean": delta_mean,
+                "delta_ci_low": delta_low,
+                "delta_ci_high": delta_high,
+            })
+        return report
+
+
+def format_sampling_report(report: Dict) -> str:
+    """Format :meth:`SequentialSampler.report` as a one-line status."""
+    line = (
+        f"n={report['n_cases']}: mean {report['mean']:.2f} "
+        f"[{report['ci_low']:.2f}, {report['ci_high']:.2f}] ({report['confidence']:.0%} CI)"
+    )
+    if "delta_mean" in report:
+        line += (
+            f", Δ vs baseline {report['delta_mean']:+.2f} "
+            f"[{report['delta_ci_low']:+.2f}, {report['delta_ci_high']:+.2f}] over {report['n_paired']} cases"
+        )
+    if report["stop_reason"]:
+        line += f" → stop ({report['stop_reason']})"
+    return line
@@ -0,0 +1,361 @@
+"""Vectorized summary statistics of evaluation scores, with bootstrap confidence intervals."""
+
+import re
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from lexic.evals.sampling import case_stratum
+from lexic.shared.io import read_markdown
+
+
+DEFAULT_RESAMPLES = 2000
+DEFAULT_CONFIDENCE = 0.95
+
+# Bootstrap resampling weights are generated in blocks of at most this many cells
+BOOTSTRAP_BLOCK_CELLS = 4_000_000
+
+# Dimension score lines of an evaluation file, as written by format_evaluation
+DIMENSION_LINE = re.compile(r"^### (?P<name>.+): (?P<score>\d+(?:\.\d+)?)/5$", re.MULTILINE)
+
+
+@dataclass
+class ScoreMatrix:
+    """Scores of one step's evaluation: one row per case, one column per rubric dimension."""
+    case_ids: List[str]
+    dimensions: List[str]
+    scores: np.ndarray  # (cases, dimensions); NaN where a dimension was not scored
+    overall: np.ndarray  # (cases,) weighted overall scores
+    errors: np.ndarray  # (cases,) critical error counts
+    decisions: np.ndarray  # (cases,) source decision of each case
+    parties: np.ndarray  # (cases,) party of each case ("pl", "df" or "")
+
+    @classmethod
+    def from_results(
+        cls,
+        results: List[Dict],
+        strata: Optional[Dict[str, Tuple[str, str]]] = None
+    ) -> "ScoreMatrix":
+        """
+        Build the matrix from evaluation results dicts.
+
+        Args:
+            results: Evaluation results dicts (with case_id, scores, overall_score, critical_errors)
+            strata: Dict mapping case ID to (decision, party) (default: from the case IDs)
+
+        Returns:
+            Score matrix
+        """
+        dimensions = list(dict.fromkeys(dim for result in results for dim in result["scores"]))
+        return cls._build(
+            [result["case_id"] for result in results],
+            dimensions,
+            [[result["scores"].get(dim, np.nan) for dim in dimensions] for result in results],
+            [result["overall_score"] for result in results],
+            [len(result["critical_errors"]) for result in results],
+            strata
+        )
+
+    @classmethod
+    def from_run_dir(cls, run_dir: Path) -> "ScoreMatrix":
+        """
+        Read the matrix of a previous run from its ``<case_id>_evaluation.md`` files.
+
+        Decisions and parties are taken from the case IDs; see :meth:`set_strata`.
+
+        Args:
+            run_dir: Output directory of one step's run
+
+        Returns:
+            Score matrix
+
+        Raises:
+            FileNotFoundError: If the directory has no evaluation files
+        """
+        case_ids, rows, overall, errors = [], [], [], []
+        for path in sorted(Path(run_dir).glob("*_evaluation.md")):
+            metadata, content = read_markdown(path)
+            if "case_id" not in metadata or "overall_score" not in metadata:
+                continue
+            case_ids.append(metadata["case_id"])
+            rows.append({match["name"]: float(match["score"]) for match in DIMENSION_LINE.finditer(content)})
+            overall.append(float(metadata["overall_score"]))
+            _, _, error_section = content.partition("## Critical Errors")
+            errors.append(sum(1 for line in error_section.splitlines() if line.startswith("- ")))
+        if not case_ids:
+            raise FileNotFoundError(f"No evaluation files in {run_dir}")
+
+        dimensions = list(dict.fromkeys(dim for row in rows for dim in row))
+        return cls._build(
+            case_ids,
+            dimensions,
+            [[row.get(dim, np.nan) for dim in dimensions] for row in rows],
+            overall,
+            errors,
+            None
+        )
+
+    @classmethod
+    def _build(cls, case_ids, dimensions, scores, overall, errors, strata) -> "ScoreMatrix":
+        labels = [(strata or {}).get(case_id) or case_stratum(case_id) for case_id in case_ids]
+        return cls(
+            case_ids=list(case_ids),
+            dimensions=list(dimensions),
+            scores=np.asarray(scores, dtype=float).reshape(len(case_ids), len(dimensions)),
+            overall=np.asarray(overall, dtype=float),
+            errors=np.asarray(errors, dtype=int),
+            decisions=np.array([decision for decision, _ in labels], dtype=object),
+            parties=np.array([party for _, party in labels], dtype=object),
+        )
+
+    def set_strata(self, strata: Dict[str, Tuple[str, str]]):
+        """Set the decision and party of the cases in ``strata`` (dict of case ID to (decision, party))."""
+        for index, case_id in enumerate(self.case_ids):
+            if case_id in strata:
+                self.decisions[index], self.parties[index] = strata[case_id]
+
+    def overall_by_case(self) -> Dict[str, float]:
+        """Overall score of each case."""
+        return dict(zip(self.case_ids, self.overall.tolist()))
+
+    def values(self) -> np.ndarray:
+        """Dimension scores with the overall score as last column, (cases, dimensions + 1)."""
+        return np.column_stack([self.scores, self.overall])
+
+
+def bootstrap_mean_intervals(
+    values: np.ndarray,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    rng: Optional[np.random.Generator] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Percentile bootstrap confidence intervals of column means.
+
+    Each resample is a row of case counts (how often each case was drawn),
+    built with one ``bincount`` per block of resamples; the column means of
+    all resamples in a block are then one matrix product with the data.
+    Blocks keep memory bounded for thousands of cases. NaN cells (unscored dimensions) are
+    left out of their column's mean.
+
+    Args:
+        values: (cases, columns) observations
+        n_resamples: Number of bootstrap resamples
+        confidence: Confidence level of the intervals
+        rng: Random generator (default: seeded with 0, so intervals are reproducible)
+
+    Returns:
+        (low, high) arrays of shape (columns,); NaN with fewer than two cases
+    """
+    values = np.asarray(values, dtype=float)
+    n_cases, n_columns = values.shape
+    if n_cases < 2:
+        return np.full(n_columns, np.nan), np.full(n_columns, np.nan)
+    rng = rng if rng is not None else np.random.default_rng(0)
+
+    present = ~np.isnan(values)
+    filled = np.where(present, values, 0.0)
+    block = max(1, BOOTSTRAP_BLOCK_CELLS // n_cases)
+    means = np.empty((n_resamples, n_columns))
+    for start in range(0, n_resamples, block):
+        stop = min(start + block, n_resamples)
+        draws = rng.integers(0, n_cases, size=(stop - start, n_cases))
+        draws += np.arange(stop - start)[:, None] * n_cases
+        weights = np.bincount(draws.ravel(), minlength=(stop - start) * n_cases).reshape(-1, n_cases)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means[start:stop] = (weights @ filled) / (weights @ present)
+
+    alpha = (1 - confidence) / 2 * 100
+    with warnings.catch_warnings():
+        # Columns without any score get NaN bounds
+        warnings.simplefilter("ignore", RuntimeWarning)
+        low, high = np.nanpercentile(means, [alpha, 100 - alpha], axis=0)
+    return low, high
+
+
+def format_interval(ci_low: float, ci_high: float, signed: bool = False) -> str:
+    """Format interval bounds as ``[low, high]`` (``n/a`` if undefined)."""
+    if not (np.isfinite(ci_low) and np.isfinite(ci_high)):
+        return "n/a"
+    spec = "+.2f" if signed else ".2f"
+    return f"[{ci_low:{spec}}, {ci_high:{spec}}]"
+
+
+def _interval(mean: float, low: float, high: float) -> Dict[str, float]:
+    return {"mean": float(mean), "ci_low": float(low), "ci_high": float(high)}
+
+
+def group_breakdown(
+    matrix: ScoreMatrix,
+    labels: np.ndarray,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    with_intervals: bool = True
+) -> Dict[str, Dict]:
+    """
+    Overall score statistics per group of cases (e.g. per party or decision).
+
+    Means come from one ``bincount`` over all groups; intervals, if
+    requested, are bootstrapped within each group.
+
+    Args:
+        matrix: Score matrix
+        labels: (cases,) group label of each case
+        n_resamples: Number of bootstrap resamples
+        confidence: Confidence level of the intervals
+        with_intervals: Bootstrap an interval per group
+
+    Returns:
+        Dict mapping group label to n_cases, mean_overall_score and, with
+        intervals, ci_low and ci_high
+    """
+    groups, inverse = np.unique(labels.astype(str), return_inverse=True)
+    counts = np.bincount(inverse, minlength=len(groups))
+    means = np.bincount(inverse, weights=matrix.overall, minlength=len(groups)) / counts
+
+    breakdown = {}
+    rng = np.random.default_rng(0)
+    for index, group in enumerate(groups):
+        stats = {"n_cases": int(counts[index]), "mean_overall_score": float(means[index])}
+        if with_intervals:
+            low, high = bootstrap_mean_intervals(
+                matrix.overall[inverse == index, None], n_resamples, confidence, rng
+            )
+            stats.update({"ci_low": float(low[0]), "ci_high": float(high[0])})
+        breakdown[str(group)] = stats
+    return breakdown
+
+
+def paired_deltas(
+    matrix: ScoreMatrix,
+    baseline: ScoreMatrix,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE
+) -> Dict:
+    """
+    Per-case differences from a baseline run, over the cases and dimensions both scored.
+
+    Args:
+        matrix: Score matrix of the run
+        baseline: Score matrix of the baseline run
+        n_resamples: Number of bootstrap resamples
+        confidence: Confidence level of the intervals
+
+    Returns:
+        Dict with n_paired, overall (mean, ci_low, ci_high of the overall
+        score difference) and dimensions (the same per shared dimension)
+    """
+    baseline_rows = {case_id: index for index, case_id in enumerate(baseline.case_ids)}
+    rows = [index for index, case_id in enumerate(matrix.case_ids) if case_id in baseline_rows]
+    base_rows = [baseline_rows[matrix.case_ids[index]] for index in rows]
+    dimensions = [dim for dim in matrix.dimensions if dim in baseline.dimensions]
+
+    columns = [matrix.dimensions.index(dim) for dim in dimensions]
+    base_columns = [baseline.dimensions.index(dim) for dim in dimensions]
+    deltas = np.column_stack([
+        matrix.scores[np.ix_(rows, columns)] - baseline.scores[np.ix_(base_rows, base_columns)],
+        matrix.overall[rows] - baseline.overall[base_rows],
+    ])
+    with np.errstate(invalid="ignore"):
+        mean = np.nanmean(deltas, axis=0) if rows else np.full(len(dimensions) + 1, np.nan)
+    low, high = bootstrap_mean_intervals(deltas, n_resamples, confidence)
+
+    return {
+        "n_paired": len(rows),
+        "overall": _interval(mean[-1], low[-1], high[-1]),
+        "dimensions": {
+            dim: _interval(mean[index], low[index], high[index])
+            for index, dim in enumerate(dimensions)
+        },
+    }
+
+
+def summarize_matrix(
+    matrix: ScoreMatrix,
+    baseline: Optional[ScoreMatrix] = None,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE
+) -> Dict:
+    """
+    Compute a step's summary statistics.
+
+    Args:
+        matrix: Score matrix of the step's cases (at least one)
+        baseline: Score matrix of a baseline run to compare with
+        n_resamples: Number of bootstrap resamples
+        confidence: Confidence level of the intervals
+
+    Returns:
+        Dict with mean/min/max_overall_score, overall_ci (ci_low, ci_high),
+        dimension_means, dimension_cis, n_cases_with_errors, total_errors,
+        by_party and by_decision (see :func:`group_breakdown`; decisions
+        without intervals), confidence and, with a baseline, baseline
+        (see :func:`paired_deltas`)
+    """
+    values = matrix.values()
+    with np.errstate(invalid="ignore"):
+        means = np.nanmean(values, axis=0)
+    low, high = bootstrap_mean_intervals(values, n_resamples, confidence)
+
+    summary = {
+        "mean_overall_score": float(means[-1]),
+        "min_overall_score": float(matrix.overall.min()),
+        "max_overall_score": float(matrix.overall.max()),
+        "overall_ci": {"ci_low": float(low[-1]), "ci_high": float(high[-1])},
+        "dimension_means": {dim: float(means[index]) for index, dim in enumerate(matrix.dimensions)},
+        "dimension_cis": {
+            dim: {"ci_low": float(low[index]), "ci_high": float(high[index])}
+            for index, dim in enumerate(matrix.dimensions)
+        },
+        "n_cases_with_errors": int((matrix.errors > 0).sum()),
+        "total_errors": int(matrix.errors.sum()),
+        "by_party": group_breakdown(matrix, matrix.parties, n_resamples, confidence),
+        "by_decision": group_breakdown(matrix, matrix.decisions, n_resamples, confidence, with_intervals=False),
+        "confidence": confidence,
+    }
+    if baseline is not None:
+        summary["baseline"] = paired_deltas(matrix, baseline, n_resamples, confidence)
+    return summary
+
+
+def summary_metrics(summary: Dict) -> Dict[str, float]:
+    """
+    Flatten :func:`summarize_matrix` into MLFlow metrics.
+
+    Per-decision statistics are left out (one per decision would swamp the
+    run); they are in the summary file.
+
+    Args:
+        summary: Summary statistics
+
+    Returns:
+        Dict mapping metric name to finite value
+    """
+    metrics = {
+        "mean_overall_score": summary["mean_overall_score"],
+        "min_overall_score": summary["min_overall_score"],
+        "max_overall_score": summary["max_overall_score"],
+        "mean_overall_score_ci_low": summary["overall_ci"]["ci_low"],
+        "mean_overall_score_ci_high": summary["overall_ci"]["ci_high"],
+        "cases_with_errors": summary["n_cases_with_errors"],
+        "total_errors": summary["total_errors"],
+    }
+    for dim, mean in summary["dimension_means"].items():
+        metrics[f"mean_{dim}"] = mean
+        metrics[f"mean_{dim}_ci_low"] = summary["dimension_cis"][dim]["ci_low"]
+        metrics[f"mean_{dim}_ci_high"] = summary["dimension_cis"][dim]["ci_high"]
+    for party, stats in summary["by_party"].items():
+        prefix = f"party_{party or 'unknown'}"
+        metrics[f"{prefix}/n_cases"] = stats["n_cases"]
+        metrics[f"{prefix}/mean_overall_score"] = stats["mean_overall_score"]
+    if "baseline" in summary:
+        baseline = summary["baseline"]
+        metrics["baseline_n_paired"] = baseline["n_paired"]
+        for name, delta in [("overall_score", baseline["overall"]), *baseline["dimensions"].items()]:
+            metrics[f"delta_{name}"] = delta["mean"]
+            metrics[f"delta_{name}_ci_low"] = delta["ci_low"]
+            metrics[f"delta_{name}_ci_high"] = delta["ci_high"]
+    return {key: float(value) for key, value in metrics.items() if np.isfinite(value)}
@@ -0,0 +1,293 @@
+"""Buffered MLFlow logging and the offline tracking store."""
+
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import mlflow
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.tracking import MlflowClient
+
+from lexic.shared.config import Config
+
+
+# MLflow limits per log_batch request: metrics, params and tags each, and all together
+MAX_METRICS_PER_BATCH = 1000
+MAX_PARAMS_PER_BATCH = 100
+MAX_ENTITIES_PER_BATCH = 1000
+
+# Tag set on an offline run once it has been copied to the tracking server (value: server run ID)
+SYNCED_TAG = "lexic.synced_run_id"
+
+# Tag linking a nested run to its parent run
+PARENT_RUN_TAG = "mlflow.parentRunId"
+
+
+def set_up_tracking(experiment_name: str):
+    """
+    Point MLFlow at the configured store and select an experiment.
+
+    In offline mode (``Config.MLFLOW_OFFLINE``) runs go to the local
+    ``Config.MLFLOW_OFFLINE_URI`` store, with artifacts under
+    ``Config.MLFLOW_OFFLINE_ARTIFACT_ROOT``.
+
+    Args:
+        experiment_name: MLFlow experiment name
+    """
+    mlflow.set_tracking_uri(Config.mlflow_tracking_uri())
+    if Config.MLFLOW_OFFLINE and mlflow.get_experiment_by_name(experiment_name) is None:
+        artifact_root = Path(Config.MLFLOW_OFFLINE_ARTIFACT_ROOT)
+        artifact_root.mkdir(parents=True, exist_ok=True)
+        mlflow.create_experiment(experiment_name, artifact_location=artifact_root.resolve().as_uri())
+    mlflow.set_experiment(experiment_name)
+
+
+class RunLogger:
+    """
+    Buffered logging to one MLFlow run.
+
+    Params and metrics are kept in memory and sent with ``log_batch`` on
+    :meth:`flush`, a few requests per run instead of one per value.
+    Artifacts are uploaded by a background thread as soon as they are
+    queued, so uploads overlap with evaluation instead of stalling at the
+    end. Unlike the fluent API, the logger addresses its run by ID and can
+    be used from any thread.
+    """
+
+    def __init__(self, run_id: str, client: Optional[MlflowClient] = None, owns_run: bool = False):
+        """
+        Create a logger for a run.
+
+        Args:
+            run_id: MLFlow run ID
+            client: MLFlow client (default: one for the current tracking URI)
+            owns_run: Terminate the run on :meth:`close`
+        """
+        self.run_id = run_id
+        self.client = client or MlflowClient()
+        self.owns_run = owns_run
+        self.upload_errors: List[str] = []
+        self._params: Dict[str, str] = {}
+        self._metrics: List[Metric] = []
+        self._lock = threading.Lock()
+        self._uploads = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mlflow-upload")
+
+    @classmethod
+    def start_nested(cls, parent_run_id: str, run_name: str) -> "RunLogger":
+        """
+        Create a run nested under another one and a logger that ends it on close.
+
+        Unlike ``mlflow.start_run(nested=True)``, several nested runs can be
+        open at once, e.g. one per step while cases are evaluated.
+
+        Args:
+            parent_run_id: Parent run ID
+            run_name: Name of the nested run
+
+        Returns:
+            Logger of the new run
+        """
+        client = MlflowClient()
+        parent = client.get_run(parent_run_id)
+        run = client.create_run(
+            parent.info.experiment_id,
+            run_name=run_name,
+            tags={PARENT_RUN_TAG: parent_run_id}
+        )
+        return cls(run.info.run_id, client=client, owns_run=True)
+
+    def log_params(self, params: Dict[str, Any]):
+        """Buffer run parameters."""
+        with self._lock:
+            self._params.update({key: str(value) for key, value in params.items()})
+
+    def log_metrics(self, metrics: Dict[str, float], step: int = 0):
+        """Buffer metric values, timestamped now."""
+        timestamp = int(time.time() * 1000)
+        with self._lock:
+            self._metrics.extend(
+                Metric(key, float(value), timestamp, step) for key, value in metrics.items()
+            )
+
+    def log_artifact(self, path: Path, artifact_path: Optional[str] = None):
+        """
+        Queue a file for upload in the background.
+
+        Args:
+            path: Local file
+            artifact_path: Directory within the run's artifacts
+        """
+        self._uploads.submit(self._upload, Path(path), artifact_path)
+
+    def _upload(self, path: Path, artifact_path: Optional[str]):
+        try:
+            self.client.log_artifact(self.run_id, str(path), artifact_path)
+        except Exception as e:
+            # A failed upload must not fail the evaluation; the file stays on disk
+            self.upload_errors.append(path.name)
+            print(f"  ⚠ Artifact upload failed for {path.name}: {e}")
+
+    def flush(self):
+        """Send buffered params and metrics with as few ``log_batch`` requests as possible."""
+        with self._lock:
+            params = [Param(key, value) for key, value in self._params.items()]
+            metrics = self._metrics
+            self._params = {}
+            self._metrics = []
+        log_batch(self.client, self.run_id, metrics=metrics, params=params)
+
+    def close(self, status: str = "FINISHED"):
+        """
+        Flush buffered values, wait for queued uploads and end the run if owned.
+
+        Args:
+            status: Final status of an owned run
+        """
+        self.flush()
+        self._uploads.shutdown(wait=True)
+        if self.upload_errors:
+            print(f"  ⚠ {len(self.upload_errors)} artifact(s) not uploaded; files remain on disk")
+        if self.owns_run:
+            self.client.set_terminated(self.run_id, status=status)
+
+    def __enter__(self) -> "RunLogger":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(status="FAILED" if exc_type else "FINISHED")
+
+
+def log_batch(
+    client: MlflowClient,
+    run_id: str,
+    metrics: Optional[List[Metric]] = None,
+    params: Optional[List[Param]] = None,
+    tags: Optional[List[RunTag]] = None
+):
+    """
+    Log metrics, params and tags to a run in chunks within MLflow's per-request limits.
+
+    Each request takes params and tags first, then fills the rest of the
+    combined entity budget with metrics.
+    """
+    metrics, params, tags = metrics or [], params or [], tags or []
+    while metrics or params or tags:
+        batch_params = params[:MAX_PARAMS_PER_BATCH]
+        batch_tags = tags[:MAX_PARAMS_PER_BATCH]
+        n_metrics = min(MAX_METRICS_PER_BATCH, MAX_ENTITIES_PER_BATCH - len(batch_params) - len(batch_tags))
+        client.log_batch(run_id, metrics=metrics[:n_metrics], params=batch_params, tags=batch_tags)
+        metrics = metrics[n_metrics:]
+        params = params[len(batch_params):]
+        tags = tags[len(batch_tags):]
+
+
+def sync_offline_runs(
+    experiment_name: Optional[str] = None,
+    source_uri: Optional[str] = None,
+    target_uri: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    Copy finished offline runs to the tracking server.
+
+    Each run not synced yet is recreated on the server with its name, tags,
+    params, full metric history, artifacts, status and times; nested runs
+    keep their parent. The offline run is then tagged with the server run
+    ID, so syncing again only copies new runs. Runs still in progress are
+    skipped.
+
+    Args:
+        experiment_name: Only sync this experiment (default: all)
+        source_uri: Offline store (default: Config.MLFLOW_OFFLINE_URI)
+        target_uri: Tracking server (default: Config.MLFLOW_TRACKING_URI)
+
+    Returns:
+        One dict per synced run with experiment, run_name, offline_run_id and run_id
+    """
+    source = MlflowClient(source_uri or Config.MLFLOW_OFFLINE_URI)
+    target = MlflowClient(target_uri or Config.MLFLOW_TRACKING_URI)
+
+    experiments = source.search_experiments()
+    if experiment_name:
+        experiments = [exp for exp in experiments if exp.name == experiment_name]
+
+    synced = []
+    for experiment in experiments:
+        runs = source.search_runs([experiment.experiment_id], max_results=50000, order_by=["attributes.start_time ASC"])
+        # Server IDs of parents, including those synced by an earlier call
+        run_ids = {run.info.run_id: run.data.tags[SYNCED_TAG] for run in runs if SYNCED_TAG in run.data.tags}
+        pending = [
+            run for run in runs
+            if SYNCED_TAG not in run.data.tags and run.info.status != "RUNNING"
+        ]
+        if not pending:
+            continue
+
+        target_experiment = target.get_experiment_by_name(experiment.name)
+        experiment_id = (
+            target_experiment.experiment_id if target_experiment
+            else target.create_experiment(experiment.name)
+        )
+        for run in pending:
+            run_ids[run.info.run_id] = copy_run(source, target, run, experiment_id, run_ids)
+            source.set_tag(run.info.run_id, SYNCED_TAG, run_ids[run.info.run_id])
+            synced.append({
+                "experiment": experiment.name,
+                "run_name": run.info.run_name,
+                "offline_run_id": run.info.run_id,
+                "run_id": run_ids[run.info.run_id],
+            })
+    return synced
+
+
+def copy_run(
+    source: MlflowClient,
+    target: MlflowClient,
+    run: Any,
+    experiment_id: str,
+    run_ids: Dict[str, str]
+) -> str:
+    """
+    Recreate a run in another store.
+
+    Args:
+        source: Client of the store the run is in
+        target: Client of the store to copy it to
+        run: Source run
+        experiment_id: Target experiment ID
+        run_ids: Map of source to target run IDs, used to re-link nested runs
+
+    Returns:
+        Target run ID
+    """
+    tags = {key: value for key, value in run.data.tags.items() if key != SYNCED_TAG}
+    if PARENT_RUN_TAG in tags:
+        parent_id = run_ids.get(tags.pop(PARENT_RUN_TAG))
+        if parent_id:
+            tags[PARENT_RUN_TAG] = parent_id
+
+    new_run = target.create_run(
+        experiment_id,
+        start_time=run.info.start_time,
+        tags=tags,
+        run_name=run.info.run_name
+    )
+    new_run_id = new_run.info.run_id
+
+    metrics = [
+        metric
+        for key in run.data.metrics
+        for metric in source.get_metric_history(run.info.run_id, key)
+    ]
+    params = [Param(key, value) for key, value in run.data.params.items()]
+    log_batch(target, new_run_id, metrics=metrics, params=params)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        local_dir = source.download_artifacts(run.info.run_id, "", tmp_dir)
+        if any(Path(local_dir).iterdir()):
+            target.log_artifacts(new_run_id, local_dir)
+
+    target.set_terminated(new_run_id, status=run.info.status, end_time=run.info.end_time)
+    return new_run_id
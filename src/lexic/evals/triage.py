@@ -0,0 +1,268 @@
+"""Deterministic pre-scoring of agent outputs, to triage judge calls."""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from lexic.evals.judges.rubrics import Rubric
+from lexic.shared.config import Config
+
+
+# Triage modes: no triage, decisions logged but every case judged fully, or decisions applied
+TRIAGE_MODES = ("off", "shadow", "on")
+
+# Triage decisions: no judge call, one single-call judgment, the configured judge
+TRIAGE_DECISIONS = ("skip", "shortcut", "full")
+
+# Case file whose cited articles are compared with the prediction's
+LEGAL_BASIS_FILE = "14_gt_final_legal_basis.md"
+
+# Article citations with an abbreviated law, e.g. "art. 336c CO", "Art. 271a al. 1 let. b CO",
+# "articles 335c et 336 CO", "art. 6 LTr"
+ARTICLE = r"\d+(?:bis|ter|quater|[a-z])?"
+SUBDIVISION = r"(?:(?i:al|ch|let|lit|par)\.|(?i:alinéa))"
+ARTICLE_CITATION = re.compile(
+    rf"\b(?i:art(?:icles?|s?\.?))\s*"
+    rf"(?P<numbers>{ARTICLE}(?:(?:[\s,]+|\s*(?:\bet\b|\band\b)\s*)(?:{SUBDIVISION}\s*)?\w+)*?)"
+    rf"\s+(?P<law>[A-Z][a-z]?[A-Z][A-Za-z]{{0,5}}|Cst)\b"
+)
+ARTICLE_SEPARATOR = re.compile(r"\s*(?:,|\bet\b|\band\b)\s*")
+
+# Words a complete answer does not end with (French and English connectors)
+DANGLING_WORDS = {
+    "et", "ou", "de", "du", "des", "la", "le", "les", "à", "au", "aux", "en", "par", "pour", "que",
+    "qui", "dont", "un", "une", "sur", "dans", "avec", "the", "and", "or", "of", "to", "a", "an",
+}
+
+
+def extract_articles(text: str) -> Set[str]:
+    """
+    Find the legal articles a text cites.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Normalized citations, e.g. {"336c CO", "8 CC"} (paragraphs and letters dropped)
+    """
+    articles = set()
+    for match in ARTICLE_CITATION.finditer(text or ""):
+        for item in ARTICLE_SEPARATOR.split(match.group("numbers")):
+            number = re.match(ARTICLE, item)
+            if number:
+                articles.add(f"{number.group().lower()} {match.group('law')}")
+            # Numbers after a paragraph or letter ("al. 1 et 2") are subdivisions, not articles
+            if re.search(SUBDIVISION, item):
+                break
+    return articles
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of a text."""
+    return re.findall(r"\w+", (text or "").lower())
+
+
+def lexical_overlap(prediction_tokens: List[str], reference_tokens: List[str]) -> float:
+    """Unigram F1 between two token lists (0 if either is empty)."""
+    common = sum((Counter(prediction_tokens) & Counter(reference_tokens)).values())
+    if not common:
+        return 0.0
+    precision = common / len(prediction_tokens)
+    recall = common / len(reference_tokens)
+    return 2 * precision * recall / (precision + recall)
+
+
+def looks_truncated(text: str) -> bool:
+    """
+    Tell whether an output seems cut off.
+
+    An output looks truncated if it leaves a code fence open, or ends on
+    a connecting punctuation mark (comma, colon, opening bracket, dash) or
+    a dangling word such as "et" or "de".
+
+    Args:
+        text: Output text
+
+    Returns:
+        True if the output seems cut off
+    """
+    text = (text or "").rstrip()
+    if not text:
+        return False
+    if text.count("```") % 2:
+        return True
+    if text[-1] in ",;:([{-–/":
+        return True
+    words = tokenize(text[-40:])
+    return bool(words) and words[-1] in DANGLING_WORDS
+
+
+def compute_features(prediction: str, ground_truth: str, legal_basis: Optional[str] = None) -> Dict:
+    """
+    Compute the cheap, deterministic features of an agent output.
+
+    Args:
+        prediction: Agent's output
+        ground_truth: Ground truth reference
+        legal_basis: Case's ground-truth legal basis, whose cited articles are the reference (default: none)
+
+    Returns:
+        Dict with words, length_ratio (prediction words / ground truth
+        words), lexical_overlap (unigram F1), truncated, and, with a legal
+        basis citing articles, article_recall (share of its articles the
+        prediction cites) and article_precision (share of the prediction's
+        articles it cites; None if the prediction cites none)
+    """
+    prediction_tokens = tokenize(prediction)
+    reference_tokens = tokenize(ground_truth)
+    features = {
+        "words": len(prediction_tokens),
+        "length_ratio": len(prediction_tokens) / len(reference_tokens) if reference_tokens else None,
+        "lexical_overlap": lexical_overlap(prediction_tokens, reference_tokens),
+        "truncated": looks_truncated(prediction),
+        "article_recall": None,
+        "article_precision": None,
+    }
+
+    reference_articles = extract_articles(legal_basis) if legal_basis else set()
+    if reference_articles:
+        cited = extract_articles(prediction)
+        features["article_recall"] = len(cited & reference_articles) / len(reference_articles)
+        if cited:
+            features["article_precision"] = len(cited & reference_articles) / len(cited)
+    return features
+
+
+@dataclass
+class TriagePolicy:
+    """Thresholds deciding how each case is judged (defaults from Config)."""
+    min_words: int = Config.TRIAGE_MIN_WORDS
+    min_length_ratio: float = Config.TRIAGE_MIN_LENGTH_RATIO
+    shortcut_overlap: float = Config.TRIAGE_SHORTCUT_OVERLAP
+    shortcut_article_recall: float = Config.TRIAGE_SHORTCUT_ARTICLE_RECALL
+
+    @classmethod
+    def from_config(cls) -> "TriagePolicy":
+        """Policy with the current Config thresholds."""
+        return cls(
+            min_words=Config.TRIAGE_MIN_WORDS,
+            min_length_ratio=Config.TRIAGE_MIN_LENGTH_RATIO,
+            shortcut_overlap=Config.TRIAGE_SHORTCUT_OVERLAP,
+            shortcut_article_recall=Config.TRIAGE_SHORTCUT_ARTICLE_RECALL,
+        )
+
+    def decide(self, features: Dict) -> Tuple[str, str]:
+        """
+        Decide how to judge a case from its features.
+
+        - ``skip``: the output is empty or far shorter than the ground
+          truth; it gets the minimum score without a judge call.
+        - ``shortcut``: the output is complete and close to the ground
+          truth (lexical overlap and, when the case's legal basis cites
+          articles, article recall above the thresholds); one single-call
+          judgment is enough.
+        - ``full``: anything else goes to the configured judge.
+
+        Args:
+            features: Features from :func:`compute_features`
+
+        Returns:
+            (decision, reason)
+        """
+        if features["words"] < self.min_words:
+            return "skip", f"output too short ({features['words']} words)"
+        ratio = features["length_ratio"]
+        if ratio is not None and ratio < self.min_length_ratio:
+            return "skip", f"output {ratio:.0%} of the ground truth length"
+        if features["truncated"]:
+            return "full", "output looks truncated"
+        if features["lexical_overlap"] < self.shortcut_overlap:
+            return "full", f"lexical overlap {features['lexical_overlap']:.2f}"
+        recall = features["article_recall"]
+        if recall is not None and recall < self.shortcut_article_recall:
+            return "full", f"article recall {recall:.2f}"
+        return "shortcut", f"lexical overlap {features['lexical_overlap']:.2f}"
+
+
+def triage_case(
+    prediction: str,
+    ground_truth: str,
+    legal_basis: Optional[str] = None,
+    policy: Optional[TriagePolicy] = None
+) -> Dict:
+    """
+    Pre-score an agent output and decide how to judge it.
+
+    Args:
+        prediction: Agent's output
+        ground_truth: Ground truth reference
+        legal_basis: Case's ground-truth legal basis (default: none)
+        policy: Triage thresholds (default: from Config)
+
+    Returns:
+        Dict with decision, reason and features
+    """
+    features = compute_features(prediction, ground_truth, legal_basis)
+    decision, reason = (policy or TriagePolicy.from_config()).decide(features)
+    return {"decision": decision, "reason": reason, "features": features}
+
+
+def judge_calls(decision: str, rubric: Rubric, judge_mode: str) -> int:
+    """Judge calls a triage decision costs (the per-dimension judge makes one per dimension plus one)."""
+    if decision == "skip":
+        return 0
+    if decision == "shortcut" or judge_mode == "single_call":
+        return 1
+    return len(rubric.dimensions) + 1
+
+
+def skipped_result(rubric: Rubric, reason: str) -> Dict:
+    """
+    Evaluation result of a case skipped by triage: the minimum score on every dimension.
+
+    Args:
+        rubric: Rubric of the step
+        reason: Triage reason
+
+    Returns:
+        Evaluation results dict, like the judge's
+    """
+    explanation = f"Non soumis au juge (triage) : {reason}."
+    return {
+        "scores": {dim.name: 1 for dim in rubric.dimensions},
+        "explanations": {dim.name: explanation for dim in rubric.dimensions},
+        "critical_errors": [f"Sortie inexploitable (triage) : {reason}."],
+        "overall_score": sum(dim.weight for dim in rubric.dimensions),
+    }
+
+
+def summarize_triage(triages: List[Dict], rubric: Rubric, judge_mode: str) -> Dict[str, int]:
+    """
+    Count triage decisions and the judge calls they avoid.
+
+    Args:
+        triages: Triage dicts of the evaluated cases (see :func:`triage_case`)
+        rubric: Rubric of the step
+        judge_mode: Configured judge mode
+
+    Returns:
+        Dict with skip, shortcut and full counts, judge_calls (with
+        triage applied) and judge_calls_untriaged (every case judged fully)
+    """
+    counts = Counter(triage["decision"] for triage in triages)
+    return {
+        **{decision: counts.get(decision, 0) for decision in TRIAGE_DECISIONS},
+        "judge_calls": sum(judge_calls(triage["decision"], rubric, judge_mode) for triage in triages),
+        "judge_calls_untriaged": len(triages) * judge_calls("full", rubric, judge_mode),
+    }
+
+
+def format_triage_stats(stats: Dict[str, int], applied: bool = True) -> str:
+    """Format :func:`summarize_triage` as a one-line report."""
+    saved = stats["judge_calls_untriaged"] - stats["judge_calls"]
+    verb = "avoided" if applied else "would be avoided"
+    return (
+        f"Triage: {stats['skip']} skipped, {stats['shortcut']} shortcut, {stats['full']} judged fully; "
+        f"{saved} of {stats['judge_calls_untriaged']} judge calls {verb}"
+    )
@@ -0,0 +1,195 @@
+"""Persistent SQLite key-value cache with size/age eviction and hit counters."""
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+CACHE_MODES = ("readwrite", "readonly", "off")
+
+
+def content_key(payload: Any) -> str:
+    """
+    Compute a content-addressed cache key.
+
+    Args:
+        payload: JSON-serializable description of everything the value depends on
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding
+    """
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class SQLiteCache:
+    """
+    Thread-safe persistent cache of pickled values in a single SQLite file.
+
+    Entries older than ``max_age_days`` are dropped, and once the stored
+    values exceed ``max_size_mb`` the least recently read entries are evicted.
+    In ``readonly`` mode lookups are served but nothing is written.
+    """
+
+    # Enforce the size limit once every this many writes
+    _EVICTION_INTERVAL = 100
+
+    def __init__(
+        self,
+        path: Path,
+        max_size_mb: float = 2048,
+        max_age_days: float = 30,
+        readonly: bool = False
+    ):
+        """
+        Open (and create if needed) the cache file.
+
+        Args:
+            path: SQLite file path
+            max_size_mb: Maximum total size of stored values
+            max_age_days: Maximum entry age; 0 disables age-based eviction
+            readonly: Serve lookups without ever writing
+        """
+        self.path = Path(path)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.max_age_seconds = max_age_days * 86400
+        self.readonly = readonly
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON entries (accessed_at)")
+        self._conn.commit()
+        if not self.readonly:
+            self.evict()
+
+    def __deepcopy__(self, memo):
+        # DSPy copies LMs with deepcopy; copies must share the one connection
+        return self
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a value, counting the hit or miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss or an expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (self.max_age_seconds and now - row[1] > self.max_age_seconds):
+                self.misses += 1
+                return None
+            self.hits += 1
+            if not self.readonly:
+                self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            # Unreadable entry (e.g. written by an incompatible library version)
+            return None
+
+    def set(self, key: str, value: Any):
+        """
+        Store a value unless the cache is read-only.
+
+        Args:
+            key: Cache key
+            value: Picklable value
+        """
+        if self.readonly:
+            return
+        blob = pickle.dumps(value)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now)
+            )
+            self._conn.commit()
+            self.writes += 1
+            check_size = self.writes % self._EVICTION_INTERVAL == 0
+        if check_size:
+            self.evict()
+
+    def evict(self):
+        """Drop expired entries, then least recently read ones beyond the size limit."""
+        if self.readonly:
+            return
+        with self._lock:
+            removed = 0
+            if self.max_age_seconds:
+                cursor = self._conn.execute(
+                    "DELETE FROM entries WHERE created_at < ?",
+                    (time.time() - self.max_age_seconds,)
+                )
+                removed += cursor.rowcount
+
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_size_bytes:
+                to_delete = []
+                for key, size in self._conn.execute(
+                    "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+                ):
+                    if total <= self.max_size_bytes:
+                        break
+                    to_delete.append((key,))
+                    total -= size
+                self._conn.executemany("DELETE FROM entries WHERE key = ?", to_delete)
+                removed += len(to_delete)
+
+            self._conn.commit()
+            self.evictions += removed
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get usage counters.
+
+        Returns:
+            Dict with hits, misses, writes, evictions, hit_rate, entries and size_mb
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "size_mb": size / (1024 * 1024),
+        }
+
+    def close(self):
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,310 @@
+"""SQLite index of synthetic case files, kept in sync with the files on disk."""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from lexic.shared.config import Config
+from lexic.shared.io import parse_markdown, write_markdown
+
+
+class CaseStore:
+    """
+    Indexed access to the markdown files of a synthetic cases directory.
+
+    Every case file's parsed frontmatter and body are stored in a SQLite
+    index with its size, mtime and SHA-256, so lookups are a primary-key
+    read instead of opening the file and parsing its YAML. The index is
+    validated lazily and stays consistent with hand edits: each lookup
+    stats the file and re-reads it only if its size or mtime changed (a
+    changed mtime with the same hash just refreshes the stat); the case
+    list and each case's file list are rescanned only when the directory's
+    mtime changes (files or cases added or removed). Stores of different
+    case directories can share one index file.
+    """
+
+    def __init__(self, cases_dir: Path, index_path: Path):
+        """
+        Open (and create if needed) the index.
+
+        Args:
+            cases_dir: Directory containing case folders
+            index_path: SQLite index file
+        """
+        self.cases_dir = Path(cases_dir)
+        self.root = str(self.cases_dir.resolve())
+        self.index_path = Path(index_path)
+        self.hits = 0
+        self.parsed = 0
+        self._lock = threading.Lock()
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " root TEXT NOT NULL,"
+            " case_id TEXT NOT NULL,"
+            " name TEXT NOT NULL,"
+            " metadata BLOB NOT NULL,"
+            " body TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " sha256 TEXT NOT NULL,"
+            " PRIMARY KEY (root, case_id, name))"
+        )
+        # Directory listings: case_id "" is the cases directory itself
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS dirs ("
+            " root TEXT NOT NULL,"
+            " case_id TEXT NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " PRIMARY KEY (root, case_id))"
+        )
+        self._conn.commit()
+
+    def _dir_mtime(self, case_id: str) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT mtime_ns FROM dirs WHERE root = ? AND case_id = ?", (self.root, case_id)
+        ).fetchone()
+        return row[0] if row else None
+
+    def list_cases(self) -> List[str]:
+        """
+        List case IDs (non-hidden subdirectories), rescanning only if the directory changed.
+
+        Returns:
+            Sorted case IDs
+        """
+        try:
+            mtime_ns = os.stat(self.cases_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        with self._lock:
+            if self._dir_mtime("") != mtime_ns:
+                case_ids = {
+                    entry.name for entry in os.scandir(self.cases_dir)
+                    if entry.is_dir() and not entry.name.startswith('.')
+                }
+                indexed = {
+                    row[0] for row in self._conn.execute(
+                        "SELECT case_id FROM dirs WHERE root = ? AND case_id != ''", (self.root,)
+                    )
+                }
+                for case_id in indexed - case_ids:
+                    self._conn.execute("DELETE FROM dirs WHERE root = ? AND case_id = ?", (self.root, case_id))
+                    self._conn.execute("DELETE FROM files WHERE root = ? AND case_id = ?", (self.root, case_id))
+                # New cases get an unknown listing mtime, so their files are scanned on first read
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO dirs (root, case_id, mtime_ns) VALUES (?, ?, -1)",
+                    [(self.root, case_id) for case_id in case_ids - indexed]
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO dirs (root, case_id, mtime_ns) VALUES (?, '', ?)",
+                    (self.root, mtime_ns)
+                )
+                self._conn.commit()
+            return [
+                row[0] for row in self._conn.execute(
+                    "SELECT case_id FROM dirs WHERE root = ? AND case_id != '' ORDER BY case_id", (self.root,)
+                )
+            ]
+
+    def read(self, case_id: str, file_name: str) -> Tuple[Dict[str, Any], str]:
+        """
+        Get a case file's frontmatter and body.
+
+        Args:
+            case_id: Case ID
+            file_name: File name (e.g., '12_gt_final_factual_record.md')
+
+        Returns:
+            Tuple of (metadata, content)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        path = self.cases_dir / case_id / file_name
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM files WHERE root = ? AND case_id = ? AND name = ?", (self.root, case_id, file_name)
+                )
+                self._conn.commit()
+            raise FileNotFoundError(f"Step file not found: {path}")
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT metadata, body, size, mtime_ns, sha256 FROM files"
+                " WHERE root = ? AND case_id = ? AND name = ?",
+                (self.root, case_id, file_name)
+            ).fetchone()
+            if row is not None and (row[2], row[3]) == (stat.st_size, stat.st_mtime_ns):
+                self.hits += 1
+                return pickle.loads(row[0]), row[1]
+
+        return self._index(case_id, file_name, path, row[4] if row else None)
+
+    def _index(self, case_id: str, file_name: str, path: Path, known_hash: Optional[str]) -> Tuple[Dict[str, Any], str]:
+        """Read a file whose index entry is missing or stale and update the entry."""
+        # Stat before reading: an edit in between leaves a stale stat, caught on the next lookup
+        stat = os.stat(path)
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            if digest == known_hash:
+                # Touched but not changed
+                self._conn.execute(
+                    "UPDATE files SET size = ?, mtime_ns = ? WHERE root = ? AND case_id = ? AND name = ?",
+                    (stat.st_size, stat.st_mtime_ns, self.root, case_id, file_name)
+                )
+                self._conn.commit()
+                row = self._conn.execute(
+                    "SELECT metadata, body FROM files WHERE root = ? AND case_id = ? AND name = ?",
+                    (self.root, case_id, file_name)
+                ).fetchone()
+                self.hits += 1
+                return pickle.loads(row[0]), row[1]
+
+        # Same newline handling as reading the file in text mode
+        text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        metadata, body = parse_markdown(text)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (root, case_id, name, metadata, body, size, mtime_ns, sha256)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.root, case_id, file_name, pickle.dumps(metadata), body,
+                 stat.st_size, stat.st_mtime_ns, digest)
+            )
+            self._conn.commit()
+            self.parsed += 1
+        return metadata, body
+
+    def read_case(self, case_id: str) -> Dict[str, Tuple[Dict[str, Any], str]]:
+        """
+        Get every markdown file of a case.
+
+        Args:
+            case_id: Case ID
+
+        Returns:
+            Dict mapping file name to (metadata, content), in file name order
+
+        Raises:
+            FileNotFoundError: If the case does not exist
+        """
+        case_dir = self.cases_dir / case_id
+        try:
+            mtime_ns = os.stat(case_dir).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Case not found: {case_dir}")
+
+        with self._lock:
+            if self._dir_mtime(case_id) != mtime_ns:
+                names = {
+                    entry.name for entry in os.scandir(case_dir)
+                    if entry.is_file() and entry.name.endswith(".md") and not entry.name.startswith('.')
+                }
+                indexed = {
+                    row[0] for row in self._conn.execute(
+                        "SELECT name FROM files WHERE root = ? AND case_id = ?", (self.root, case_id)
+                    )
+                }
+                self._conn.executemany(
+                    "DELETE FROM files WHERE root = ? AND case_id = ? AND name = ?",
+                    [(self.root, case_id, name) for name in indexed - names]
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO dirs (root, case_id, mtime_ns) VALUES (?, ?, ?)",
+                    (self.root, case_id, mtime_ns)
+                )
+                self._conn.commit()
+            else:
+                names = {
+                    row[0] for row in self._conn.execute(
+                        "SELECT name FROM files WHERE root = ? AND case_id = ?", (self.root, case_id)
+                    )
+                }
+
+        files = {}
+        for name in sorted(names):
+            try:
+                files[name] = self.read(case_id, name)
+            except FileNotFoundError:
+                pass  # Deleted since the listing
+        return files
+
+    def write(self, case_id: str, file_name: str, metadata: Dict[str, Any], content: str):
+        """
+        Write a case file and index it.
+
+        Args:
+            case_id: Case ID
+            file_name: File name
+            metadata: Frontmatter
+            content: Markdown content
+        """
+        path = self.cases_dir / case_id / file_name
+        write_markdown(path, metadata, content)
+        self._index(case_id, file_name, path, None)
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the whole index up to date with the cases directory.
+
+        Returns:
+            Dict with cases, files and parsed (files read from disk)
+        """
+        parsed_before = self.parsed
+        case_ids = self.list_cases()
+        files = sum(len(self.read_case(case_id)) for case_id in case_ids)
+        return {"cases": len(case_ids), "files": files, "parsed": self.parsed - parsed_before}
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get lookup counters.
+
+        Returns:
+            Dict with hits (served from the index) and parsed (read from disk)
+        """
+        return {"hits": self.hits, "parsed": self.parsed}
+
+    def close(self):
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def format_case_store_stats(stats: Dict[str, int]) -> str:
+    """Format :meth:`CaseStore.stats` as a one-line report."""
+    return f"Case store: {stats['hits']} files served from the index, {stats['parsed']} read from disk"
+
+
+_case_stores: Dict[str, CaseStore] = {}
+_case_stores_lock = threading.Lock()
+
+
+def get_case_store(cases_dir: Optional[Path] = None) -> CaseStore:
+    """
+    Get the process-wide store of a cases directory, opening it on first use.
+
+    Args:
+        cases_dir: Directory containing case folders (default: Config.SYNTHETIC_CASES_DIR)
+
+    Returns:
+        Shared store, indexed in ``Config.CASE_INDEX_PATH``
+    """
+    cases_dir = Path(cases_dir or Config.SYNTHETIC_CASES_DIR)
+    key = str(cases_dir.resolve())
+    with _case_stores_lock:
+        store = _case_stores.get(key)
+        if store is None:
+            store = _case_stores[key] = CaseStore(cases_dir, Config.CASE_INDEX_PATH)
+        return store
@@ -0,0 +1,191 @@
+"""Concurrency limits on in-flight LM calls, per upstream model, and worker pools."""
+
+import asyncio
+import contextvars
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+from lexic.shared.config import Config
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ModelConcurrencyLimiter:
+    """
+    Caps the number of concurrent provider calls per model.
+
+    Limits are looked up by full LiteLLM model name first, then without the
+    provider prefix (``anthropic/claude-...`` matches ``claude-...``), then
+    fall back to the default; a limit of 0 means unlimited. Synchronous
+    callers share one ``threading.BoundedSemaphore`` per model; asynchronous
+    callers share one ``asyncio.Semaphore`` per model and event loop.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default: int = 0):
+        """
+        Initialize limiter.
+
+        Args:
+            limits: Per-model limits (default: none)
+            default: Limit for models not in ``limits`` (0 = unlimited)
+        """
+        self.limits = dict(limits or {})
+        self.default = default
+        self._lock = threading.Lock()
+        self._thread_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._loop_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._in_flight: Dict[str, int] = {}
+        self._waiting: Dict[str, int] = {}
+
+    def limit_for(self, model: str) -> int:
+        """Get the concurrency limit of a model (0 = unlimited)."""
+        if model in self.limits:
+            return self.limits[model]
+        return self.limits.get(model.split("/", 1)[-1], self.default)
+
+    def _count(self, counter: Dict[str, int], model: str, delta: int):
+        with self._lock:
+            counter[model] = counter.get(model, 0) + delta
+
+    @contextmanager
+    def slot(self, model: str) -> Iterator[None]:
+        """
+        Hold one of the model's call slots for the duration of the block.
+
+        Args:
+            model: LiteLLM model name
+        """
+        limit = self.limit_for(model)
+        if limit <= 0:
+            yield
+            return
+
+        with self._lock:
+            semaphore = self._thread_semaphores.get(model)
+            if semaphore is None:
+                semaphore = self._thread_semaphores[model] = threading.BoundedSemaphore(limit)
+        self._count(self._waiting, model, 1)
+        semaphore.acquire()
+        self._count(self._waiting, model, -1)
+        self._count(self._in_flight, model, 1)
+        try:
+            yield
+        finally:
+            self._count(self._in_flight, model, -1)
+            semaphore.release()
+
+    @asynccontextmanager
+    async def aslot(self, model: str) -> AsyncIterator[None]:
+        """Asynchronous variant of :meth:`slot`."""
+        limit = self.limit_for(model)
+        if limit <= 0:
+            yield
+            return
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._loop_semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(model)
+            if semaphore is None:
+                semaphore = semaphores[model] = asyncio.Semaphore(limit)
+        self._count(self._waiting, model, 1)
+        try:
+            await semaphore.acquire()
+        finally:
+            self._count(self._waiting, model, -1)
+        self._count(self._in_flight, model, 1)
+        try:
+            yield
+        finally:
+            self._count(self._in_flight, model, -1)
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get per-model slot usage.
+
+        Returns:
+            Dict mapping each model seen so far to its limit, in_flight and
+            waiting call counts
+        """
+        with self._lock:
+            models = set(self._in_flight) | set(self._waiting)
+            return {
+                model: {
+                    "limit": self.limit_for(model),
+                    "in_flight": self._in_flight.get(model, 0),
+                    "waiting": self._waiting.get(model, 0),
+                }
+                for model in sorted(models)
+            }
+
+
+def map_in_threads(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    workers: int,
+    executor: Optional[ThreadPoolExecutor] = None
+) -> List[R]:
+    """
+    Apply ``fn`` to every item with at most ``workers`` calls in flight.
+
+    Each call runs in a copy of the caller's context, so DSPy settings,
+    usage tracking and request timeouts set around the call apply in the
+    worker threads too. With one worker the items are processed in the
+    calling thread.
+
+    Given a shared ``executor``, the calls are queued on it instead of a
+    pool created for this call, so its size bounds the calls in flight
+    across every caller. ``fn`` must then not itself wait on the same
+    executor, or the pool can deadlock.
+
+    Args:
+        fn: Function of one item
+        items: Items to process
+        workers: Maximum number of concurrent calls (with an executor, only 1 or less matters: run inline)
+        executor: Shared pool to run the calls on (default: a pool of ``workers`` threads)
+
+    Returns:
+        Results in the order of ``items``
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    if executor is not None:
+        futures = [executor.submit(contextvars.copy_context().run, fn, item) for item in items]
+        return [future.result() for future in futures]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items)), thread_name_prefix="lexic-worker") as executor:
+        futures = [executor.submit(contextvars.copy_context().run, fn, item) for item in items]
+        return [future.result() for future in futures]
+
+
+_model_limiter: Optional[ModelConcurrencyLimiter] = None
+
+
+def get_model_limiter() -> ModelConcurrencyLimiter:
+    """
+    Get the process-wide model concurrency limiter, creating it on first use.
+
+    Limits come from ``Config.LM_MODEL_CONCURRENCY`` and
+    ``Config.LM_MAX_CONCURRENCY``.
+
+    Returns:
+        Shared limiter
+    """
+    global _model_limiter
+
+    if _model_limiter is None:
+        _model_limiter = ModelConcurrencyLimiter(
+            limits=Config.LM_MODEL_CONCURRENCY,
+            default=Config.LM_MAX_CONCURRENCY
+        )
+    return _model_limiter
@@ -2,7 +2,21 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+
+
+def parse_model_map(value: str) -> Dict[str, str]:
+    """
+    Parse a ``name=value,name=value`` environment setting (per model or per stage).
+
+    Args:
+        value: Comma-separated ``key=value`` pairs (empty for none)
+
+    Returns:
+        Dict mapping keys to raw string values
+    """
+    pairs = (item.split("=", 1) for item in value.split(",") if "=" in item)
+    return {key.strip(): raw.strip() for key, raw in pairs}
 
 
 class Config:
@@ -15,6 +29,7 @@ class Config:
     SYNTHETIC_CASES_DIR = DATA_DIR / "synthetic_cases"
     EVAL_RUNS_DIR = DATA_DIR / "eval_runs"
     MLRUNS_DIR = PROJECT_ROOT / "mlruns"
+    CACHE_DIR = Path(os.getenv("LEXIC_CACHE_DIR", PROJECT_ROOT / ".cache"))
 
     # LLM Configuration
     ANTHROPIC_API_KEY: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
@@ -23,18 +38,112 @@ class Config:
     GENERATION_MODEL: str = os.getenv("GENERATION_MODEL", "claude-3-5-sonnet-20241022")
     JUDGE_MODEL: str = os.getenv("JUDGE_MODEL", "claude-3-5-sonnet-20241022")
 
+    # Model routing: per-stage models (e.g. "legal_basis=claude-3-5-sonnet-20241022") and a
+    # smaller model for mechanical stages and simple cases ("" disables the small-model rule)
+    STAGE_MODELS: Dict[str, str] = parse_model_map(os.getenv("STAGE_MODELS", ""))
+    SMALL_MODEL: str = os.getenv("SMALL_MODEL", "")
+    SMALL_MODEL_STAGES: List[str] = [
+        stage.strip() for stage in os.getenv("SMALL_MODEL_STAGES", "investigation_report").split(",")
+        if stage.strip()
+    ]
+    SMALL_MODEL_MAX_COMPLEXITY: int = int(os.getenv("SMALL_MODEL_MAX_COMPLEXITY", "3"))
+
     # DSPy Configuration
-    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))  # Retries of transient LM errors
+    RETRY_BACKOFF_S: float = float(os.getenv("RETRY_BACKOFF_S", "1"))  # Base of the exponential backoff
+    RETRY_BACKOFF_MAX_S: float = float(os.getenv("RETRY_BACKOFF_MAX_S", "30"))
     TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
 
+    # Per-stage deadline in seconds (0 = none), covering all LM attempts, retries and waits
+    # of a pipeline step; STAGE_TIMEOUTS overrides per step, e.g. "judgment=300,recommendations=180"
+    STAGE_TIMEOUT_S: float = float(os.getenv("STAGE_TIMEOUT_S", "0"))
+    STAGE_TIMEOUTS: Dict[str, float] = {
+        stage: float(timeout) for stage, timeout in parse_model_map(os.getenv("STAGE_TIMEOUTS", "")).items()
+    }
+
+    # Hedged requests: duplicate a step still running after its stage's p95 latency
+    HEDGE_REQUESTS: bool = os.getenv("HEDGE_REQUESTS", "").lower() in ("1", "true", "yes")
+    HEDGE_MIN_SAMPLES: int = int(os.getenv("HEDGE_MIN_SAMPLES", "10"))  # Latencies seen before hedging
+    HEDGE_MAX_WORKERS: int = int(os.getenv("HEDGE_MAX_WORKERS", "16"))  # Threads for hedged attempts
+
+    # Directory of optimized agent states (<step_name>.json), loaded once per process
+    OPTIMIZED_PROGRAMS_DIR: Optional[Path] = (
+        Path(os.environ["OPTIMIZED_PROGRAMS_DIR"]) if os.getenv("OPTIMIZED_PROGRAMS_DIR") else None
+    )
+
+    # Fake LM for local runs without provider calls (canned answers, no API key needed)
+    FAKE_LM: bool = os.getenv("LEXIC_FAKE_LM", "").lower() in ("1", "true", "yes")
+    FAKE_LM_LATENCY_S: float = float(os.getenv("LEXIC_FAKE_LM_LATENCY_S", "0"))
+
+    # Maximum in-flight LM calls per upstream model (0 = unlimited);
+    # LM_MODEL_CONCURRENCY overrides per model, e.g. "claude-3-5-sonnet-20241022=4"
+    LM_MAX_CONCURRENCY: int = int(os.getenv("LM_MAX_CONCURRENCY", "0"))
+    LM_MODEL_CONCURRENCY: Dict[str, int] = {
+        model: int(limit) for model, limit in parse_model_map(os.getenv("LM_MODEL_CONCURRENCY", "")).items()
+    }
+
+    # Rate limits per upstream model (0 = unlimited); LM_MODEL_RPM / LM_MODEL_TPM
+    # override per model, e.g. "claude-3-5-sonnet-20241022=50"
+    LM_RPM: int = int(os.getenv("LM_RPM", "0"))  # Requests per minute
+    LM_TPM: int = int(os.getenv("LM_TPM", "0"))  # Input tokens per minute
+    LM_MODEL_RPM: Dict[str, int] = {
+        model: int(limit) for model, limit in parse_model_map(os.getenv("LM_MODEL_RPM", "")).items()
+    }
+    LM_MODEL_TPM: Dict[str, int] = {
+        model: int(limit) for model, limit in parse_model_map(os.getenv("LM_MODEL_TPM", "")).items()
+    }
+
+    # LM Response Cache Configuration
+    LM_CACHE_MODE: str = os.getenv("LM_CACHE_MODE", "readwrite")  # readwrite, readonly or off
+    LM_CACHE_PATH: Path = CACHE_DIR / "lm_responses.sqlite"
+    LM_CACHE_MAX_SIZE_MB: float = float(os.getenv("LM_CACHE_MAX_SIZE_MB", "2048"))
+    LM_CACHE_MAX_AGE_DAYS: float = float(os.getenv("LM_CACHE_MAX_AGE_DAYS", "30"))
+
+    # Index of synthetic case files (frontmatter, body, size, mtime, hash)
+    CASE_INDEX_PATH: Path = Path(os.getenv("CASE_INDEX_PATH", CACHE_DIR / "case_index.sqlite"))
+
+    # Judge verdict cache (per rubric dimension, prediction and ground truth)
+    JUDGE_CACHE_MODE: str = os.getenv("JUDGE_CACHE_MODE", "readwrite")  # readwrite, readonly or off
+    JUDGE_CACHE_PATH: Path = CACHE_DIR / "judge_verdicts.sqlite"
+
     # MLFlow Configuration
     MLFLOW_TRACKING_URI: str = os.getenv("MLFLOW_TRACKING_URI", "http://localhost:5000")
     MLFLOW_BACKEND_STORE_URI: str = os.getenv("MLFLOW_BACKEND_STORE_URI", f"sqlite:///{PROJECT_ROOT}/mlruns/mlflow.db")
     MLFLOW_ARTIFACT_ROOT: str = os.getenv("MLFLOW_ARTIFACT_ROOT", str(PROJECT_ROOT / "mlruns"))
     MLFLOW_EXPERIMENT_NAME: str = os.getenv("MLFLOW_EXPERIMENT_NAME", "lexic-evaluation")
 
+    # Offline mode: log to a local store instead of the tracking server, then copy
+    # the runs over with `lexic mlflow-sync`
+    MLFLOW_OFFLINE: bool = os.getenv("MLFLOW_OFFLINE", "").lower() in ("1", "true", "yes")
+    MLFLOW_OFFLINE_URI: str = os.getenv("MLFLOW_OFFLINE_URI", f"sqlite:///{PROJECT_ROOT}/mlruns/offline.db")
+    MLFLOW_OFFLINE_ARTIFACT_ROOT: str = os.getenv(
+        "MLFLOW_OFFLINE_ARTIFACT_ROOT", str(PROJECT_ROOT / "mlruns" / "offline_artifacts")
+    )
+
+    # API Configuration
+    API_WORKERS: int = int(os.getenv("API_WORKERS", "4"))  # Requests processed concurrently
+    API_QUEUE_SIZE: int = int(os.getenv("API_QUEUE_SIZE", "16"))  # Requests waiting before 429
+    API_JOB_WORKERS: int = int(os.getenv("API_JOB_WORKERS", "2"))  # Background jobs run concurrently
+    API_MAX_PENDING_JOBS: int = int(os.getenv("API_MAX_PENDING_JOBS", "100"))  # Queued jobs before 429
+    API_JOBS_DB: Path = Path(os.getenv("API_JOBS_DB", DATA_DIR / "api_jobs.sqlite"))
+    API_JOBS_DIR: Path = DATA_DIR / "api_jobs"  # Per-job step outputs, reused on restart
+
     # Evaluation Configuration
     JUDGE_TEMPERATURE: float = 0.0  # Deterministic for consistency
+    # "per_dimension" (one call per rubric dimension plus one for critical errors)
+    # or "single_call" (all dimensions and critical errors in one call)
+    JUDGE_MODE: str = os.getenv("JUDGE_MODE", "per_dimension")
+    # Per-dimension judge calls in flight across the process (one shared thread pool)
+    JUDGE_MAX_CONCURRENCY: int = int(os.getenv("JUDGE_MAX_CONCURRENCY", "16"))
+
+    # Judge call triage from cheap output features: "off", "shadow" (decisions
+    # logged, every case judged fully) or "on" (empty outputs skipped, close
+    # matches judged in a single call)
+    TRIAGE_MODE: str = os.getenv("TRIAGE_MODE", "off")
+    TRIAGE_MIN_WORDS: int = int(os.getenv("TRIAGE_MIN_WORDS", "20"))  # Fewer words: skipped
+    TRIAGE_MIN_LENGTH_RATIO: float = float(os.getenv("TRIAGE_MIN_LENGTH_RATIO", "0.1"))  # Shorter vs GT: skipped
+    TRIAGE_SHORTCUT_OVERLAP: float = float(os.getenv("TRIAGE_SHORTCUT_OVERLAP", "0.6"))  # Unigram F1 vs GT
+    TRIAGE_SHORTCUT_ARTICLE_RECALL: float = float(os.getenv("TRIAGE_SHORTCUT_ARTICLE_RECALL", "0.8"))
 
     @classmethod
     def ensure_dirs(cls):
@@ -47,9 +156,16 @@ class Config:
         ]:
             dir_path.mkdir(parents=True, exist_ok=True)
 
+    @classmethod
+    def mlflow_tracking_uri(cls) -> str:
+        """Tracking URI runs are logged to: the offline store in offline mode, else the server."""
+        return cls.MLFLOW_OFFLINE_URI if cls.MLFLOW_OFFLINE else cls.MLFLOW_TRACKING_URI
+
     @classmethod
     def validate(cls):
         """Validate configuration."""
-        if not cls.ANTHROPIC_API_KEY:
+        if not cls.ANTHROPIC_API_KEY and not cls.FAKE_LM:
             raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+        if cls.TRIAGE_MODE not in ("off", "shadow", "on"):
+            raise ValueError(f"Unknown TRIAGE_MODE: {cls.TRIAGE_MODE} (expected off, shadow or on)")
         cls.ensure_dirs()
@@ -0,0 +1,86 @@
+"""Offline LM that answers every request with placeholder output fields."""
+
+import asyncio
+import re
+import time
+from typing import Any, List, Optional
+
+import litellm
+
+from lexic.shared.lm import LexicLM
+from lexic.shared.rate_limit import estimate_prompt_tokens
+
+
+# Output field markers listed in the ChatAdapter's closing instruction
+_OUTPUT_MARKER = re.compile(r"`\[\[ ## (\w+) ## \]\]`")
+
+
+def _message_text(message: dict) -> str:
+    """Get the text of a chat message with string or content-block content."""
+    content = message.get("content") or ""
+    if isinstance(content, list):
+        return "\n".join(block.get("text", "") for block in content if isinstance(block, dict))
+    return content
+
+
+class FakeLM(LexicLM):
+    """
+    LexicLM that never calls a provider.
+
+    Every request is answered with one placeholder value per output field
+    requested by the ChatAdapter (``score`` fields get ``3``), with token
+    usage estimated at four characters per token and an optional simulated
+    latency. Responses go through the same concurrency limits and usage
+    tracking as real calls, so the pipeline, the CLI and the API can be run
+    and load-tested locally (``LEXIC_FAKE_LM=1``).
+    """
+
+    def __init__(self, model: str, latency_s: float = 0.0, **kwargs):
+        """
+        Initialize fake LM.
+
+        Args:
+            model: Model name reported in responses and usage records
+            latency_s: Seconds to wait before answering each request
+            **kwargs: Passed to LexicLM (temperature, max_tokens, ...)
+        """
+        kwargs.pop("response_cache", None)
+        super().__init__(model=model, response_cache=None, **kwargs)
+        self.latency_s = latency_s
+
+    def _respond(self, prompt: Optional[str], messages: Optional[List[dict]]) -> Any:
+        """Build a LiteLLM response with a placeholder for every output field."""
+        prompt_tokens = estimate_prompt_tokens(prompt, messages)
+        messages = messages or [{"role": "user", "content": prompt or ""}]
+        fields = [
+            name for name in _OUTPUT_MARKER.findall(_message_text(messages[-1]))
+            if name != "completed"
+        ]
+        sections = [
+            f"[[ ## {name} ## ]]\n" + ("3" if "score" in name else f"Réponse simulée pour {name}.")
+            for name in dict.fromkeys(fields)
+        ]
+        content = "\n\n".join(sections + ["[[ ## completed ## ]]"])
+
+        completion_tokens = len(content) // 4
+        return litellm.ModelResponse(
+            model=self.model,
+            choices=[{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        )
+
+    def _call_provider(self, prompt: Optional[str], messages: Optional[list], **kwargs) -> Any:
+        """Answer locally after the simulated latency."""
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+        return self._respond(prompt, messages)
+
+    async def _acall_provider(self, prompt: Optional[str], messages: Optional[list], **kwargs) -> Any:
+        """Asynchronous variant of :meth:`_call_provider`."""
+        if self.latency_s > 0:
+            await asyncio.sleep(self.latency_s)
+        return self._respond(prompt, messages)
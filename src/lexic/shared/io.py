@@ -18,6 +18,19 @@ def read_markdown(path: Path) -> Tuple[Dict[str, Any], str]:
     with open(path, 'r', encoding='utf-8') as f:
         content = f.read()
 
+    return parse_markdown(content)
+
+
+def parse_markdown(content: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Split markdown text into YAML frontmatter and body.
+
+    Args:
+        content: Full file content
+
+    Returns:
+        Tuple of (metadata_dict, content_string)
+    """
     # Check for frontmatter
     if content.startswith('---\n'):
         parts = content.split('---\n', 2)
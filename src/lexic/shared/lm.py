@@ -0,0 +1,525 @@
+"""Language model construction with a shared persistent response cache."""
+
+import asyncio
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import dspy
+
+from lexic.shared.cache import CACHE_MODES, SQLiteCache, content_key
+from lexic.shared.concurrency import get_model_limiter
+from lexic.shared.config import Config
+from lexic.shared.rate_limit import estimate_prompt_tokens, get_rate_limiter
+
+
+_response_cache: Optional[SQLiteCache] = None
+
+# Usage record lists currently collecting (innermost last), per thread / task
+_usage_collectors: ContextVar[Tuple[List[Dict[str, Any]], ...]] = ContextVar(
+    "lexic_usage_collectors", default=()
+)
+
+# time.monotonic() by which LM calls in the current thread / task must be done (None = no deadline)
+_deadline: ContextVar[Optional[float]] = ContextVar("lexic_lm_deadline", default=None)
+
+# Event set when the LM calls of the current thread are abandoned (e.g. a losing hedged attempt)
+_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar("lexic_lm_cancel", default=None)
+
+# HTTP statuses of transient provider errors (529: Anthropic overloaded)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+# Usage record fields summed by summarize_usage
+_USAGE_TOTALS = (
+    "prompt_tokens", "completion_tokens", "cache_read_tokens", "cache_creation_tokens", "cost_usd",
+    "rate_limit_wait_s", "retries",
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised by LexicLM when a call runs out of the time set by :func:`lm_deadline`."""
+
+
+class LMCallCancelled(Exception):
+    """Raised by LexicLM in a thread whose calls were abandoned (see :func:`lm_cancel_event`)."""
+
+
+@contextmanager
+def track_lm_usage(
+    isolated: bool = False,
+    records: Optional[List[Dict[str, Any]]] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Collect a usage record for every LexicLM call made inside the block.
+
+    Tracking follows the current thread or asyncio task (tasks started inside
+    the block are included) and blocks may be nested; each record goes to
+    every enclosing collector, unless the block is ``isolated``: its records
+    then reach no enclosing collector, and the caller decides where they go
+    (see :func:`report_lm_usage`).
+
+    Args:
+        isolated: Keep the records from the enclosing collectors
+        records: List to collect into, as calls finish (default: a new one)
+
+    Yields:
+        List that receives one dict per LM call with model, cached_response,
+        prompt_tokens, completion_tokens, cache_read_tokens,
+        cache_creation_tokens, cost_usd, rate_limit_wait_s and retries
+    """
+    records = [] if records is None else records
+    collectors = () if isolated else _usage_collectors.get()
+    token = _usage_collectors.set(collectors + (records,))
+    try:
+        yield records
+    finally:
+        _usage_collectors.reset(token)
+
+
+def report_lm_usage(records: Iterable[Dict[str, Any]]):
+    """Add usage records, e.g. from an isolated :func:`track_lm_usage` block, to the active collectors."""
+    records = list(records)
+    for collector in _usage_collectors.get():
+        collector.extend(records)
+
+
+@contextmanager
+def lm_deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Give the LexicLM calls made inside the block an overall deadline.
+
+    Everything counts against it: every attempt and retry, backoff and
+    rate-limit waits. Each request's provider timeout is the time left, no
+    attempt starts once it is gone, and a call that runs out raises
+    :class:`DeadlineExceeded`. Nested deadlines keep the earliest.
+
+    Args:
+        seconds: Time allowed from now (None or 0 for no deadline)
+    """
+    if not seconds:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def lm_cancel_event(event: threading.Event) -> Iterator[None]:
+    """
+    Abandon the LexicLM calls made inside the block once ``event`` is set.
+
+    A request already sent runs to completion, but no further attempt,
+    retry or call starts: they raise :class:`LMCallCancelled`. Used to stop
+    threads that cannot be interrupted, like losing hedged attempts.
+
+    Args:
+        event: Event that abandons the calls
+    """
+    token = _cancel_event.set(event)
+    try:
+        yield
+    finally:
+        _cancel_event.reset(token)
+
+
+def lm_time_left() -> Optional[float]:
+    """
+    Get the seconds left before the current :func:`lm_deadline`.
+
+    Returns:
+        Seconds left (None without a deadline)
+
+    Raises:
+        LMCallCancelled: If the calls of this thread were abandoned
+        DeadlineExceeded: If the deadline has passed
+    """
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise LMCallCancelled("LM calls abandoned")
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded("LM call deadline exceeded")
+    return left
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an LM call error is transient (timeout, connection, rate limit, overload, 5xx)."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    return getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES
+
+
+def retry_delay(error: BaseException, attempt: int) -> float:
+    """
+    Backoff before retrying a failed LM call.
+
+    Full-jitter exponential backoff: uniform in ``[0, min(max, base * 2**attempt)]``,
+    but never shorter than a ``Retry-After`` header sent by the provider.
+
+    Args:
+        error: Error of the failed attempt
+        attempt: Number of the failed attempt, from 0
+
+    Returns:
+        Seconds to wait
+    """
+    delay = random.uniform(0, min(Config.RETRY_BACKOFF_MAX_S, Config.RETRY_BACKOFF_S * 2 ** attempt))
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return max(delay, float(headers.get("retry-after", 0)))
+    except (TypeError, ValueError):
+        return delay
+
+
+def summarize_usage(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate usage records from :func:`track_lm_usage`.
+
+    Responses served from the local response cache are counted as calls but
+    not as provider tokens.
+
+    Args:
+        records: Usage records
+
+    Returns:
+        Dict with calls, cached_responses, prompt_tokens, completion_tokens,
+        cache_read_tokens, cache_creation_tokens, cost_usd, rate_limit_wait_s,
+        retries and prefix_reuse (share of prompt tokens read from the provider's
+        prompt cache)
+    """
+    summary = {
+        "calls": 0,
+        "cached_responses": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "cache_read_tokens": 0,
+        "cache_creation_tokens": 0,
+        "cost_usd": 0.0,
+        "rate_limit_wait_s": 0.0,
+        "retries": 0,
+    }
+    for record in records:
+        summary["calls"] += 1
+        if record["cached_response"]:
+            summary["cached_responses"] += 1
+            continue
+        for key in _USAGE_TOTALS:
+            summary[key] += record[key]
+    prompt_tokens = summary["prompt_tokens"]
+    summary["prefix_reuse"] = summary["cache_read_tokens"] / prompt_tokens if prompt_tokens else 0.0
+    return summary
+
+
+def format_usage_summary(summary: Dict[str, Any]) -> str:
+    """Format a :func:`summarize_usage` result as a one-line prompt cache report."""
+    return (
+        f"Prompt cache: {summary['cache_read_tokens']:,} of {summary['prompt_tokens']:,} "
+        f"input tokens read from cache ({summary['prefix_reuse']:.0%} prefix reuse), "
+        f"{summary['cache_creation_tokens']:,} written, {summary['calls']} calls "
+        f"({summary['cached_responses']} from local cache)"
+    )
+
+
+def get_response_cache() -> Optional[SQLiteCache]:
+    """
+    Get the process-wide LM response cache, opening it on first use.
+
+    Honors ``Config.LM_CACHE_MODE``: ``readwrite`` (default), ``readonly``
+    (serve hits, never write) or ``off``.
+
+    Returns:
+        Shared cache, or None when caching is off
+    """
+    global _response_cache
+
+    mode = Config.LM_CACHE_MODE
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Unknown LM cache mode: {mode} (expected one of {', '.join(CACHE_MODES)})")
+    if mode == "off":
+        return None
+
+    if _response_cache is None or _response_cache.readonly != (mode == "readonly"):
+        _response_cache = SQLiteCache(
+            Config.LM_CACHE_PATH,
+            max_size_mb=Config.LM_CACHE_MAX_SIZE_MB,
+            max_age_days=Config.LM_CACHE_MAX_AGE_DAYS,
+            readonly=(mode == "readonly")
+        )
+    return _response_cache
+
+
+class LexicLM(dspy.LM):
+    """
+    DSPy LM that serves repeated requests from a persistent response cache.
+
+    The cache key covers the model, every request parameter (temperature,
+    max_tokens, ...) and the fully rendered prompt, so anything built on
+    ``dspy.configure(lm=...)`` — extraction, generation, agents and the judge —
+    reuses responses across runs. DSPy's own response cache is disabled to
+    avoid storing every response twice.
+
+    Provider calls first wait for admission by the process-wide rate limiter
+    (``Config.LM_RPM`` / ``Config.LM_TPM``, on the estimated prompt size),
+    then hold a slot of the per-model concurrency limiter
+    (``Config.LM_MAX_CONCURRENCY`` / ``Config.LM_MODEL_CONCURRENCY``); cache
+    hits do neither. Transient errors (see :func:`is_retryable`) are retried
+    up to ``max_retries`` times with jittered exponential backoff, each
+    attempt going through the limiters again; LiteLLM's own retries are
+    disabled so that every attempt is visible and counted. Within an
+    :func:`lm_deadline`, each request's timeout is the time left and no
+    attempt, backoff or rate-limit wait may outlast it.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        response_cache: Optional[SQLiteCache] = None,
+        max_retries: Optional[int] = None,
+        **kwargs
+    ):
+        """
+        Initialize LM.
+
+        Args:
+            model: LiteLLM model name (e.g. 'anthropic/claude-3-5-sonnet-20241022')
+            response_cache: Cache to use (default: none)
+            max_retries: Retries of transient errors (default: Config.MAX_RETRIES)
+            **kwargs: Passed to dspy.LM (temperature, max_tokens, api_key, ...)
+        """
+        kwargs["cache"] = False
+        kwargs["num_retries"] = 0
+        super().__init__(model=model, **kwargs)
+        self.response_cache = response_cache
+        self.max_retries = Config.MAX_RETRIES if max_retries is None else max_retries
+
+    def _cache_key(self, prompt: Optional[str], messages: Optional[list], kwargs: Dict[str, Any]) -> str:
+        """Build the content-addressed key for a request."""
+        request_kwargs = {
+            key: value for key, value in {**self.kwargs, **kwargs}.items()
+            if not key.startswith("api_") and key != "cache"
+        }
+        return content_key({
+            "model": self.model,
+            "model_type": self.model_type,
+            "prompt": prompt,
+            "messages": messages,
+            "kwargs": request_kwargs,
+        })
+
+    def _record_usage(
+        self,
+        response: Any,
+        cached: bool,
+        rate_limit_wait_s: float = 0.0,
+        retries: int = 0
+    ) -> Dict[str, Any]:
+        """Report a call's token usage to the active :func:`track_lm_usage` blocks."""
+        usage = getattr(response, "usage", None) or {}
+
+        def read(obj: Any, name: str) -> int:
+            value = obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+            return int(value or 0)
+
+        # Anthropic reports cache reads/writes directly; OpenAI-style usage nests them
+        details = usage.get("prompt_tokens_details") if isinstance(usage, dict) \
+            else getattr(usage, "prompt_tokens_details", None)
+        cache_read = read(usage, "cache_read_input_tokens") or (read(details, "cached_tokens") if details else 0)
+        record = {
+            "model": self.model,
+            "cached_response": cached,
+            "prompt_tokens": read(usage, "prompt_tokens"),
+            "completion_tokens": read(usage, "completion_tokens"),
+            "cache_read_tokens": cache_read,
+            "cache_creation_tokens": read(usage, "cache_creation_input_tokens"),
+            # Computed by LiteLLM from its model price map; responses served locally cost nothing
+            "cost_usd": 0.0 if cached else float(
+                (getattr(response, "_hidden_params", None) or {}).get("response_cost") or 0.0
+            ),
+            "rate_limit_wait_s": rate_limit_wait_s,
+            "retries": retries,
+        }
+        for records in _usage_collectors.get():
+            records.append(record)
+        return record
+
+    @staticmethod
+    def _mark_cache_hit(response: Any) -> Any:
+        """Flag a cached response so DSPy does not count its usage again."""
+        try:
+            response.cache_hit = True
+        except Exception:
+            pass
+        return response
+
+    def _call_provider(self, prompt: Optional[str], messages: Optional[list], **kwargs) -> Any:
+        """Send a request to the provider."""
+        return super().forward(prompt=prompt, messages=messages, **kwargs)
+
+    async def _acall_provider(self, prompt: Optional[str], messages: Optional[list], **kwargs) -> Any:
+        """Asynchronous variant of :meth:`_call_provider`."""
+        return await super().aforward(prompt=prompt, messages=messages, **kwargs)
+
+    def _admit(self, acquire: Any, estimated: int) -> float:
+        """Wait for the rate limiter, within the deadline (see :func:`lm_deadline`)."""
+        try:
+            return acquire(self.model, estimated, max_wait=lm_time_left())
+        except TimeoutError as e:
+            raise DeadlineExceeded(f"LM call deadline exceeded waiting for the {self.model} rate limit") from e
+
+    async def _aadmit(self, aacquire: Any, estimated: int) -> float:
+        """Asynchronous variant of :meth:`_admit`."""
+        try:
+            return await aacquire(self.model, estimated, max_wait=lm_time_left())
+        except TimeoutError as e:
+            raise DeadlineExceeded(f"LM call deadline exceeded waiting for the {self.model} rate limit") from e
+
+    def _request_kwargs(self, kwargs: Dict[str, Any], estimated: int) -> Dict[str, Any]:
+        """
+        Request parameters of an admitted attempt, with the time left as provider timeout.
+
+        An attempt abandoned or out of time here was admitted but is never
+        sent, so its rate-limit reservation is given back.
+        """
+        try:
+            left = lm_time_left()
+        except (DeadlineExceeded, LMCallCancelled):
+            get_rate_limiter().release(self.model, estimated)
+            raise
+        return kwargs if left is None else {**kwargs, "timeout": left}
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Backoff before retrying a failed attempt, or re-raise if it must not be retried.
+
+        Attempts are not retried once out of retries, on permanent errors, when
+        abandoned or past the deadline, or when the backoff would end after it.
+        """
+        if attempt >= self.max_retries or not is_retryable(error) or isinstance(error, DeadlineExceeded):
+            raise error
+        delay = retry_delay(error, attempt)
+        left = lm_time_left()
+        if left is not None and delay >= left:
+            raise DeadlineExceeded(f"LM call deadline exceeded retrying {self.model}") from error
+        return delay
+
+    def forward(self, prompt=None, messages=None, **kwargs):
+        """Return a cached response or call the provider (with retries) and cache the result."""
+        key = None
+        if self.response_cache is not None:
+            key = self._cache_key(prompt, messages, kwargs)
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                self._record_usage(cached, cached=True)
+                return self._mark_cache_hit(cached)
+
+        estimated = estimate_prompt_tokens(prompt, messages)
+        waited = 0.0
+        attempt = 0
+        while True:
+            # Every attempt is a request of its own; a failed one keeps its reservation (see RateLimiter)
+            waited += self._admit(get_rate_limiter().acquire, estimated)
+            try:
+                with get_model_limiter().slot(self.model):
+                    request_kwargs = self._request_kwargs(kwargs, estimated)
+                    response = self._call_provider(prompt, messages, **request_kwargs)
+                break
+            except Exception as e:
+                time.sleep(self._retry_delay(e, attempt))
+                attempt += 1
+        record = self._record_usage(response, cached=False, rate_limit_wait_s=waited, retries=attempt)
+        get_rate_limiter().settle(self.model, estimated, record["prompt_tokens"])
+        if key is not None:
+            self.response_cache.set(key, response)
+        return response
+
+    async def aforward(self, prompt=None, messages=None, **kwargs):
+        """Asynchronous variant of :meth:`forward`."""
+        key = None
+        if self.response_cache is not None:
+            key = self._cache_key(prompt, messages, kwargs)
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                self._record_usage(cached, cached=True)
+                return self._mark_cache_hit(cached)
+
+        estimated = estimate_prompt_tokens(prompt, messages)
+        waited = 0.0
+        attempt = 0
+        while True:
+            # Every attempt is a request of its own; a failed one keeps its reservation (see RateLimiter)
+            waited += await self._aadmit(get_rate_limiter().aacquire, estimated)
+            try:
+                async with get_model_limiter().aslot(self.model):
+                    request_kwargs = self._request_kwargs(kwargs, estimated)
+                    response = await self._acall_provider(prompt, messages, **request_kwargs)
+                break
+            except Exception as e:
+                await asyncio.sleep(self._retry_delay(e, attempt))
+                attempt += 1
+        record = self._record_usage(response, cached=False, rate_limit_wait_s=waited, retries=attempt)
+        get_rate_limiter().settle(self.model, estimated, record["prompt_tokens"])
+        if key is not None:
+            self.response_cache.set(key, response)
+        return response
+
+
+def build_lm(model: str, temperature: float, max_tokens: Optional[int] = None) -> LexicLM:
+    """
+    Build an Anthropic-backed LM wired to the shared response cache.
+
+    With ``Config.FAKE_LM`` set, returns a :class:`~lexic.shared.fake_lm.FakeLM`
+    instead, which answers locally and bypasses the response cache.
+
+    Args:
+        model: Anthropic model name without provider prefix (e.g. Config.DEFAULT_MODEL)
+        temperature: Sampling temperature
+        max_tokens: Maximum output tokens (default: provider default)
+
+    Returns:
+        Configured LM, ready for ``dspy.configure(lm=...)``
+    """
+    kwargs = {}
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
+    if Config.FAKE_LM:
+        from lexic.shared.fake_lm import FakeLM
+        return FakeLM(
+            model=f"anthropic/{model}",
+            temperature=temperature,
+            latency_s=Config.FAKE_LM_LATENCY_S,
+            **kwargs
+        )
+    return LexicLM(
+        model=f"anthropic/{model}",
+        api_key=Config.ANTHROPIC_API_KEY,
+        temperature=temperature,
+        response_cache=get_response_cache(),
+        **kwargs
+    )
+
+
+def format_cache_stats() -> str:
+    """Format the shared response cache counters as a one-line summary."""
+    cache = _response_cache
+    if cache is None:
+        return "LM cache: off"
+    stats = cache.stats()
+    mode = "read-only" if cache.readonly else "read-write"
+    return (
+        f"LM cache ({mode}): {stats['hits']} hits, {stats['misses']} misses "
+        f"({stats['hit_rate']:.0%} hit rate), {stats['entries']} entries, "
+        f"{stats['size_mb']:.1f} MB"
+    )
+
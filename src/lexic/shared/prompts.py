@@ -1,57 +1,125 @@
 """Prompt loading utilities."""
 
+import hashlib
+import threading
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Dict, Tuple
 import yaml
 import dspy
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
-def load_prompt_config(category: str, name: str) -> dict:
-    """
-    Load prompt configuration from YAML.
 
-    Args:
-        category: Prompt category ('agents', 'extraction', 'generation')
-        name: Prompt name (without .yaml extension)
+PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 
-    Returns:
-        Dict with 'description', 'input_fields', 'output_fields'
 
-    Example:
-        >>> config = load_prompt_config("agents", "qualification")
-        >>> config['description']
-        'Analyser la demande du client...'
+class PromptRegistry:
     """
-    prompts_dir = Path(__file__).parent.parent / "prompts"
-    prompt_path = prompts_dir / category / f"{name}.yaml"
-
-    if not prompt_path.exists():
-        raise FileNotFoundError(
-            f"Prompt not found: {prompt_path}\n"
-            f"Category: {category}, Name: {name}"
-        )
-
-    with open(prompt_path) as f:
-        return yaml.safe_load(f)
+    Memoizing loader for prompt YAMLs and the DSPy signatures built from them.
 
+    Nothing is read at import time: a prompt is parsed (with the libyaml C
+    loader when available) the first time it is requested, and its signature
+    class is built the first time it is needed. Entries are keyed by the
+    SHA-256 of the file content; a cheap ``stat`` on each lookup detects
+    edits, and only a changed hash triggers a re-parse and a new signature.
+    """
 
-def create_signature(category: str, name: str) -> type:
+    def __init__(self, prompts_dir: Path = PROMPTS_DIR):
+        """
+        Initialize registry.
+
+        Args:
+            prompts_dir: Root directory of prompt YAML files
+        """
+        self.prompts_dir = Path(prompts_dir)
+        # (category, name) -> (stat signature, content hash, parsed config)
+        self._configs: Dict[Tuple[str, str], Tuple[Tuple[int, int], str, dict]] = {}
+        # (category, name, content hash) -> signature class
+        self._signatures: Dict[Tuple[str, str, str], type] = {}
+        self._lock = threading.RLock()
+
+    def _path(self, category: str, name: str) -> Path:
+        prompt_path = self.prompts_dir / category / f"{name}.yaml"
+        if not prompt_path.exists():
+            raise FileNotFoundError(
+                f"Prompt not found: {prompt_path}\n"
+                f"Category: {category}, Name: {name}"
+            )
+        return prompt_path
+
+    def _load(self, category: str, name: str) -> Tuple[str, dict]:
+        """Return (content hash, config), re-reading the file only if it changed."""
+        path = self._path(category, name)
+        stat = path.stat()
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._configs.get((category, name))
+            if cached is not None and cached[0] == stat_key:
+                return cached[1], cached[2]
+
+            raw = path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if cached is not None and cached[1] == digest:
+                # Touched but not changed
+                config = cached[2]
+            else:
+                config = yaml.load(raw, Loader=_YamlLoader)
+            self._configs[(category, name)] = (stat_key, digest, config)
+            return digest, config
+
+    def get_config(self, category: str, name: str) -> dict:
+        """
+        Get a prompt configuration.
+
+        Args:
+            category: Prompt category ('agents', 'extraction', 'generation', 'evals')
+            name: Prompt name (without .yaml extension)
+
+        Returns:
+            Parsed YAML config (shared; do not mutate)
+        """
+        return self._load(category, name)[1]
+
+    def content_hash(self, category: str, name: str) -> str:
+        """Get the SHA-256 of a prompt file's current content."""
+        return self._load(category, name)[0]
+
+    def get_signature(self, category: str, name: str) -> type:
+        """
+        Get the DSPy signature class for a prompt, building it on first use.
+
+        Args:
+            category: Prompt category ('agents', 'extraction', 'generation', 'evals')
+            name: Prompt name (without .yaml extension)
+
+        Returns:
+            DSPy Signature class
+        """
+        digest, config = self._load(category, name)
+        key = (category, name, digest)
+        with self._lock:
+            signature_class = self._signatures.get(key)
+            if signature_class is None:
+                signature_class = build_signature(name, config)
+                self._signatures[key] = signature_class
+            return signature_class
+
+
+def build_signature(name: str, config: dict) -> type:
     """
-    Create a DSPy signature class from prompt YAML config.
+    Build a DSPy signature class from a parsed prompt config.
 
     Args:
-        category: Prompt category ('agents', 'extraction', 'generation')
-        name: Prompt name (without .yaml extension)
+        name: Prompt name, used for the class name
+        config: Dict with 'description', 'input_fields', 'output_fields'
 
     Returns:
         DSPy Signature class
-
-    Example:
-        >>> QualifySig = create_signature("agents", "qualification")
-        >>> agent = dspy.ChainOfThought(QualifySig)
     """
-    config = load_prompt_config(category, name)
-
     # Build annotations dict for signature fields
     annotations = {}
 
@@ -74,3 +142,65 @@ def create_signature(category: str, name: str) -> type:
     )
 
     return signature_class
+
+
+_registry = PromptRegistry()
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """Get the process-wide prompt registry."""
+    return _registry
+
+
+def load_prompt_config(category: str, name: str) -> dict:
+    """
+    Load prompt configuration from YAML.
+
+    Args:
+        category: Prompt category ('agents', 'extraction', 'generation')
+        name: Prompt name (without .yaml extension)
+
+    Returns:
+        Dict with 'description', 'input_fields', 'output_fields'
+
+    Example:
+        >>> config = load_prompt_config("agents", "qualification")
+        >>> config['description']
+        'Analyser la demande du client...'
+    """
+    return _registry.get_config(category, name)
+
+
+def get_signature(category: str, name: str) -> type:
+    """
+    Get the memoized DSPy signature class for a prompt YAML.
+
+    Args:
+        category: Prompt category ('agents', 'extraction', 'generation')
+        name: Prompt name (without .yaml extension)
+
+    Returns:
+        DSPy Signature class
+
+    Example:
+        >>> QualifySig = get_signature("agents", "qualification")
+        >>> agent = dspy.ChainOfThought(QualifySig)
+    """
+    return _registry.get_signature(category, name)
+
+
+def create_signature(category: str, name: str) -> type:
+    """
+    Create a DSPy signature class from prompt YAML config.
+
+    Kept for compatibility; signatures are memoized, so this is the same as
+    :func:`get_signature`.
+
+    Args:
+        category: Prompt category ('agents', 'extraction', 'generation')
+        name: Prompt name (without .yaml extension)
+
+    Returns:
+        DSPy Signature class
+    """
+    return get_signature(category, name)
@@ -0,0 +1,303 @@
+"""Process-wide token-bucket rate limiting of LM requests and tokens per model."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from lexic.shared.config import Config
+
+
+def estimate_prompt_tokens(prompt: Optional[str], messages: Optional[List[Dict[str, Any]]]) -> int:
+    """
+    Estimate the input tokens of a request at four characters per token.
+
+    Args:
+        prompt: Plain prompt, if any
+        messages: Chat messages with string or content-block content
+
+    Returns:
+        Estimated token count (at least 1)
+    """
+    chars = len(prompt or "")
+    for message in messages or []:
+        content = message.get("content") or ""
+        if isinstance(content, list):
+            chars += sum(len(block.get("text", "")) for block in content if isinstance(block, dict))
+        else:
+            chars += len(content)
+    return max(1, chars // 4)
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``rate_per_minute / 60`` per second.
+
+    :meth:`reserve` takes the requested amount immediately, letting the level
+    go negative, and returns how long the caller must wait for the bucket to
+    cover it. Callers are thus admitted in arrival order without polling, and
+    a burst up to the full per-minute capacity passes without delay.
+    """
+
+    def __init__(self, rate_per_minute: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate_per_minute: Capacity and refill per minute
+        """
+        self.capacity = float(rate_per_minute)
+        self.rate = self.capacity / 60
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        Take ``amount`` from the bucket.
+
+        Args:
+            amount: Units to take (capped at capacity so oversized requests still pass)
+            now: Current ``time.monotonic()``
+
+        Returns:
+            Seconds until the reservation is covered
+        """
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+        return max(0.0, -self.level / self.rate)
+
+    def adjust(self, amount: float, now: float):
+        """Give back (positive) or take (negative) units after the fact."""
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limits per model.
+
+    Each call reserves one request and its estimated prompt tokens, then
+    sleeps until both buckets cover the reservation; :meth:`settle` corrects
+    the token bucket once the provider reports actual usage, and
+    :meth:`release` gives a reservation back when the request is not sent
+    after all (e.g. an asynchronous waiter cancelled, as losing hedges
+    are). Every attempt of a retried call reserves anew and a failed
+    attempt keeps its reservation: the provider counted the request, and
+    without a usage report its estimated tokens are kept rather than
+    guessed away, so retries err towards fewer 429s. Limits are
+    looked up like concurrency limits (full model name, then without the
+    provider prefix, then the default); 0 means unlimited. The time callers
+    spent waiting is counted per model for :meth:`stats`.
+    """
+
+    def __init__(
+        self,
+        rpm: Optional[Dict[str, int]] = None,
+        tpm: Optional[Dict[str, int]] = None,
+        default_rpm: int = 0,
+        default_tpm: int = 0
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            rpm: Per-model requests per minute
+            tpm: Per-model input tokens per minute
+            default_rpm: Requests per minute for other models (0 = unlimited)
+            default_tpm: Input tokens per minute for other models (0 = unlimited)
+        """
+        self.rpm = dict(rpm or {})
+        self.tpm = dict(tpm or {})
+        self.default_rpm = default_rpm
+        self.default_tpm = default_tpm
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[Optional[TokenBucket], Optional[TokenBucket]]] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def _lookup(limits: Dict[str, int], model: str, default: int) -> int:
+        if model in limits:
+            return limits[model]
+        return limits.get(model.split("/", 1)[-1], default)
+
+    def limits_for(self, model: str) -> Tuple[int, int]:
+        """Get a model's (requests per minute, tokens per minute); 0 = unlimited."""
+        return (
+            self._lookup(self.rpm, model, self.default_rpm),
+            self._lookup(self.tpm, model, self.default_tpm),
+        )
+
+    def _reserve(self, model: str, tokens: int) -> float:
+        """Reserve one request and ``tokens`` for a model and count the resulting wait."""
+        now = time.monotonic()
+        with self._lock:
+            buckets = self._buckets.get(model)
+            if buckets is None:
+                rpm, tpm = self.limits_for(model)
+                buckets = self._buckets[model] = (
+                    TokenBucket(rpm) if rpm > 0 else None,
+                    TokenBucket(tpm) if tpm > 0 else None,
+                )
+            requests, token_bucket = buckets
+            wait = max(
+                requests.reserve(1, now) if requests is not None else 0.0,
+                token_bucket.reserve(tokens, now) if token_bucket is not None else 0.0,
+            )
+
+            stats = self._stats.setdefault(model, {
+                "requests": 0, "delayed": 0, "tokens": 0, "total_wait_s": 0.0, "max_wait_s": 0.0,
+            })
+            stats["requests"] += 1
+            stats["tokens"] += tokens
+            if wait > 0:
+                stats["delayed"] += 1
+                stats["total_wait_s"] += wait
+                stats["max_wait_s"] = max(stats["max_wait_s"], wait)
+        return wait
+
+    def _admit(self, model: str, tokens: int, max_wait: Optional[float]) -> float:
+        """Reserve, giving the reservation back if its wait would exceed ``max_wait``."""
+        wait = self._reserve(model, tokens)
+        if max_wait is not None and wait > max_wait:
+            self.release(model, tokens, wait)
+            raise TimeoutError(f"Rate limit wait of {wait:.1f}s for {model} exceeds {max_wait:.1f}s")
+        return wait
+
+    def acquire(self, model: str, tokens: int, max_wait: Optional[float] = None) -> float:
+        """
+        Block until the model's limits admit one request of ``tokens`` input tokens.
+
+        Args:
+            model: LiteLLM model name
+            tokens: Estimated prompt tokens
+            max_wait: Longest acceptable wait in seconds (default: unbounded)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If the wait would exceed ``max_wait`` (nothing is reserved then)
+        """
+        wait = self._admit(model, tokens, max_wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, model: str, tokens: int, max_wait: Optional[float] = None) -> float:
+        """Asynchronous variant of :meth:`acquire`; a cancelled waiter gives its reservation back."""
+        wait = self._admit(model, tokens, max_wait)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.release(model, tokens, wait)
+                raise
+        return wait
+
+    def release(self, model: str, tokens: int, wait: float = 0.0):
+        """
+        Give back a reservation whose request was never sent.
+
+        Args:
+            model: LiteLLM model name
+            tokens: Tokens reserved by :meth:`acquire`
+            wait: Wait :meth:`acquire` was asked to observe, removed from the stats
+        """
+        now = time.monotonic()
+        with self._lock:
+            requests, token_bucket = self._buckets.get(model, (None, None))
+            if requests is not None:
+                requests.adjust(1, now)
+            if token_bucket is not None:
+                token_bucket.adjust(min(tokens, token_bucket.capacity), now)
+            stats = self._stats.get(model)
+            if stats is not None:
+                stats["requests"] -= 1
+                stats["tokens"] -= tokens
+                if wait > 0:
+                    stats["delayed"] -= 1
+                    stats["total_wait_s"] -= wait
+
+    def settle(self, model: str, estimated: int, actual: int):
+        """
+        Correct a model's token bucket with the provider-reported prompt tokens.
+
+        Args:
+            model: LiteLLM model name
+            estimated: Tokens reserved by :meth:`acquire`
+            actual: Prompt tokens actually used (0 if unknown, which leaves the bucket as is)
+        """
+        if not actual:
+            return
+        with self._lock:
+            token_bucket = self._buckets.get(model, (None, None))[1]
+            if token_bucket is not None:
+                token_bucket.adjust(estimated - actual, time.monotonic())
+            if model in self._stats:
+                self._stats[model]["tokens"] += actual - estimated
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-model admission counters.
+
+        Returns:
+            Dict mapping each model seen so far to rpm, tpm, requests, delayed
+            (requests that had to wait), tokens, total_wait_s, mean_wait_s
+            (over all requests) and max_wait_s
+        """
+        with self._lock:
+            result = {}
+            for model, stats in sorted(self._stats.items()):
+                rpm, tpm = self.limits_for(model)
+                result[model] = {
+                    "rpm": rpm,
+                    "tpm": tpm,
+                    **stats,
+                    "mean_wait_s": stats["total_wait_s"] / stats["requests"] if stats["requests"] else 0.0,
+                }
+            return result
+
+
+def format_rate_limit_stats(stats: Dict[str, Dict[str, float]]) -> str:
+    """Format :meth:`RateLimiter.stats` as one line per model."""
+    if not stats:
+        return "Rate limits: no LM requests"
+    lines = []
+    for model, model_stats in stats.items():
+        rpm = model_stats["rpm"] or "∞"
+        tpm = model_stats["tpm"] or "∞"
+        lines.append(
+            f"Rate limits ({model}, {rpm} rpm / {tpm} tpm): {model_stats['delayed']} of "
+            f"{model_stats['requests']} requests delayed, {model_stats['total_wait_s']:.1f}s total wait "
+            f"(mean {model_stats['mean_wait_s']:.2f}s, max {model_stats['max_wait_s']:.1f}s)"
+        )
+    return "\n".join(lines)
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide rate limiter, creating it on first use.
+
+    Limits come from ``Config.LM_RPM`` / ``Config.LM_TPM`` and their
+    per-model overrides ``Config.LM_MODEL_RPM`` / ``Config.LM_MODEL_TPM``.
+
+    Returns:
+        Shared limiter
+    """
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(
+            rpm=Config.LM_MODEL_RPM,
+            tpm=Config.LM_MODEL_TPM,
+            default_rpm=Config.LM_RPM,
+            default_tpm=Config.LM_TPM
+        )
+    return _rate_limiter
@@ -8,11 +8,7 @@ from docling.document_converter import DocumentConverter
 from lexic.shared.models import CourtDecision, LegalBasis, LegalArgument, Consideration, Judgment
 from lexic.shared.io import write_markdown
 from lexic.shared.config import Config
-from lexic.shared.prompts import create_signature
-
-# Create signatures from YAML
-CreateNameMapping = create_signature("extraction", "name_mapping")
-ExtractAllElements = create_signature("extraction", "extract_all")
+from lexic.shared.prompts import get_signature
 
 
 class CourtDecisionExtractor(dspy.Module):
@@ -20,8 +16,8 @@ class CourtDecisionExtractor(dspy.Module):
 
     def __init__(self, decision_dir: Path = None):
         super().__init__()
-        self.extract_all = dspy.ChainOfThought(ExtractAllElements)
-        self.create_mapping = dspy.ChainOfThought(CreateNameMapping)
+        self.extract_all = dspy.ChainOfThought(get_signature("extraction", "extract_all"))
+        self.create_mapping = dspy.ChainOfThought(get_signature("extraction", "name_mapping"))
         self.decision_dir = decision_dir
 
     def forward(self, full_text: str):
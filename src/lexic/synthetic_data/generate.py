@@ -9,21 +9,10 @@ from lexic.shared.models import (
     InvestigationOrder, InvestigationReport, FactualRecord,
     LegalBasis, LegalArgument, Consideration, Judgment, Recommendation
 )
-from lexic.shared.io import read_markdown, write_markdown, get_decision_path
+from lexic.shared.case_store import get_case_store
+from lexic.shared.io import read_markdown, get_decision_path
 from lexic.shared.config import Config
-from lexic.shared.prompts import create_signature
-
-# Create signatures from YAML
-GenerateClientPersona = create_signature("generation", "client_persona")
-GenerateClientRequest = create_signature("generation", "client_request")
-GenerateInitialFacts = create_signature("generation", "initial_facts")
-GenerateQualification = create_signature("generation", "qualification")
-GenerateInitialAnalysis = create_signature("generation", "initial_analysis")
-GenerateInvestigationOrder = create_signature("generation", "investigation_order")
-GenerateInvestigationReport = create_signature("generation", "investigation_report")
-GenerateFactualRecord = create_signature("generation", "factual_record")
-GenerateExpectedJudgment = create_signature("generation", "expected_judgment")
-GenerateRecommendations = create_signature("generation", "recommendations")
+from lexic.shared.prompts import get_signature
 
 
 class SyntheticCaseGenerator(dspy.Module):
@@ -31,16 +20,16 @@ class SyntheticCaseGenerator(dspy.Module):
 
     def __init__(self):
         super().__init__()
-        self.gen_persona = dspy.ChainOfThought(GenerateClientPersona)
-        self.gen_client_request = dspy.ChainOfThought(GenerateClientRequest)
-        self.gen_initial_facts = dspy.ChainOfThought(GenerateInitialFacts)
-        self.gen_qualification = dspy.ChainOfThought(GenerateQualification)
-        self.gen_initial_analysis = dspy.ChainOfThought(GenerateInitialAnalysis)
-        self.gen_investigation_order = dspy.ChainOfThought(GenerateInvestigationOrder)
-        self.gen_investigation_report = dspy.ChainOfThought(GenerateInvestigationReport)
-        self.gen_final_factual_record = dspy.ChainOfThought(GenerateFactualRecord)
-        self.gen_expected_judgment = dspy.ChainOfThought(GenerateExpectedJudgment)
-        self.gen_recommendations = dspy.ChainOfThought(GenerateRecommendations)
+        self.gen_persona = dspy.ChainOfThought(get_signature("generation", "client_persona"))
+        self.gen_client_request = dspy.ChainOfThought(get_signature("generation", "client_request"))
+        self.gen_initial_facts = dspy.ChainOfThought(get_signature("generation", "initial_facts"))
+        self.gen_qualification = dspy.ChainOfThought(get_signature("generation", "qualification"))
+        self.gen_initial_analysis = dspy.ChainOfThought(get_signature("generation", "initial_analysis"))
+        self.gen_investigation_order = dspy.ChainOfThought(get_signature("generation", "investigation_order"))
+        self.gen_investigation_report = dspy.ChainOfThought(get_signature("generation", "investigation_report"))
+        self.gen_final_factual_record = dspy.ChainOfThought(get_signature("generation", "factual_record"))
+        self.gen_expected_judgment = dspy.ChainOfThought(get_signature("generation", "expected_judgment"))
+        self.gen_recommendations = dspy.ChainOfThought(get_signature("generation", "recommendations"))
 
     def forward(self, decision_data: dict):
         """
@@ -183,6 +172,7 @@ def generate_synthetic_case(decision_id: str, case_id: str, party_role: str, dec
     # Prepare output directory
     case_dir = output_dir / case_id
     case_dir.mkdir(parents=True, exist_ok=True)
+    store = get_case_store(output_dir)
 
     metadata = {
         "case_id": case_id,
@@ -201,19 +191,19 @@ def generate_synthetic_case(decision_id: str, case_id: str, party_role: str, dec
             if doc_number not in specific_docs:
                 # Skip this document - not in the requested list
                 if filepath.exists():
-                    _, existing_content = read_markdown(filepath)
+                    _, existing_content = store.read(case_id, filename)
                     return existing_content
                 return ""  # Return empty string for dependencies
 
         if filepath.exists():
             print(f"  ✓ {title} (already exists)")
-            _, existing_content = read_markdown(filepath)
+            _, existing_content = store.read(case_id, filename)
             return existing_content
         else:
             if generator_func:
                 print(f"  Generating {title.lower()}...")
                 content = generator_func()
-            write_markdown(filepath, metadata, f"# {title}\n\n{content}")
+            store.write(case_id, filename, metadata, f"# {title}\n\n{content}")
             print(f"  ✓ {title} (saved)")
             return content
 
@@ -0,0 +1,6 @@
+"""Shared test setup: no provider calls, no network lookups."""
+
+import os
+
+# LiteLLM otherwise downloads its model cost map at import time
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
@@ -0,0 +1,50 @@
+"""Tests for bounded thread fan-out."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lexic.shared.concurrency import map_in_threads
+
+
+def tracking_in_flight():
+    """A slow function and a dict recording the peak number of concurrent calls."""
+    state = {"in_flight": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def work(item):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        time.sleep(0.01)
+        with lock:
+            state["in_flight"] -= 1
+        return item * 2
+
+    return work, state
+
+
+def test_results_keep_item_order():
+    work, _ = tracking_in_flight()
+    assert map_in_threads(work, range(10), workers=4) == [item * 2 for item in range(10)]
+
+
+def test_workers_bound_calls_in_flight():
+    work, state = tracking_in_flight()
+    map_in_threads(work, range(20), workers=3)
+    assert state["peak"] <= 3
+
+
+def test_shared_executor_bounds_calls_across_callers():
+    work, state = tracking_in_flight()
+    executor = ThreadPoolExecutor(max_workers=2)
+    callers = [
+        threading.Thread(target=map_in_threads, args=(work, range(6), 6), kwargs={"executor": executor})
+        for _ in range(4)
+    ]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join()
+    executor.shutdown()
+    assert state["peak"] <= 2
@@ -0,0 +1,43 @@
+"""Tests for the token-bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+from lexic.shared.rate_limit import RateLimiter
+
+MODEL = "anthropic/test-model"
+
+
+def test_burst_within_capacity_is_not_delayed():
+    limiter = RateLimiter(default_rpm=60)
+    assert [limiter._reserve(MODEL, 1) for _ in range(60)] == [0.0] * 60
+    assert limiter._reserve(MODEL, 1) == pytest.approx(1.0, abs=0.01)
+
+
+def test_cancelled_waiter_gives_its_reservation_back():
+    limiter = RateLimiter(default_rpm=60, default_tpm=6000)
+    for _ in range(60):
+        limiter._reserve(MODEL, 10)
+
+    async def cancel_waiter():
+        waiter = asyncio.ensure_future(limiter.aacquire(MODEL, 10))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(cancel_waiter())
+
+    # Without the refund the next request would queue behind the cancelled one (~2s)
+    assert limiter._reserve(MODEL, 10) < 1.1
+    stats = limiter.stats()[MODEL]
+    assert stats["requests"] == 61
+    assert stats["tokens"] == 610
+
+
+def test_settle_corrects_token_estimate():
+    limiter = RateLimiter(default_tpm=600)
+    limiter._reserve(MODEL, 600)
+    limiter.settle(MODEL, estimated=600, actual=60)
+    assert limiter._reserve(MODEL, 500) == 0.0
@@ -0,0 +1,166 @@
+"""Tests for stage deadlines and hedged requests."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import lexic.shared.lm as lm_module
+from lexic.agents.resilience import StageResilience
+from lexic.shared.fake_lm import FakeLM
+from lexic.shared.lm import DeadlineExceeded, track_lm_usage
+
+
+class ScriptedLM(FakeLM):
+    """FakeLM whose n-th provider request sleeps and then answers or fails as scripted."""
+
+    def __init__(self, script, **kwargs):
+        super().__init__(model="anthropic/fake", **kwargs)
+        self.script = script
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def _next(self, kwargs):
+        with self._lock:
+            index = len(self.requests)
+            self.requests.append(kwargs.get("timeout"))
+        return self.script[min(index, len(self.script) - 1)]
+
+    def _call_provider(self, prompt, messages, **kwargs):
+        delay, error = self._next(kwargs)
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return self._respond(prompt, messages)
+
+    async def _acall_provider(self, prompt, messages, **kwargs):
+        delay, error = self._next(kwargs)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return self._respond(prompt, messages)
+
+
+def hedged_resilience(**kwargs) -> StageResilience:
+    """Hedging policies that hedge "stage" calls still running after 50 ms."""
+    resilience = StageResilience(hedge=True, min_samples=1, **kwargs)
+    resilience._observe("stage", 0.05)
+    return resilience
+
+
+def test_deadline_covers_every_attempt():
+    lm = ScriptedLM([(0.2, TimeoutError("slow provider"))], max_retries=10)
+    resilience = StageResilience(default_timeout=0.5)
+
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded):
+        resilience.call("stage", lambda: lm.forward(prompt="question"))
+
+    assert time.perf_counter() - started < 1.0
+    assert all(0 < timeout <= 0.5 for timeout in lm.requests)
+    assert resilience.stats()["stage"]["deadline_exceeded"] == 1
+
+
+def test_losing_attempt_is_charged_as_hedge_cost():
+    lm = ScriptedLM([(0.4, None), (0.0, None)])
+    resilience = hedged_resilience()
+
+    with track_lm_usage() as records:
+        resilience.call("stage", lambda: lm.forward(prompt="question"))
+    time.sleep(0.5)  # The primary finishes after the step was summarized
+
+    assert len(records) == 1
+    stats = resilience.stats()["stage"]
+    assert (stats["hedged"], stats["hedge_wins"], stats["hedge_lm_calls"]) == (1, 1, 1)
+    assert stats["hedge_tokens"] > 0
+
+
+def test_losing_attempt_starts_no_retry():
+    lm = ScriptedLM([(0.3, ConnectionError("reset")), (0.0, None)], max_retries=3)
+    resilience = hedged_resilience()
+
+    resilience.call("stage", lambda: lm.forward(prompt="question"))
+    time.sleep(0.5)
+
+    assert len(lm.requests) == 2
+
+
+def test_hedge_executor_is_bounded():
+    lm = ScriptedLM([(0.2, None)])
+    resilience = hedged_resilience(max_workers=2)
+    peak = 0
+
+    def run():
+        nonlocal peak
+        resilience.call("stage", lambda: lm.forward(prompt="question"))
+        peak = max(peak, sum(t.name.startswith("lexic-hedge") for t in threading.enumerate()))
+
+    callers = [threading.Thread(target=run) for _ in range(6)]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join()
+
+    assert peak <= 2
+    assert resilience.stats()["stage"]["calls"] == 7
+
+
+def test_async_deadline_is_counted_once(monkeypatch):
+    # The backoff outlasts the deadline, so the attempt itself fails with DeadlineExceeded
+    monkeypatch.setattr(lm_module, "retry_delay", lambda error, attempt: 10.0)
+    lm = ScriptedLM([(0.2, TimeoutError("slow provider"))], max_retries=10)
+    resilience = StageResilience(default_timeout=0.5)
+
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(resilience.acall("stage", lambda: lm.aforward(prompt="question")))
+
+    stats = resilience.stats()["stage"]
+    assert (stats["calls"], stats["deadline_exceeded"]) == (1, 1)
+
+
+def test_async_losing_attempt_is_charged_as_hedge_cost():
+    # The primary's second request is slow; the hedge makes both of its requests quickly
+    lm = ScriptedLM([(0.0, None), (0.5, None), (0.0, None), (0.0, None)])
+    resilience = hedged_resilience()
+
+    async def two_calls():
+        await lm.aforward(prompt="first")
+        return await lm.aforward(prompt="second")
+
+    async def main():
+        with track_lm_usage() as records:
+            await resilience.acall("stage", two_calls)
+        return records
+
+    records = asyncio.run(main())
+
+    assert len(records) == 2
+    stats = resilience.stats()["stage"]
+    # One call seeded by hedged_resilience, one hedged call
+    assert (stats["calls"], stats["hedged"], stats["hedge_wins"], stats["hedge_lm_calls"]) == (2, 1, 1, 1)
+    assert stats["hedge_tokens"] > 0
+
+
+def test_async_failing_primary():
+    lm = ScriptedLM([(0.0, ValueError("bad request"))])
+    resilience = StageResilience()
+
+    with pytest.raises(ValueError):
+        asyncio.run(resilience.acall("stage", lambda: lm.aforward(prompt="question")))
+
+    assert resilience.stats()["stage"]["calls"] == 1
+
+
+def test_async_hedge_wins_over_failing_primary():
+    lm = ScriptedLM([(0.2, ValueError("bad request")), (0.0, None)])
+    resilience = hedged_resilience()
+
+    async def main():
+        with track_lm_usage() as records:
+            await resilience.acall("stage", lambda: lm.aforward(prompt="question"))
+        return records
+
+    assert len(asyncio.run(main())) == 1
+    stats = resilience.stats()["stage"]
+    assert (stats["calls"], stats["hedge_wins"], stats["hedge_lm_calls"]) == (2, 1, 0)
@@ -0,0 +1,33 @@
+"""Tests for pipeline run traces."""
+
+import dspy
+
+from lexic.agents.run import PipelineRun
+from lexic.shared.fake_lm import FakeLM
+
+
+def test_trace_reports_the_models_steps_ran_on():
+    run = PipelineRun("case", verbose=False)
+    with dspy.context(lm=FakeLM(model="anthropic/small-model")):
+        with run.trace_step("investigation_report"):
+            pass
+    with dspy.context(lm=FakeLM(model="anthropic/large-model")):
+        with run.trace_step("judgment"):
+            pass
+
+    trace = run.trace()
+    assert trace["models"] == ["large-model", "small-model"]
+    assert trace["steps"]["investigation_report"]["model"] == "small-model"
+
+
+def test_trace_keeps_retries_apart_from_extra_calls():
+    run = PipelineRun("case", verbose=False)
+    usage = {
+        "model": "m", "cached_response": False, "prompt_tokens": 10, "completion_tokens": 5,
+        "cache_read_tokens": 0, "cache_creation_tokens": 0, "cost_usd": 0.0, "rate_limit_wait_s": 0.0,
+    }
+    records = [{**usage, "retries": 2}, {**usage, "retries": 0}]
+    run._record_step("judgment", "computed", 1.0, records, "m")
+
+    step = run.trace()["steps"]["judgment"]
+    assert (step["lm_calls"], step["retries"], step["extra_calls"]) == (2, 2, 1)
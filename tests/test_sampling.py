@@ -0,0 +1,64 @@
+"""Tests for stratified case sampling and sequential stopping."""
+
+from collections import Counter
+
+import pytest
+
+from lexic.evals.sampling import SequentialSampler, case_stratum, stratified_order
+
+
+def make_strata(n_decisions: int = 7):
+    """Strata of a plaintiff and a defendant case per decision."""
+    case_ids = [f"case_{index:03d}_{party}" for index in range(n_decisions) for party in ("pl", "df")]
+    return {case_id: case_stratum(case_id) for case_id in case_ids}
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("n_decisions", [6, 7])
+def test_every_prefix_is_balanced(seed, n_decisions):
+    strata = make_strata(n_decisions)
+    order = stratified_order(strata, seed)
+    assert sorted(order) == sorted(strata)
+
+    decisions = Counter({decision: 0 for decision, _ in strata.values()})
+    parties = Counter({"pl": 0, "df": 0})
+    for case_id in order:
+        decision, party = strata[case_id]
+        decisions[decision] += 1
+        parties[party] += 1
+        assert max(decisions.values()) - min(decisions.values()) <= 1
+        assert abs(parties["pl"] - parties["df"]) <= 1
+
+
+def test_fixed_seed_reproduces_order():
+    strata = make_strata()
+    reversed_strata = dict(reversed(list(strata.items())))
+    assert stratified_order(strata, 42) == stratified_order(reversed_strata, 42)
+    assert len({tuple(stratified_order(strata, seed)) for seed in range(5)}) > 1
+
+
+def test_stratum_from_frontmatter():
+    assert case_stratum("case_003_df", {"source_decision": "4A_123/2020"}) == ("4A_123/2020", "df")
+    assert case_stratum("other") == ("other", "")
+
+
+@pytest.mark.parametrize("min_cases", [2, 5, 10])
+def test_target_width_stops_only_after_min_cases(min_cases):
+    sampler = SequentialSampler(target_width=100.0, min_cases=min_cases, seed=0)
+    for index in range(min_cases):
+        assert sampler.stop_reason() is None
+        sampler.add(f"case_{index}", 3.0 + index % 2)
+    assert sampler.stop_reason() == "target_width"
+
+
+def test_significant_difference_stops_only_after_min_cases():
+    baseline = {f"case_{index}": 2.0 for index in range(20)}
+    sampler = SequentialSampler(baseline_scores=baseline, min_cases=8, seed=0)
+    for index in range(8):
+        assert sampler.stop_reason() is None
+        sampler.add(f"case_{index}", 4.0 + 0.1 * (index % 3))
+    assert sampler.stop_reason() == "significant_difference"
+
+    report = sampler.report()
+    assert report["n_paired"] == 8
+    assert report["delta_ci_low"] > 0
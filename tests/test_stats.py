@@ -0,0 +1,104 @@
+"""Tests for vectorized evaluation statistics."""
+
+import math
+
+import numpy as np
+import pytest
+
+import lexic.evals.stats as stats_module
+from lexic.evals.stats import ScoreMatrix, bootstrap_mean_intervals, paired_deltas, summarize_matrix, summary_metrics
+
+
+def reference_intervals(values, n_resamples, confidence=0.95, seed=0):
+    """One resample at a time, with the same draws as bootstrap_mean_intervals."""
+    draws = np.random.default_rng(seed).integers(0, len(values), size=(n_resamples, len(values)))
+    means = np.array([np.nanmean(values[rows], axis=0) for rows in draws])
+    alpha = (1 - confidence) / 2 * 100
+    return np.nanpercentile(means, [alpha, 100 - alpha], axis=0)
+
+
+def make_results(scores):
+    """Evaluation results dicts with overall score 10 × accuracy, for cases case_000_pl, case_000_df, ..."""
+    return [
+        {
+            "case_id": f"case_{index // 2:03d}_{'pl' if index % 2 == 0 else 'df'}",
+            "scores": {"accuracy": score, "clarity": 3},
+            "overall_score": 10 * score,
+            "critical_errors": [],
+        }
+        for index, score in enumerate(scores)
+    ]
+
+
+def test_intervals_match_one_resample_at_a_time():
+    values = np.random.default_rng(1).normal(3, 1, size=(40, 3))
+    values[::4, 1] = np.nan
+
+    low, high = bootstrap_mean_intervals(values, n_resamples=500)
+    expected_low, expected_high = reference_intervals(values, 500)
+    np.testing.assert_allclose(low, expected_low)
+    np.testing.assert_allclose(high, expected_high)
+
+
+def test_blocks_do_not_change_intervals(monkeypatch):
+    values = np.random.default_rng(2).normal(size=(50, 2))
+    expected = bootstrap_mean_intervals(values, n_resamples=300)
+    monkeypatch.setattr(stats_module, "BOOTSTRAP_BLOCK_CELLS", 50 * 7)
+    np.testing.assert_allclose(bootstrap_mean_intervals(values, n_resamples=300), expected)
+
+
+def test_intervals_on_known_dataset():
+    # 200 cases, half scored 2 and half 4: mean 3, standard error 1 / sqrt(200)
+    values = np.repeat([2.0, 4.0], 100)[:, None]
+    low, high = bootstrap_mean_intervals(values, n_resamples=4000)
+    half_width = 1.96 / math.sqrt(200)
+    assert low[0] == pytest.approx(3 - half_width, abs=0.02)
+    assert high[0] == pytest.approx(3 + half_width, abs=0.02)
+
+    low, high = bootstrap_mean_intervals(np.full((10, 1), 4.0))
+    assert (low[0], high[0]) == (4.0, 4.0)
+
+
+def test_nan_columns():
+    values = np.column_stack([np.arange(10.0), np.full(10, np.nan)])
+    low, high = bootstrap_mean_intervals(values, n_resamples=200)
+    assert low[0] < 4.5 < high[0]
+    assert np.isnan(low[1]) and np.isnan(high[1])
+
+
+def test_fewer_than_two_cases():
+    low, high = bootstrap_mean_intervals(np.array([[3.0, 4.0]]))
+    assert np.isnan(low).all() and np.isnan(high).all()
+    low, high = bootstrap_mean_intervals(np.empty((0, 2)))
+    assert np.isnan(low).all() and np.isnan(high).all()
+
+
+def test_paired_deltas():
+    matrix = ScoreMatrix.from_results(make_results([3, 4, 5, 4]))
+    baseline = ScoreMatrix.from_results(make_results([2, 3, 4, 3]))
+    deltas = paired_deltas(matrix, baseline, n_resamples=200)
+    assert deltas["n_paired"] == 4
+    assert deltas["overall"] == {"mean": 10.0, "ci_low": 10.0, "ci_high": 10.0}
+    assert deltas["dimensions"]["clarity"]["mean"] == 0.0
+
+
+@pytest.mark.parametrize("n_baseline", [0, 1])
+def test_paired_deltas_with_fewer_than_two_pairs(n_baseline):
+    matrix = ScoreMatrix.from_results(make_results([3, 4, 5]))
+    baseline = ScoreMatrix.from_results(make_results([2])[:n_baseline])
+    deltas = paired_deltas(matrix, baseline, n_resamples=200)
+    assert deltas["n_paired"] == n_baseline
+    assert math.isnan(deltas["overall"]["ci_low"]) and math.isnan(deltas["overall"]["ci_high"])
+    assert deltas["overall"]["mean"] == (10.0 if n_baseline else pytest.approx(math.nan, nan_ok=True))
+
+
+def test_summary_metrics_drop_undefined_intervals():
+    matrix = ScoreMatrix.from_results(make_results([3, 4, 5]))
+    baseline = ScoreMatrix.from_results(make_results([2]))
+    summary = summarize_matrix(matrix, baseline, n_resamples=200)
+    assert summary["by_party"]["pl"]["n_cases"] == 2
+
+    metrics = summary_metrics(summary)
+    assert metrics["delta_overall_score"] == 10.0
+    assert "delta_overall_score_ci_low" not in metrics
+    assert all(math.isfinite(value) for value in metrics.values())
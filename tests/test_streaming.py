@@ -0,0 +1,96 @@
+"""Tests for streaming the pipeline and closing streams early."""
+
+import asyncio
+
+import dspy
+import pytest
+
+import lexic.agents.pipeline as pipeline_module
+from lexic.agents.pipeline import LexicPipeline
+from lexic.shared.fake_lm import FakeLM
+from lexic.shared.lm import _deadline
+
+
+@pytest.fixture
+def pipeline():
+    with dspy.context(lm=FakeLM(model="anthropic/fake")):
+        yield LexicPipeline()
+
+
+def run_collecting_errors(coroutine):
+    """Run a coroutine and return the errors the event loop reported as unhandled."""
+    errors = []
+
+    async def main():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        return await coroutine
+
+    asyncio.run(main())
+    return errors
+
+
+def test_full_stream_ends_with_results(pipeline):
+    async def consume():
+        return [event async for event in pipeline.astream_full_pipeline("request", "persona", "facts")]
+
+    events = asyncio.run(consume())
+
+    stage, results = events[-1]
+    assert stage == "done"
+    assert results["recommendations"]
+    assert [stage for stage, _ in events[:-1]][0] == "qualification"
+
+
+def test_closing_stream_early_releases_contexts(pipeline, monkeypatch):
+    monkeypatch.setattr(pipeline_module.get_stage_resilience(), "default_timeout", 30.0)
+    seen = []
+
+    async def consume_part():
+        stream = pipeline.astream_full_pipeline("request", "persona", "facts")
+        async for stage, _ in stream:
+            seen.append(stage)
+            if stage == "initial_analysis":
+                break
+        await stream.aclose()
+        assert _deadline.get() is None
+
+    errors = run_collecting_errors(consume_part())
+
+    assert errors == []
+    assert seen == ["qualification", "initial_analysis"]
+
+
+def test_closing_stream_mid_step_cancels_the_step(pipeline, monkeypatch):
+    state = {"chunks": 0, "cancelled": False}
+
+    class EndlessStream:
+        """Stand-in for AgentStream that streams until cancelled."""
+
+        def __init__(self, agent, **inputs):
+            self.output = None
+
+        async def __aiter__(self):
+            try:
+                while True:
+                    await asyncio.sleep(0)
+                    state["chunks"] += 1
+                    yield "chunk "
+            except asyncio.CancelledError:
+                state["cancelled"] = True
+                raise
+
+    monkeypatch.setattr(pipeline_module, "AgentStream", EndlessStream)
+
+    async def consume_part():
+        stream = pipeline.astream_full_pipeline("request", "persona", "facts")
+        received = 0
+        async for _ in stream:
+            received += 1
+            if received == 3:
+                break
+        await stream.aclose()
+
+    errors = run_collecting_errors(consume_part())
+
+    assert errors == []
+    assert state["cancelled"]
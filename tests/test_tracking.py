@@ -0,0 +1,31 @@
+"""Tests for batched MLflow logging."""
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.utils.validation import _validate_batch_log_limits
+
+from lexic.evals.tracking import log_batch
+
+
+class RecordingClient:
+    """MlflowClient stand-in that validates and keeps each log_batch request."""
+
+    def __init__(self):
+        self.batches = []
+
+    def log_batch(self, run_id, metrics, params, tags):
+        _validate_batch_log_limits(metrics, params, tags)
+        self.batches.append((metrics, params, tags))
+
+
+def test_batches_stay_within_the_combined_limit():
+    metrics = [Metric(f"m{index}", 1.0, 0, 0) for index in range(1000)]
+    params = [Param(f"p{index}", "v") for index in range(150)]
+    tags = [RunTag(f"t{index}", "v") for index in range(30)]
+
+    client = RecordingClient()
+    log_batch(client, "run", metrics=metrics, params=params, tags=tags)
+
+    assert [len(batch[0]) + len(batch[1]) + len(batch[2]) for batch in client.batches] == [1000, 180]
+    assert [metric for batch in client.batches for metric in batch[0]] == metrics
+    assert [param for batch in client.batches for param in batch[1]] == params
+    assert [tag for batch in client.batches for tag in batch[2]] == tags
@@ -0,0 +1,80 @@
+"""Tests for judge call triage."""
+
+import pytest
+
+from lexic.evals.triage import TriagePolicy, compute_features, extract_articles, triage_case
+
+
+POLICY = TriagePolicy(min_words=5, min_length_ratio=0.3, shortcut_overlap=0.6, shortcut_article_recall=0.8)
+
+GROUND_TRUTH = (
+    "Le licenciement est abusif au sens de l'art. 336c CO car il a été notifié pendant "
+    "la période de protection liée à l'incapacité de travail de l'employé."
+)
+LEGAL_BASIS = "Art. 336c al. 1 let. b CO ; art. 336 CO."
+
+
+@pytest.mark.parametrize("text, articles", [
+    ("art. 336c CO", {"336c CO"}),
+    ("Art. 271a al. 1 let. b CO", {"271a CO"}),
+    ("articles 335c et 336 CO", {"335c CO", "336 CO"}),
+    ("art. 6 LTr", {"6 LTr"}),
+    ("selon l'art. 8 CC et l'art. 29 Cst.", {"8 CC", "29 Cst"}),
+    ("Article 8 du Code civil", set()),
+])
+def test_extract_articles(text, articles):
+    assert extract_articles(text) == articles
+
+
+@pytest.mark.parametrize("text", [
+    "art. 336 al. 1 et 2 CO",
+    "art. 336 al. 1, 2 CO",
+    "Art. 336 ch. 2 et 3 CO",
+])
+def test_subdivision_numbers_are_not_articles(text):
+    assert extract_articles(text) == {"336 CO"}
+
+
+def test_skip_short_output():
+    triage = triage_case("Licenciement abusif.", GROUND_TRUTH, LEGAL_BASIS, POLICY)
+    assert triage["decision"] == "skip"
+    assert "too short" in triage["reason"]
+
+
+def test_skip_output_far_shorter_than_ground_truth():
+    policy = TriagePolicy(min_words=1, min_length_ratio=0.5)
+    triage = triage_case("Le licenciement est abusif selon l'art. 336c CO.", GROUND_TRUTH, LEGAL_BASIS, policy)
+    assert triage["decision"] == "skip"
+    assert "ground truth length" in triage["reason"]
+
+
+def test_shortcut_close_match():
+    triage = triage_case(GROUND_TRUTH + " Voir aussi l'art. 336 CO.", GROUND_TRUTH, LEGAL_BASIS, POLICY)
+    assert triage["decision"] == "shortcut"
+    assert triage["features"]["article_recall"] == 1.0
+
+
+def test_full_when_truncated():
+    triage = triage_case(GROUND_TRUTH[:-1] + " et de", GROUND_TRUTH, LEGAL_BASIS, POLICY)
+    assert triage["decision"] == "full"
+    assert triage["reason"] == "output looks truncated"
+
+
+def test_full_when_lexically_distant():
+    prediction = "Le contrat de bail doit être résilié avec un préavis de trois mois pour la fin d'un trimestre."
+    triage = triage_case(prediction, GROUND_TRUTH, LEGAL_BASIS, POLICY)
+    assert triage["decision"] == "full"
+    assert "lexical overlap" in triage["reason"]
+
+
+def test_full_when_cited_articles_are_missing():
+    prediction = GROUND_TRUTH.replace("336c", "337")
+    triage = triage_case(prediction, GROUND_TRUTH, LEGAL_BASIS, POLICY)
+    assert triage["decision"] == "full"
+    assert triage["reason"].startswith("article recall")
+
+
+def test_article_features_need_a_cited_legal_basis():
+    features = compute_features(GROUND_TRUTH, GROUND_TRUTH, legal_basis="Pas d'article cité.")
+    assert features["article_recall"] is None
+    assert features["article_precision"] is None